@@ -113,6 +113,8 @@ class APITestKeywords:
     @keyword
     def suite_teardown(self):
         self.clear_save_fields()
+        self.db_validator.log_pool_statistics()
+        self.db_validator.log_consistency_statistics()
 
     def clear_save_fields(self):
         if self.test_config.get('clear_saved_fields_after_test', False):
@@ -4,6 +4,8 @@ import pandas as pd
 import yaml
 from typing import List, Dict
 
+from libraries.db.db import SQLAlchemyDatabase
+
 
 class APITestLoader:
     _instances = {}
@@ -208,6 +210,7 @@ class APITestLoader:
 
             if row['Type'].lower() == 'oracle':
                 config.update({'service_name': row['ServiceName']})
+            config.update(SQLAlchemyDatabase.connection_options(row))
 
             configs[row['DatabaseName']] = config
 
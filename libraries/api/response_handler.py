@@ -102,8 +102,14 @@ class ResponseValidator(ResponseHandler):
     def _process_expected_results(self, test_case, response, pre_check_responses, post_check_responses):
         """Processes expected results from the test case."""
         exp_results = test_case['Exp Result'].splitlines()
+        # Database checks are validated together so they can share queries
+        db_checks = [exp_result.strip() for exp_result in exp_results if exp_result.strip().startswith('db_')]
+        db_results = iter(self._handle_db_checks(db_checks) if db_checks else [])
         current_test_results = []
         for exp_result in exp_results:
+            if exp_result.strip().startswith('db_'):
+                current_test_results.append(next(db_results))
+                continue
             current_test_results.extend(
                 self._process_single_expected_result(exp_result, response, pre_check_responses, post_check_responses))
         return current_test_results
@@ -120,9 +126,6 @@ class ResponseValidator(ResponseHandler):
         elif exp_result.strip().startswith('$'):
             result = self._handle_response_checks(exp_result.strip(), response)
             results.append(result)
-        elif exp_result.strip().startswith('db_'):  # Use 'db_' as prefix
-            result = self._handle_db_checks(exp_result.strip())
-            results.append(result)
         return results
 
     def _handle_dynamic_checks(self, checks, pre_check_responses, post_check_responses) -> List[Dict]:
@@ -176,17 +179,13 @@ class ResponseValidator(ResponseHandler):
         self._log_result(success, log_msg)
         return result
 
-    def _handle_db_checks(self, exp_result):
-        """Handles database validation checks."""
-        try:
-            if exp_result.startswith('db_'):
-                db_name = exp_result.split('.')[0]
-                is_valid, msg = self.db_validator.validate_database_value(db_name, exp_result)
-        except Exception as e:
-            logging.error(f"{self.__class__.__name__}: Failed to validate database: {str(e)}")
-        result = {"Result": "Pass" if is_valid else "Fail"}
-        self._log_result(is_valid, msg)
-        return result
+    def _handle_db_checks(self, db_checks: List[str]) -> List[Dict]:
+        """Handles database validation checks (e.g., db_name.Table.Field[Filter=Value]=Expected)."""
+        results = []
+        for is_valid, msg in self.db_validator.validate_database_values(db_checks):
+            results.append({"Result": "Pass" if is_valid else "Fail"})
+            self._log_result(is_valid, msg)
+        return results
 
     def _log_result(self, success: bool, message: str):
         """Logs the result of a check with appropriate color."""
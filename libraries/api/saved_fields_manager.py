@@ -13,7 +13,10 @@ builtin_lib = BuiltIn()
 class SavedFieldsManager:
     def __init__(self, file_path: str = None) -> None:
         self.project_root: str = PROJECT_ROOT
-        self.file_path: str = file_path or os.path.join(self.project_root, 'configs', 'saved_fields.yaml')
+        # Parallel workers keep their own saved fields so they don't overwrite each other
+        worker_id = os.environ.get('TEST_WORKER_ID')
+        default_file_name = f'saved_fields_{worker_id}.yaml' if worker_id else 'saved_fields.yaml'
+        self.file_path: str = file_path or os.path.join(self.project_root, 'configs', default_file_name)
         self.variable_transformer = VariableTransformer()
 
     def clear_saved_fields(self):
@@ -1,8 +1,18 @@
-from typing import List, Dict, Optional, Any
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import deque
+from itertools import chain, islice
+from typing import List, Dict, Iterable, Optional, Any
 from abc import ABC, abstractmethod
-from sqlalchemy import create_engine, Table, MetaData, select, update, insert, delete, text
+import pandas as pd
+from sqlalchemy import create_engine, event, exc, Table, MetaData, select, update, insert, delete, text
 from sqlalchemy.orm import sessionmaker
 from contextlib import contextmanager, closing
+from libraries.common.utility_helpers import PROJECT_ROOT
 
 
 class DatabaseError(Exception):
@@ -10,6 +20,63 @@ class DatabaseError(Exception):
     pass
 
 
+# Optional DBConfigs columns and the connect() options they set
+CONNECTION_COLUMNS = {
+    'MinConnections': ('min_connections', int),
+    'MaxConnections': ('max_connections', int),
+    'PoolPrePing': ('pool_pre_ping', bool),
+    'PoolRecycleSeconds': ('pool_recycle', int),
+    'PoolTimeoutSeconds': ('pool_timeout', float),
+    'StatementTimeoutSeconds': ('statement_timeout', float),
+    'ReflectionCacheTTLSeconds': ('reflection_cache_ttl', float),
+}
+
+
+class PoolMetrics:
+    """Checkout latency and saturation of a connection pool, kept over the lifetime of the engine."""
+
+    def __init__(self, capacity: int, max_samples: int = 1000):
+        self.capacity = capacity
+        self.checkouts = 0
+        self.timeouts = 0
+        self.saturated_checkouts = 0
+        self.peak_in_use = 0
+        self.max_checkout_ms = 0.0
+        self.total_checkout_ms = 0.0
+        self.recent_checkout_ms = deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+
+    def record_checkout(self, elapsed_ms: float, in_use: int):
+        with self._lock:
+            self.checkouts += 1
+            self.total_checkout_ms += elapsed_ms
+            self.max_checkout_ms = max(self.max_checkout_ms, elapsed_ms)
+            self.recent_checkout_ms.append(elapsed_ms)
+            self.peak_in_use = max(self.peak_in_use, in_use)
+            if in_use >= self.capacity:
+                self.saturated_checkouts += 1
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self, in_use: int) -> Dict[str, Any]:
+        with self._lock:
+            recent = sorted(self.recent_checkout_ms)
+            return {
+                'checkouts': self.checkouts,
+                'timeouts': self.timeouts,
+                'avg_checkout_ms': round(self.total_checkout_ms / self.checkouts, 2) if self.checkouts else 0.0,
+                'p95_checkout_ms': round(recent[int(0.95 * (len(recent) - 1))], 2) if recent else 0.0,
+                'max_checkout_ms': round(self.max_checkout_ms, 2),
+                'in_use': in_use,
+                'peak_in_use': self.peak_in_use,
+                'capacity': self.capacity,
+                'saturation': round(self.peak_in_use / self.capacity, 2) if self.capacity else 0.0,
+                'saturated_checkouts': self.saturated_checkouts,
+            }
+
+
 class Database(ABC):
     @abstractmethod
     def connect(self, **kwargs) -> None:
@@ -50,17 +117,30 @@ class Database(ABC):
 
 
 class SQLAlchemyDatabase(Database):
+    # SQLAlchemy's QueuePool defaults, used when a DBConfigs row leaves the pool columns empty
+    DEFAULT_POOL_SIZE = 5
+    DEFAULT_MAX_OVERFLOW = 10
+    REFLECTION_CACHE_DIR = os.path.join(PROJECT_ROOT, 'cache', 'db_reflection')
+    DEFAULT_REFLECTION_CACHE_TTL = 24 * 60 * 60
+
     def __init__(self):
         self.engine = None
         self.Session = None
         self.metadata = MetaData()
         self.default_schema = None
         self.db_type = None
+        self.pool_metrics = None
+        self.reflection_cache_ttl = self.DEFAULT_REFLECTION_CACHE_TTL
+        self._reflection_lock = threading.Lock()
+        self._isolation_connection = None
+        self._isolation_transactions = []
+        self._isolation_lock = threading.RLock()
 
     @classmethod
     def create_databases(cls, db_configs: Dict[str, Dict[str, Any]]) -> Dict[str, 'SQLAlchemyDatabase']:
         databases = {}
         for db_name, config in db_configs.items():
+            config = dict(config)
             db_type = config.pop('type').lower()
             schema = config.pop('schema', None)
             db = cls()
@@ -68,17 +148,142 @@ class SQLAlchemyDatabase(Database):
             databases[db_name] = db
         return databases
 
-    def connect(self, user: str, password: str, host: str, port: int, database: str, db_type: str = 'postgresql',
-                schema: Optional[str] = None):
+    def connect(self, user: str, password: str, host: str, port: int, database: Optional[str] = None,
+                db_type: str = 'postgresql', schema: Optional[str] = None, service_name: Optional[str] = None,
+                min_connections: Optional[int] = None, max_connections: Optional[int] = None,
+                pool_pre_ping: bool = True, pool_recycle: Optional[int] = None, pool_timeout: Optional[float] = None,
+                statement_timeout: Optional[float] = None, reflection_cache_ttl: Optional[float] = None):
+        """
+        Create the engine and its connection pool and open min_connections connections up front.
+
+        The pool keeps min_connections connections and opens up to max_connections in total under load.
+        pool_recycle and pool_timeout are in seconds, statement_timeout in seconds per statement.
+        Tables are reflected when first used and cached on disk for reflection_cache_ttl seconds (0 disables the cache).
+        """
         try:
+            # Oracle rows name the service instead of a database
+            database = service_name or database if db_type == 'oracle' else database
             url = self._build_db_url(user, password, host, port, database, db_type)
-            self.default_schema = schema or self._default_schema(db_type, database)
-            self.engine = create_engine(url)
+            self.db_type = db_type
+            self.default_schema = schema or self._default_schema(db_type, database, user)
+
+            pool_size = min_connections or self.DEFAULT_POOL_SIZE
+            max_overflow = max(max_connections - pool_size, 0) if max_connections else self.DEFAULT_MAX_OVERFLOW
+            engine_options = {'pool_size': pool_size, 'max_overflow': max_overflow, 'pool_pre_ping': pool_pre_ping}
+            if pool_recycle:
+                engine_options['pool_recycle'] = pool_recycle
+            if pool_timeout:
+                engine_options['pool_timeout'] = pool_timeout
+            self.engine = create_engine(url, **engine_options)
+            if statement_timeout:
+                self._set_statement_timeout(int(statement_timeout * 1000))
+            self.pool_metrics = PoolMetrics(pool_size + max_overflow)
             self.Session = sessionmaker(bind=self.engine)
-            self.metadata.reflect(bind=self.engine, schema=self.default_schema if db_type != 'mysql' else None)
+
+            if reflection_cache_ttl is not None:
+                self.reflection_cache_ttl = reflection_cache_ttl
+
+            self._warm_up(min_connections or 0)
         except Exception as e:
             raise DatabaseError(f"Failed to create connection to {db_type}: {str(e)}")
 
+    @staticmethod
+    def connection_options(row) -> Dict[str, Any]:
+        """Pool and reflection cache options of a DBConfigs row; these columns are optional and may be left empty."""
+        options = {}
+        for column, (option, cast) in CONNECTION_COLUMNS.items():
+            value = row.get(column)
+            if value is None or pd.isna(value) or str(value).strip() == '':
+                continue
+            options[option] = str(value).strip().upper() in ('Y', 'YES', 'TRUE', '1') if cast is bool else cast(value)
+        return options
+
+    def _set_statement_timeout(self, timeout_ms: int):
+        db_type = self.db_type
+
+        @event.listens_for(self.engine, 'connect')
+        def set_timeout(dbapi_connection, connection_record):
+            if db_type == 'oracle':
+                dbapi_connection.call_timeout = timeout_ms
+                return
+            cursor = dbapi_connection.cursor()
+            try:
+                if db_type == 'postgresql':
+                    cursor.execute(f"SET statement_timeout = {timeout_ms}")
+                elif db_type == 'mysql':
+                    cursor.execute(f"SET SESSION max_execution_time = {timeout_ms}")
+            finally:
+                cursor.close()
+
+    def _warm_up(self, connections: int):
+        # Open the connections together so the pool really holds that many, then return them all
+        opened = []
+        try:
+            for _ in range(connections):
+                opened.append(self.engine.connect())
+        finally:
+            for connection in opened:
+                connection.close()
+        if connections:
+            logging.info(f"{self.__class__.__name__}: Opened {connections} {self.db_type} connection(s) to {self.engine.url.host}")
+
+    def _connect(self):
+        start = time.perf_counter()
+        try:
+            connection = self.engine.connect()
+        except exc.TimeoutError:
+            self.pool_metrics.record_timeout()
+            raise
+        self.pool_metrics.record_checkout((time.perf_counter() - start) * 1000, self.engine.pool.checkedout())
+        return connection
+
+    def begin_isolation(self):
+        """
+        Route every following operation through one connection inside a transaction that
+        rollback_isolation() undoes. Nested calls open a savepoint within the outer transaction.
+        """
+        with self._isolation_lock:
+            if self._isolation_connection is None:
+                self._isolation_connection = self._connect()
+                self._isolation_transactions.append(self._isolation_connection.begin())
+            else:
+                self._isolation_transactions.append(self._isolation_connection.begin_nested())
+            logging.info(f"{self.__class__.__name__}: Began isolation level {len(self._isolation_transactions)} on {self.engine.url.host}")
+
+    def rollback_isolation(self):
+        """Roll back the innermost isolation level; the connection is returned once none are left."""
+        with self._isolation_lock:
+            if not self._isolation_transactions:
+                return
+            self._isolation_transactions.pop().rollback()
+            logging.info(f"{self.__class__.__name__}: Rolled back isolation level {len(self._isolation_transactions) + 1} on {self.engine.url.host}")
+            if not self._isolation_transactions:
+                self._isolation_connection.close()
+                self._isolation_connection = None
+
+    @contextmanager
+    def _connection(self, write: bool = False):
+        """A connection for one operation; writes are committed unless an isolation is active."""
+        with self._isolation_lock:
+            isolation_connection = self._isolation_connection
+            if isolation_connection is not None:
+                # Reads too get a savepoint: on PostgreSQL any failed statement aborts the whole isolated transaction
+                with isolation_connection.begin_nested():
+                    yield isolation_connection
+                return
+        with closing(self._connect()) as connection:
+            if write:
+                with connection.begin():
+                    yield connection
+            else:
+                yield connection
+
+    def pool_statistics(self) -> Dict[str, Any]:
+        """Checkout latency and saturation of the connection pool."""
+        if not self.engine:
+            return {}
+        return self.pool_metrics.snapshot(self.engine.pool.checkedout())
+
     def disconnect(self):
         if self.engine:
             self.engine.dispose()
@@ -93,29 +298,71 @@ class SQLAlchemyDatabase(Database):
         else:
             raise ValueError(f"Unsupported database type: {db_type}")
 
-    def _default_schema(self, db_type: str, database: str) -> str:
+    def _default_schema(self, db_type: str, database: str, user: str) -> str:
         if db_type == 'oracle':
-            return database.upper()
+            return user.upper()
         elif db_type == 'mysql':
             return database
         return 'public'
 
-    def _get_table(self, table_name: str, schema: Optional[str] = None) -> Table:
+    def _get_table(self, table_name: str, schema: Optional[str] = None, refresh: bool = False) -> Table:
         effective_schema = schema or self.default_schema
         if self.db_type == 'mysql' and effective_schema != self.default_schema:
             raise DatabaseError("MySQL does not support switching schemas after connection.")
-        table_obj = self.metadata.tables.get(table_name) or Table(table_name, self.metadata, schema=effective_schema, autoload_with=self.engine)
+        key = f"{effective_schema}.{table_name}" if effective_schema else table_name
+
+        # Only the tables a test touches are reflected, each at most once per connection
+        with self._reflection_lock:
+            table_obj = self.metadata.tables.get(key)
+            if table_obj is not None and not refresh:
+                return table_obj
+            if table_obj is not None:
+                self.metadata.remove(table_obj)
+            table_obj = self._reflect_table(table_name, effective_schema, use_cache=not refresh)
         if table_obj is None:
             raise DatabaseError(f"Table '{table_name}' not found in schema '{effective_schema}'.")
         return table_obj
 
+    def _reflect_table(self, table_name: str, schema: Optional[str], use_cache: bool = True) -> Optional[Table]:
+        cache_path = self._reflection_cache_path(table_name, schema)
+        if use_cache and self.reflection_cache_ttl and os.path.exists(cache_path) \
+                and time.time() - os.path.getmtime(cache_path) < self.reflection_cache_ttl:
+            try:
+                with open(cache_path, 'rb') as f:
+                    return pickle.load(f).to_metadata(self.metadata)
+            except Exception as e:
+                logging.warning(f"{self.__class__.__name__}: Ignoring unreadable reflection cache {cache_path}: {e}")
+
+        try:
+            # Reflected on its own, without the tables its foreign keys point to
+            table_obj = Table(table_name, MetaData(), schema=schema, autoload_with=self.engine, resolve_fks=False)
+        except exc.NoSuchTableError:
+            return None
+        if self.reflection_cache_ttl:
+            os.makedirs(self.REFLECTION_CACHE_DIR, exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                pickle.dump(table_obj, f)
+        return table_obj.to_metadata(self.metadata)
+
+    def _reflection_cache_path(self, table_name: str, schema: Optional[str]) -> str:
+        connection_key = f"{self.engine.url.render_as_string(hide_password=True)}|{schema}|{table_name}"
+        digest = hashlib.sha1(connection_key.encode('utf-8')).hexdigest()
+        return os.path.join(self.REFLECTION_CACHE_DIR, f"{digest}.pkl")
+
+    def _get_table_with_columns(self, table_name: str, column_names: Iterable[str]) -> Table:
+        table_obj = self._get_table(table_name, self.default_schema)
+        if not all(column_name in table_obj.c for column_name in column_names):
+            # The cached definition may predate a newly added column
+            table_obj = self._get_table(table_name, self.default_schema, refresh=True)
+        return table_obj
+
     def execute_query(self, table: str, fields: Optional[List[str]] = None, where: Optional[str] = None, order_by: Optional[str] = None) -> List[Dict]:
-        table_obj = self._get_table(table, self.default_schema)
+        table_obj = self._get_table_with_columns(table, fields or [])
         columns = self._construct_columns(fields, table_obj)
         stmt = select(*columns).where(text(where)) if where else select(*columns)
         if order_by:
             stmt = stmt.order_by(*self._construct_order_by(order_by, table_obj))
-        with closing(self.engine.connect()) as connection:
+        with self._connection() as connection:
             return [row._mapping for row in connection.execute(stmt)]
 
     def _construct_columns(self, fields: Optional[List[str]], table_obj: Table) -> List:
@@ -138,33 +385,64 @@ class SQLAlchemyDatabase(Database):
         return order_clauses
 
     def insert(self, table: str, data: List[Dict]) -> int:
-        table_obj = self._get_table(table, self.default_schema)
-        with closing(self.engine.connect()) as connection, connection.begin() as transaction:
+        table_obj = self._get_table_with_columns(table, {column for row in data for column in row})
+        try:
+            with self._connection(write=True) as connection:
+                return connection.execute(insert(table_obj).values(data)).rowcount
+        except Exception as e:
+            raise DatabaseError(f"Insert operation failed: {str(e)}")
+
+    def bulk_insert(self, table: str, rows: Iterable[Dict], batch_size: int = 1000, atomic: bool = False) -> int:
+        """
+        Insert rows with executemany in batches of batch_size, each batch committed on its own, or all
+        of them in one transaction with atomic=True (kept in the isolated transaction while an isolation
+        is active).
+
+        rows may be a generator, so large data sets are never held in memory at once.
+        """
+        rows = iter(rows)
+        batches = iter(lambda: list(islice(rows, batch_size)), [])
+        first_batch = next(batches, [])
+        table_obj = self._get_table_with_columns(table, {column for row in first_batch for column in row})
+        stmt = insert(table_obj)
+        batches = chain([first_batch], batches) if first_batch else batches
+        inserted = 0
+        start = time.perf_counter()
+        if atomic:
             try:
-                result = connection.execute(insert(table_obj).values(data))
-                return result.rowcount
+                with self._connection(write=True) as connection:
+                    for batch in batches:
+                        connection.execute(stmt, batch)
+                        inserted += len(batch)
             except Exception as e:
-                transaction.rollback()
-                raise DatabaseError(f"Insert operation failed: {str(e)}")
+                raise DatabaseError(f"Bulk insert failed and was rolled back after {inserted} row(s): {str(e)}")
+        else:
+            for batch in batches:
+                try:
+                    with self._connection(write=True) as connection:
+                        connection.execute(stmt, batch)
+                except Exception as e:
+                    raise DatabaseError(f"Bulk insert failed after {inserted} row(s): {str(e)}")
+                inserted += len(batch)
+        elapsed = time.perf_counter() - start
+        logging.info(f"{self.__class__.__name__}: Inserted {inserted} row(s) into '{table}' in {elapsed:.2f}s "
+                     f"({inserted / elapsed if elapsed else 0:.0f} rows/s, batches of {batch_size})")
+        return inserted
 
     def update(self, table: str, values: Dict, where: Optional[str] = None) -> bool:
-        table_obj = self._get_table(table, self.default_schema)
+        table_obj = self._get_table_with_columns(table, values)
         stmt = update(table_obj).values(values).where(text(where)) if where else update(table_obj).values(values)
-        with closing(self.engine.connect()) as connection, connection.begin() as transaction:
-            try:
-                result = connection.execute(stmt)
-                return result.rowcount > 0
-            except Exception as e:
-                transaction.rollback()
-                raise DatabaseError(f"Update operation failed: {str(e)}")
+        try:
+            with self._connection(write=True) as connection:
+                return connection.execute(stmt).rowcount > 0
+        except Exception as e:
+            raise DatabaseError(f"Update operation failed: {str(e)}")
 
     def delete(self, table: str, where: Optional[str] = None) -> int:
         table_obj = self._get_table(table, self.default_schema)
         stmt = delete(table_obj).where(text(where)) if where else delete(table_obj)
-        with closing(self.engine.connect()) as connection, connection.begin() as transaction:
-            try:
-                result = connection.execute(stmt)
-                return result.rowcount
-            except Exception as e:
-                transaction.rollback()
-                raise DatabaseError(f"Delete operation failed: {str(e)}")
\ No newline at end of file
+        try:
+            with self._connection(write=True) as connection:
+                return connection.execute(stmt).rowcount
+        except Exception as e:
+            raise DatabaseError(f"Delete operation failed: {str(e)}")
\ No newline at end of file
@@ -1,9 +1,17 @@
+import copy
+import csv
+import json
 import logging
 import re
-from typing import Tuple, Any, Dict, Optional
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, Any, Dict, Iterator, List, Optional
 from libraries.db.db import SQLAlchemyDatabase
 from libraries.common.variable_generator import VariableGenerator
 from robot.libraries.BuiltIn import BuiltIn
+from robot.utils import timestr_to_secs
 
 
 class DBOperationError(Exception):
@@ -20,24 +28,37 @@ class SingletonMeta(type):
             cls._instances[cls] = instance
         return cls._instances[cls]
 
+    def reset(cls):
+        """Drop the instance, so the next call creates a new one."""
+        cls._instances.pop(cls, None)
+
 
 class DBOperator(metaclass=SingletonMeta):
+    # Backoff between the queries of a [WaitUntil=...] assertion, in seconds
+    POLL_INITIAL_DELAY = 0.1
+    POLL_MAX_DELAY = 5.0
+    MAX_CONCURRENT_QUERIES = 8
+
     def __init__(self, db_configs=None):
         self.db_connections: Dict[str, SQLAlchemyDatabase] = {}
         self.env_db_configs = db_configs
         self._initialized = False
+        self._initialize_lock = threading.Lock()
+        self.consistency_times: List[Dict[str, Any]] = []
 
     def _initialize_databases(self):
-        if self._initialized:
-            logging.info("Databases already initialized, skipping.")
-            return
-        try:
-            self.db_connections = SQLAlchemyDatabase.create_databases(self.env_db_configs)
-            logging.info(f"Database connections initialized.")
-            self._initialized = True
-        except Exception as e:
-            logging.error(f"Unexpected error initializing databases: {str(e)}")
-            raise
+        # Validation queries run on several threads, which must not each create the engines
+        with self._initialize_lock:
+            if self._initialized:
+                logging.info("Databases already initialized, skipping.")
+                return
+            try:
+                self.db_connections = SQLAlchemyDatabase.create_databases(self.env_db_configs)
+                logging.info(f"Database connections initialized.")
+                self._initialized = True
+            except Exception as e:
+                logging.error(f"Unexpected error initializing databases: {str(e)}")
+                raise
 
     def get_db_connection(self, db_name: str) -> SQLAlchemyDatabase:
         if not self._initialized:
@@ -48,48 +69,216 @@ class DBOperator(metaclass=SingletonMeta):
         except KeyError:
             raise DBOperationError(f"Database connection '{db_name}' not found")
 
+    def begin_isolation(self):
+        """Start an isolated transaction (or a savepoint within one) on every configured database."""
+        if not self._initialized:
+            self._initialize_databases()
+        for db_name, db in self.db_connections.items():
+            db.begin_isolation()
+        logging.info(f"{self.__class__.__name__}: Database changes are isolated until rollback: {', '.join(self.db_connections)}")
+
+    def rollback_isolation(self):
+        """Undo every change made on the configured databases since the matching begin_isolation."""
+        errors = []
+        for db_name, db in self.db_connections.items():
+            try:
+                db.rollback_isolation()
+            except Exception as e:
+                errors.append(f"{db_name}: {str(e)}")
+        if errors:
+            raise DBOperationError(f"Failed to roll back isolated changes: {'; '.join(errors)}")
+
+    def get_pool_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Checkout latency and saturation of each database's connection pool."""
+        return {db_name: db.pool_statistics() for db_name, db in self.db_connections.items()}
+
+    def log_pool_statistics(self):
+        for db_name, stats in self.get_pool_statistics().items():
+            logging.info(f"{self.__class__.__name__}: Connection pool of '{db_name}': {stats}")
+            if stats.get('saturated_checkouts') or stats.get('timeouts'):
+                logging.warning(f"{self.__class__.__name__}: Connection pool of '{db_name}' was saturated "
+                                f"{stats['saturated_checkouts']} time(s) with {stats['timeouts']} timeout(s); "
+                                f"consider raising MaxConnections")
+
     def validate_database_value(self, db_name: str, db_clause: str) -> Tuple[bool, str]:
-        try:
-            db = self.get_db_connection(db_name)
-            # db_{db_name}.TableName.FieldName[FilterField1=FilterValue1;FilterField2=FilterValue2][OrderBy=CreateTime]=ExpectedValue
-            pattern = r'^db_\w+\.(?P<Table>\w+)\.(?P<Field>\w+)\s*\[(?P<Filters>[^\]]+)\](?:\s*\[(?P<OrderBy>[^\]]+)\])?\s*=\s*(?P<ExpectedValue>.+)$'
-            match = re.match(pattern, db_clause)
-            if not match:
-                raise ValueError(f"Invalid format for validate_database_value: {db_clause}")
+        return self.validate_database_values([db_clause], db_name)[0]
 
-            table_name = match.group('Table')
-            field_name = match.group('Field')
-            filters = match.group('Filters')
-            order_by = match.group('OrderBy')
-            expected_value = match.group('ExpectedValue').strip()
+    def validate_database_values(self, db_clauses: List[str], db_name: Optional[str] = None) -> List[Tuple[bool, str]]:
+        """
+        Validate several database assertions at once and return their results in the same order.
 
-            where_clause = " AND ".join(f"{f.split('=')[0].strip()} = '{f.split('=')[1].strip()}'" for f in filters.split(';') if '=' in f)
-            order_by_clause = f"{order_by.replace('OrderBy=', '').strip()}" if order_by else ""
+        Assertions on the same table with the same filters, order and wait share one SELECT of all
+        their fields, and the resulting queries run concurrently. Assertions with
+        [WaitUntil=30s] are re-queried with exponential backoff until they pass or the time is up.
+        """
+        started = time.perf_counter()
+        results: List[Optional[Tuple[bool, str]]] = [None] * len(db_clauses)
+        queries: Dict[str, Dict[Tuple, List[Tuple[int, Dict]]]] = {}
+        for index, db_clause in enumerate(db_clauses):
+            try:
+                check = self._parse_db_clause(db_clause)
+            except Exception as e:
+                logging.error(f"{self.__class__.__name__}: Database validation failed: {str(e)}")
+                results[index] = (False, f"Database validation failed: {str(e)}")
+                continue
+            query_key = (check['table'], check['where'], check['order_by'], check['wait_until'])
+            queries.setdefault(db_name or check['db_name'], {}).setdefault(query_key, []).append((index, check))
 
-            logging.info(f"{self.__class__.__name__}: Generated SQL query: SELECT {field_name} FROM {table_name} WHERE {where_clause} ORDER BY {order_by_clause}")
+        # One task per query, so polled queries wait side by side rather than one after another
+        tasks = [(name, {query_key: checks}) for name, db_queries in queries.items() for query_key, checks in db_queries.items()]
+        if len(tasks) > 1:
+            # Create the connections before the threads start, rather than racing to do it in each of them
+            if not self._initialized:
+                try:
+                    self._initialize_databases()
+                except Exception:
+                    # Already logged; each query then reports the failure as its result
+                    pass
+            with ThreadPoolExecutor(max_workers=min(len(tasks), self.MAX_CONCURRENT_QUERIES), thread_name_prefix='db-validation') as executor:
+                batches = list(executor.map(lambda task: self._run_validation_queries(*task, started), tasks))
+        else:
+            batches = [self._run_validation_queries(*task, started) for task in tasks]
+        for batch in batches:
+            for index, result in batch:
+                results[index] = result
+        return results
 
-            result = db.execute_query(table_name, fields=[field_name], where=where_clause, order_by=order_by_clause)
-            if not result:
-                raise AssertionError(f"No data found for field '{field_name}' in table '{db_name}.{table_name}' with filters '{where_clause}' and order '{order_by_clause}'.")
+    def _parse_db_clause(self, db_clause: str) -> Dict[str, Any]:
+        # db_{db_name}.TableName.FieldName[FilterField1=FilterValue1;FilterField2=FilterValue2][OrderBy=CreateTime][WaitUntil=30s]=ExpectedValue
+        pattern = r'^(?P<Database>db_\w+)\.(?P<Table>\w+)\.(?P<Field>\w+)\s*\[(?P<Filters>[^\]]+)\](?P<Options>(?:\s*\[[^\]]+\])*)\s*=\s*(?P<ExpectedValue>.+)$'
+        match = re.match(pattern, db_clause)
+        if not match:
+            raise ValueError(f"Invalid format for validate_database_value: {db_clause}")
 
-            actual_value = result[0][field_name]
-            msg = f"Database validation for '{field_name}' in table '{db_name}.{table_name}'. Expected: '{expected_value}', Actual: '{actual_value}'."
-            return actual_value == expected_value, msg
+        filters = match.group('Filters')
+        order_by = ""
+        wait_until = 0.0
+        for option in re.findall(r'\[([^\]]+)\]', match.group('Options')):
+            option = option.strip()
+            if option.startswith('WaitUntil='):
+                wait_until = timestr_to_secs(option[len('WaitUntil='):])
+            elif option.startswith('OrderBy='):
+                order_by = option[len('OrderBy='):].strip()
+            else:
+                raise ValueError(f"Unknown option [{option}] in {db_clause}, expected [OrderBy=...] or [WaitUntil=...]")
+        return {
+            'db_name': match.group('Database'),
+            'table': match.group('Table'),
+            'field': match.group('Field'),
+            'where': " AND ".join(f"{f.split('=')[0].strip()} = '{f.split('=')[1].strip()}'" for f in filters.split(';') if '=' in f),
+            'order_by': order_by,
+            'wait_until': wait_until,
+            'expected': match.group('ExpectedValue').strip(),
+        }
 
-        except Exception as e:
-            logging.error(f"{self.__class__.__name__}: Database validation failed: {str(e)}")
-            return False, f"Database validation failed: {str(e)}"
+    def _run_validation_queries(self, db_name: str, queries: Dict[Tuple, List[Tuple[int, Dict]]],
+                                started: float) -> List[Tuple[int, Tuple[bool, str]]]:
+        results = []
+        for query_key, checks in queries.items():
+            table_name, where_clause, order_by_clause, wait_until = query_key
+            fields = list(dict.fromkeys(check['field'] for _, check in checks))
+            # The deadline counts from the start of the validation, so waits on other queries are not added up
+            deadline = started + wait_until
+            delay = self.POLL_INITIAL_DELAY
+            attempts = 0
+            while True:
+                attempts += 1
+                try:
+                    db = self.get_db_connection(db_name)
+                    logging.info(f"{self.__class__.__name__}: Generated SQL query: SELECT {', '.join(fields)} FROM {table_name} WHERE {where_clause} ORDER BY {order_by_clause}")
+                    rows = db.execute_query(table_name, fields=fields, where=where_clause, order_by=order_by_clause)
+                except Exception as e:
+                    rows = e
+                    break
+                evaluated = self._evaluate_checks(db_name, table_name, where_clause, order_by_clause, checks, rows)
+                remaining = deadline - time.perf_counter()
+                if all(is_valid for _, (is_valid, _) in evaluated) or remaining <= 0:
+                    break
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 2, self.POLL_MAX_DELAY)
+
+            if isinstance(rows, Exception):
+                if len(fields) > 1:
+                    # One bad field must not fail the other assertions merged into the same query
+                    for index, check in checks:
+                        results.extend(self._run_validation_queries(db_name, {query_key: [(index, check)]}, started))
+                    continue
+                logging.error(f"{self.__class__.__name__}: Database validation failed: {str(rows)}")
+                results.extend((index, (False, f"Database validation failed: {str(rows)}")) for index, _ in checks)
+                continue
+
+            if wait_until:
+                evaluated = self._record_consistency(db_name, table_name, evaluated, checks, wait_until,
+                                                     time.perf_counter() - started, attempts)
+            results.extend(evaluated)
+        return results
+
+    def _evaluate_checks(self, db_name: str, table_name: str, where_clause: str, order_by_clause: str,
+                         checks: List[Tuple[int, Dict]], rows: List) -> List[Tuple[int, Tuple[bool, str]]]:
+        results = []
+        for index, check in checks:
+            field_name = check['field']
+            if not rows:
+                msg = f"No data found for field '{field_name}' in table '{db_name}.{table_name}' with filters '{where_clause}' and order '{order_by_clause}'."
+                results.append((index, (False, f"Database validation failed: {msg}")))
+                continue
+            actual_value = rows[0][field_name]
+            msg = f"Database validation for '{field_name}' in table '{db_name}.{table_name}'. Expected: '{check['expected']}', Actual: '{actual_value}'."
+            results.append((index, (actual_value == check['expected'], msg)))
+        return results
+
+    def _record_consistency(self, db_name: str, table_name: str, evaluated: List[Tuple[int, Tuple[bool, str]]],
+                            checks: List[Tuple[int, Dict]], wait_until: float, elapsed: float,
+                            attempts: int) -> List[Tuple[int, Tuple[bool, str]]]:
+        consistent = all(is_valid for _, (is_valid, _) in evaluated)
+        for _, check in checks:
+            self.consistency_times.append({
+                'database': db_name,
+                'table': table_name,
+                'field': check['field'],
+                'seconds': round(elapsed, 3),
+                'attempts': attempts,
+                'consistent': consistent,
+            })
+        note = (f" Consistent after {elapsed:.2f}s ({attempts} queries)." if consistent
+                else f" Not consistent within {wait_until:g}s ({attempts} queries).")
+        logging.info(f"{self.__class__.__name__}: Time to consistency for '{db_name}.{table_name}':{note}")
+        return [(index, (is_valid, msg + note)) for index, (is_valid, msg) in evaluated]
+
+    def get_consistency_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Time to consistency of the polled assertions, per database table."""
+        stats = {}
+        for record in list(self.consistency_times):
+            stats.setdefault(f"{record['database']}.{record['table']}", []).append(record)
+        return {
+            table: {
+                'checks': len(records),
+                'inconsistent': sum(not record['consistent'] for record in records),
+                'median_seconds': round(statistics.median(record['seconds'] for record in records), 3),
+                'max_seconds': max(record['seconds'] for record in records),
+            }
+            for table, records in stats.items()
+        }
+
+    def log_consistency_statistics(self):
+        for table, stats in self.get_consistency_statistics().items():
+            logging.info(f"{self.__class__.__name__}: Time to consistency of '{table}': {stats}")
 
     def insert_data(self, db_name: str, table: str, data_template: Dict[str, Any], row_count: int = 1) -> int:
+        row_count = int(row_count)
         try:
             db = self.get_db_connection(db_name)
-            rows = [self._replace_placeholders(data_template) for _ in range(row_count)]
-            if row_count == 1:
-                for col, value in rows[0].items():
-                    BuiltIn().set_global_variable(f'${{{col}}}', value)
+            if row_count > 1:
+                # Unlike bulk_insert_data, either all rows are inserted or none
+                rows = self._rows_from_template(self._parse_template(data_template), row_count)
+                return db.bulk_insert(table, rows, atomic=True)
+
+            row = self._replace_placeholders(copy.deepcopy(self._parse_template(data_template)))
+            for col, value in row.items():
+                BuiltIn().set_global_variable(f'${{{col}}}', value)
 
             with db.transaction():
-                inserted_count = db.insert(table, rows)
+                inserted_count = db.insert(table, [row])
                 logging.info(f"{self.__class__.__name__}: Inserted {inserted_count} row(s) into '{table}'")
                 return inserted_count
 
@@ -97,6 +286,37 @@ class DBOperator(metaclass=SingletonMeta):
             logging.error(f"{self.__class__.__name__}: Failed to insert data into table '{table}': {str(e)}")
             raise DBOperationError(f"Failed to insert data into table '{table}': {str(e)}")
 
+    def bulk_insert_data(self, db_name: str, table: str, data_template: Optional[Dict[str, Any]] = None,
+                         row_count: int = 1, csv_path: Optional[str] = None, batch_size: int = 1000) -> int:
+        """
+        Insert many rows in batches, generating each row from data_template (row_count times) or reading
+        it from csv_path. Placeholders are resolved per row; no Robot variables are published.
+        """
+        try:
+            db = self.get_db_connection(db_name)
+            rows = self._rows_from_csv(csv_path) if csv_path else self._rows_from_template(self._parse_template(data_template), int(row_count))
+            return db.bulk_insert(table, rows, int(batch_size))
+
+        except Exception as e:
+            logging.error(f"{self.__class__.__name__}: Failed to bulk insert data into table '{table}': {str(e)}")
+            raise DBOperationError(f"Failed to bulk insert data into table '{table}': {str(e)}")
+
+    def _rows_from_template(self, data_template: Dict[str, Any], row_count: int) -> Iterator[Dict[str, Any]]:
+        for _ in range(row_count):
+            # A fresh copy per row, since placeholders are replaced in place
+            yield self._replace_placeholders(copy.deepcopy(data_template))
+
+    def _rows_from_csv(self, csv_path: str) -> Iterator[Dict[str, Any]]:
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                # Empty cells become NULL rather than empty strings
+                yield self._replace_placeholders({col: value if value != '' else None for col, value in row.items()})
+
+    @staticmethod
+    def _parse_template(data_template) -> Dict[str, Any]:
+        # Templates passed from the test case sheets arrive as JSON text
+        return json.loads(data_template) if isinstance(data_template, str) else data_template
+
     def update_data(self, db_name: str, table: str, data_template: Dict[str, Any], where_template: str = "") -> bool:
         try:
             db = self.get_db_connection(db_name)
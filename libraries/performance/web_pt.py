@@ -1,23 +1,86 @@
 import logging
 import os
+import copy
 import json
+import random
 import re
+import threading
 import time
-from typing import Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
 
 from libraries.api.saved_fields_manager import SavedFieldsManager
 from libraries.common.utility_helpers import PROJECT_ROOT
 from libraries.common.config_manager import ConfigManager
 from libraries.performance.web_pt_loader import PerformanceTestLoader
 from libraries.web.web_actions import WebActions
+from libraries.web.web_action.utils_actions import UtilsActions
 from libraries.web.webdriver_factory import WebDriverFactory
+from libraries.web.webdriver_pool import WebDriverPool
 from libraries.performance.web_pt_reporter import WebPerformanceReporter
+from libraries.performance.web_pt_browser_timing import BrowserTimingCollector
+from libraries.performance.web_pt_metrics import WebPerformanceMetricStore
+from libraries.performance.web_pt_statistics import PerformanceStatistics
+from libraries.performance.web_pt_history import PerformanceHistoryStore
+from libraries.performance.web_pt_memory import MemoryCollector, MEMORY_COUNTERS, ROUND_START
+from libraries.performance.web_pt_throttling import ThrottlingProfiles, NO_THROTTLING
+from libraries.performance.web_pt_tracing import TraceRecorder, DEFAULT_TRACE_CATEGORIES
 from robot.libraries.BuiltIn import BuiltIn
 
 builtin_lib = BuiltIn()
 
+VARIABLE_PATTERN = re.compile(r'\$\{([^}]+)\}')
+SEPARATOR = "=" * 100
+
 
 class WebPerformanceTester:
+    DEFAULT_VIRTUAL_USER_SETTINGS = {
+        'users': 1,
+        'ramp_up_seconds': 0,
+        'pacing_seconds': 0,
+        'think_time_seconds': 0,
+    }
+    DEFAULT_ADAPTIVE_SETTINGS = {
+        'enabled': False,
+        'warmup_rounds': 2,
+        'min_rounds': 5,
+        'confidence': 0.95,
+        'target_relative_width': 0.1,
+        'bootstrap_resamples': 1000,
+    }
+    DEFAULT_MEMORY_SETTINGS = {
+        'dom_counters': True,
+        'sample_every_n_rounds': 1,
+        'gc_heap_every_n_rounds': 0,
+        'alpha': 0.05,
+        'min_relative_growth': 0.1,
+        'top_counters': 10,
+    }
+    DEFAULT_REPORT_SETTINGS = {
+        'backend': 'svg',
+        'max_points': 1000,
+        'workers': 2,
+    }
+    DEFAULT_HISTORY_SETTINGS = {
+        'enabled': False,
+        'path': 'history/web_pt_history.db',
+        'baseline': 'previous',
+        'alpha': 0.05,
+        'min_relative_change': 0.05,
+        'fail_on_regression': True,
+    }
+    DEFAULT_TRACE_SETTINGS = {
+        'mode': 'off',
+        'threshold_seconds': 3.0,
+        'max_files': 100,
+        'categories': DEFAULT_TRACE_CATEGORIES,
+    }
+    # Virtual users share the root logger, so its level is lowered by the first and restored by the last
+    _quiet_steps_lock = threading.Lock()
+    _quiet_steps = 0
+    _level_before_quiet_steps = logging.NOTSET
+
     def __init__(self, test_config_path: str = None, test_cases_path: str = None):
         self.project_root = PROJECT_ROOT
         self.test_config_path = test_config_path or os.path.join(self.project_root, 'configs', 'web_pt_config.yaml')
@@ -25,9 +88,20 @@ class WebPerformanceTester:
 
         self._web_actions_instance = None
         self._driver = None
+        self._driver_pool = None
         self.current_case_id = None
-        self.response_time_data = []
-        self.memory_usage_data = []
+        self.user_id = 1
+        # Robot variables resolved up front for virtual users, which cannot use BuiltIn from their threads
+        self._variable_values = None
+        self.throttling_profile = NO_THROTTLING
+        self._browser_timing = None
+        self._memory_collector = None
+        self._trace_recorder = None
+        self.traces = []
+        # Unrounded response times per (case, function); the recorded ones are rounded to 10 ms
+        self._convergence_samples = {}
+        self._report_executor = None
+        self._pending_reports = {}
 
         self._load_configuration()
         self._initialize_components()
@@ -38,6 +112,22 @@ class WebPerformanceTester:
         self.performance_test_loader = PerformanceTestLoader(self.test_cases_path, self.test_config)
         self.env_config = self._load_environment_config()
         self.main_config = self._load_main_config()
+        self.virtual_user_settings = self._load_virtual_user_settings()
+        self.adaptive_settings = self._load_adaptive_settings()
+        self.report_settings = {**self.DEFAULT_REPORT_SETTINGS, **(self.test_config.get('report_charts') or {})}
+        self.throttling = ThrottlingProfiles(self.test_config.get('throttling_profiles'))
+        self.memory_settings = {**self.DEFAULT_MEMORY_SETTINGS, **(self.test_config.get('memory_analysis') or {})}
+        self.trace_settings = {**self.DEFAULT_TRACE_SETTINGS, **(self.test_config.get('tracing') or {})}
+        # YAML reads an unquoted off as false
+        self.trace_settings['mode'] = str(self.trace_settings['mode'] or 'off').lower()
+        if self.trace_settings['mode'] not in ('off', 'threshold', 'always'):
+            raise ValueError(f"Invalid tracing mode '{self.trace_settings['mode']}', expected off, threshold or always")
+
+    def _load_adaptive_settings(self):
+        return {**self.DEFAULT_ADAPTIVE_SETTINGS, **(self.test_config.get('adaptive_rounds') or {})}
+
+    def _load_virtual_user_settings(self):
+        return {**self.DEFAULT_VIRTUAL_USER_SETTINGS, **(self.test_config.get('virtual_users') or {})}
 
     def _load_main_config(self):
         web_environments = self.performance_test_loader.get_web_environments()
@@ -46,7 +136,8 @@ class WebPerformanceTester:
         return {
             'Rounds': env_config['Rounds'],
             'MaxMinutes': env_config['MaxMinutes'],
-            'Log Details': env_config['LogDetails']
+            'Log Details': env_config['LogDetails'],
+            'ThrottlingProfile': env_config.get('ThrottlingProfile', '')
         }
 
     def _load_environment_config(self):
@@ -79,29 +170,79 @@ class WebPerformanceTester:
         self.custom_actions = self.performance_test_loader.get_custom_actions()
         self.saved_fields_manager = SavedFieldsManager()
         self.saved_fields_manager.load_saved_fields_and_set_robot_global_variables()
+        metrics_settings = self.test_config.get('metrics_store') or {}
+        self.metrics = WebPerformanceMetricStore(resume=bool(metrics_settings.get('resume', False)),
+                                                 relative_error=float(metrics_settings.get('relative_error', 0.01)))
+        # Highlighting would only add noise to measured response times
+        UtilsActions.configure_highlight(self.test_config.get('highlight', False))
+        self.history_settings = {**self.DEFAULT_HISTORY_SETTINGS, **(self.test_config.get('performance_history') or {})}
+        self.history = None
+        if self.history_settings['enabled']:
+            self.history = PerformanceHistoryStore(self.history_settings['path'])
+            self.history.start_run(self.test_config['active_environment'])
 
     @property
     def driver(self):
         if self._driver is None:
             active_env_config = self.env_config['environments'][self.test_config['active_environment']]
-            self._driver = WebDriverFactory.create_driver(active_env_config)
+            if self.trace_settings['mode'] != 'off':
+                active_env_config = {**active_env_config, 'trace_categories': list(self.trace_settings['categories'])}
+            pool_settings = self.test_config.get('webdriver_pool')
+            if WebDriverPool.is_enabled(pool_settings):
+                self._driver_pool = WebDriverPool.get_instance(active_env_config, pool_settings)
+                self._driver = self._driver_pool.acquire()
+            else:
+                self._driver = WebDriverFactory.create_driver(active_env_config)
         return self._driver
 
+    @property
+    def browser_timing(self):
+        if self._browser_timing is None and self.test_config.get('browser_timing', True):
+            self._browser_timing = BrowserTimingCollector(self.driver)
+        return self._browser_timing
+
     @property
     def web_actions(self):
         if self._web_actions_instance is None:
             self._web_actions_instance = WebActions(self.driver)
         return self._web_actions_instance
 
+    @property
+    def memory_collector(self):
+        if self._memory_collector is None:
+            self._memory_collector = MemoryCollector(self.driver, bool(self.memory_settings['dom_counters']))
+        return self._memory_collector
+
+    @property
+    def trace_recorder(self):
+        if self._trace_recorder is None and self.trace_settings['mode'] != 'off':
+            self._trace_recorder = TraceRecorder(self.driver, self.trace_settings['mode'],
+                                                 float(self.trace_settings['threshold_seconds']),
+                                                 int(self.trace_settings['max_files']))
+        return self._trace_recorder
+
     def get_js_memory(self):
-        try:
-            js_memory = self.driver.execute_script("return window.performance.memory;")
-            if js_memory:
-                used_js_memory_mb = js_memory.get("usedJSHeapSize", 0) / (1024 * 1024)
-                return round(used_js_memory_mb, 2)
-        except Exception as e:
-            logging.error(f"Error in get_js_memory: {e}")
-        return None
+        sample = self.memory_collector.sample()
+        return sample['used_MB'] if sample else None
+
+    def _sample_memory(self, round_num: int, case_id: str, function_name: str):
+        """Record heap and DOM counters; every gc_heap_every_n_rounds rounds also the heap after a forced GC."""
+        gc_every = int(self.memory_settings['gc_heap_every_n_rounds'])
+        sample = self.memory_collector.sample(force_gc=bool(gc_every) and (round_num + 1) % gc_every == 0)
+        if sample:
+            self.metrics.record('memory_usage', {
+                "round": round_num + 1,
+                "case_id": case_id,
+                "user": self.user_id,
+                "profile": self.throttling_profile,
+                "function_name": function_name,
+                **sample
+            })
+
+    def _resolve_throttling_profile(self, case_id: str) -> str:
+        """The case's Throttling Profile column wins over the ThrottlingProfile of the environment."""
+        test_case = self.test_cases[self.test_cases['Case ID'] == case_id].iloc[0]
+        return self.throttling.resolve(test_case.get('Throttling Profile') or self.main_config['ThrottlingProfile'])
 
     def execute_single_test(self, case_id: str):
         case_name = self.test_cases[self.test_cases['Case ID'] == case_id]['Name'].iloc[0]
@@ -112,13 +253,88 @@ class WebPerformanceTester:
             logging.warning(f"Test case {case_id} is not marked to run.")
             return
 
-        case_functions = self.test_functions[self.test_functions['Case ID'] == case_id].sort_values('Execution Order')
-        max_rounds = int(self.main_config['Rounds'])
-        max_minutes = float(self.main_config.get('MaxMinutes', float('inf')))  # Default to infinity if not specified
+        users = int(self.virtual_user_settings['users'])
+        # Convergence is judged on the samples of this case only
+        self._convergence_samples.clear()
+
         start_time = time.perf_counter()
-        round_num = 0
+        if users > 1:
+            rounds_completed = self._run_virtual_users(case_id, users, start_time)
+        else:
+            rounds_completed = self._run_rounds(case_id, start_time)
 
-        self._execute_setup_function()
+        logging.info(f"Finished executing test case: {case_id} - {case_name}")
+        logging.info(f"Total rounds completed: {rounds_completed}")
+        logging.info(f"Total time elapsed: {(time.perf_counter() - start_time) / 60:.2f} minutes")
+        self._save_history(case_id)
+        self._render_report_in_background(case_id)
+
+    def _save_history(self, case_id: str):
+        if not self.history:
+            return
+        self.history.save(self.metrics.to_dataframe('response_time', case_id), ['response_time'])
+        self.history.save(self.metrics.to_dataframe('memory_usage', case_id), MEMORY_COUNTERS)
+        self.history.save(self.metrics.to_dataframe('browser_timing', case_id), BrowserTimingCollector.METRIC_COLUMNS)
+
+    def _run_virtual_users(self, case_id: str, users: int, start_time: float) -> int:
+        """Run the case on one browser per virtual user, starting the users evenly over the ramp-up period."""
+        ramp_up_interval = float(self.virtual_user_settings['ramp_up_seconds']) / users
+        logging.info(f"{self.__class__.__name__}: Starting {users} virtual users for case {case_id}, "
+                        f"one every {ramp_up_interval:.1f}s")
+
+        variable_values = self._resolve_variables()
+        virtual_users = [self._create_virtual_user(user_id, variable_values) for user_id in range(1, users + 1)]
+        with ThreadPoolExecutor(max_workers=users, thread_name_prefix='virtual-user') as executor:
+            futures = []
+            for index, virtual_user in enumerate(virtual_users):
+                if index and ramp_up_interval:
+                    time.sleep(ramp_up_interval)
+                futures.append(executor.submit(virtual_user._run_rounds, case_id, start_time))
+
+        rounds_completed = 0
+        for virtual_user, future in zip(virtual_users, futures):
+            try:
+                rounds_completed += future.result()
+            except Exception as e:
+                logging.error(f"Virtual user {virtual_user.user_id} failed: {e}")
+            finally:
+                virtual_user._release_driver()
+                # Pooled browsers come from the shared pool, which close() shuts down
+                self._driver_pool = self._driver_pool or virtual_user._driver_pool
+        return rounds_completed
+
+    def _create_virtual_user(self, user_id: int, variable_values: Dict) -> 'WebPerformanceTester':
+        # Loaded test data and the metric lists are shared; each user gets its own browser
+        virtual_user = copy.copy(self)
+        virtual_user.user_id = user_id
+        virtual_user._variable_values = variable_values
+        virtual_user._driver = None
+        virtual_user._web_actions_instance = None
+        virtual_user._browser_timing = None
+        virtual_user._memory_collector = None
+        virtual_user._trace_recorder = None
+        return virtual_user
+
+    def _run_rounds(self, case_id: str, start_time: float) -> int:
+        max_rounds = int(self.main_config['Rounds'])
+        max_minutes = float(self.main_config.get('MaxMinutes', float('inf')))  # Default to infinity if not specified
+        pacing_seconds = float(self.virtual_user_settings['pacing_seconds'])
+        round_num = self.metrics.completed_rounds(case_id, self.user_id)
+        if round_num >= max_rounds:
+            logging.info(f"User {self.user_id}: All {max_rounds} rounds of case {case_id} were already completed")
+            return round_num
+        if round_num:
+            logging.info(f"User {self.user_id}: Resuming case {case_id} after round {round_num}")
+
+        # Applied on every case so a profile never leaks into the next case on the same browser
+        self.throttling_profile = self._resolve_throttling_profile(case_id)
+        self.throttling.apply(self.driver, self.throttling_profile)
+
+        # Resolve the case once instead of filtering and sorting the DataFrames on every round
+        plan = self._compile_case(case_id)
+        self._execute_setup_function(plan['setup'])
+        if self.adaptive_settings['enabled']:
+            self._run_warmup_rounds(case_id, plan)
 
         while round_num < max_rounds:
             current_time = time.perf_counter()
@@ -129,87 +345,122 @@ class WebPerformanceTester:
                 break
 
             try:
-                logging.info(f"Starting round {round_num + 1}/{max_rounds}")
-                memory_usage = self.get_js_memory()
-                if memory_usage is not None:
-                    self.memory_usage_data.append({
-                        "round": round_num + 1,
-                        "case_id": case_id,
-                        "used_MB": memory_usage
-                    })
-
-                for _, function in case_functions.iterrows():
+                logging.info(f"User {self.user_id}: Starting round {round_num + 1}/{max_rounds}")
+                self._sample_memory(round_num, case_id, ROUND_START)
+                sample_functions = (round_num + 1) % max(1, int(self.memory_settings['sample_every_n_rounds'])) == 0
+
+                for function in plan['functions']:
                     try:
-                        function_name = function['Function Name']
-                        self._execute_test_function(round_num, function_name, case_id)
+                        self._execute_test_function(round_num, function, case_id)
                     except Exception as e:
-                        logging.error(f"Error in function '{function_name}' during round {round_num + 1}: {e}")
+                        logging.error(f"User {self.user_id}: Error in function '{function['name']}' during round {round_num + 1}: {e}")
                         continue
-
-                logging.info(f"Completed round {round_num + 1}/{max_rounds}")
+                    # Sampled after the postcondition, outside the measured window
+                    if sample_functions:
+                        self._sample_memory(round_num, case_id, function['name'])
+                    self._think()
+
+                self.metrics.complete_round(self.user_id)
+                self._log_round_percentiles(case_id, plan)
+                logging.info(f"User {self.user_id}: Completed round {round_num + 1}/{max_rounds}")
                 round_num += 1
 
             except Exception as e:
-                logging.error(f"Error in round {round_num + 1}: {e}")
+                logging.error(f"User {self.user_id}: Error in round {round_num + 1}: {e}")
+                # The round is run again under the same number, without the rows it already recorded
+                self.metrics.discard_round(self.user_id)
                 continue
 
-        logging.info(f"Finished executing test case: {case_id} - {case_name}")
-        logging.info(f"Total rounds completed: {round_num}")
-        logging.info(f"Total time elapsed: {(time.time() - start_time) / 60:.2f} minutes")
-
-    def _execute_setup_function(self):
-        try:
-            setup_steps = self.sub_functions[
-                self.sub_functions['Sub Function Name'] == 'TestSetup'].sort_values('Step Order')
-            for _, step in setup_steps.iterrows():
-                self._execute_step(step)
-        except Exception as e:
-            logging.error(f"Error executing function 'Setup': {e}")
-            raise
-
-    def _execute_test_function(self, round_num: int, function_name: str, case_id: str):
-        function_steps = self.test_functions[self.test_functions['Function Name'] == function_name].iloc[0]
-
-        try:
-            # Execute precondition steps
-            precondition_steps = self.sub_functions[
-                self.sub_functions['Sub Function Name'] == function_steps['Precondition subFunction']
-                ].sort_values('Step Order')
-
-            for _, step in precondition_steps.iterrows():
-                self._execute_step(step)
-
-            # Execute and time operation steps
-            operation_steps = self.sub_functions[
-                self.sub_functions['Sub Function Name'] == function_steps['Operation subFunction']
-                ].sort_values('Step Order')
-
-            start_time = time.time()
-            for _, step in operation_steps.iterrows():
-                self._execute_step(step)
-            end_time = time.time()
+            if self.adaptive_settings['enabled'] and self._is_converged(case_id, plan, round_num):
+                break
 
-            response_time = round(end_time - start_time, 2)
-            self.response_time_data.append({
-                "round": round_num + 1,
-                "case_id": case_id,
-                "function_name": function_name,
-                "response_time": response_time
+            # Pacing: rounds start at most once per pacing_seconds, whatever their own duration
+            remaining = pacing_seconds - (time.perf_counter() - current_time)
+            if remaining > 0 and round_num < max_rounds:
+                time.sleep(remaining)
+
+        return round_num
+
+    def _run_warmup_rounds(self, case_id: str, plan: Dict):
+        """Run rounds whose measurements are discarded, so cold caches and JIT don't skew the results."""
+        for warmup_round in range(int(self.adaptive_settings['warmup_rounds'])):
+            logging.info(f"User {self.user_id}: Warm-up round {warmup_round + 1}/{self.adaptive_settings['warmup_rounds']}")
+            for function in plan['functions']:
+                try:
+                    self._execute_test_function(warmup_round, function, case_id, record=False)
+                except Exception as e:
+                    logging.error(f"User {self.user_id}: Error in function '{function['name']}' during warm-up: {e}")
+
+    def _is_converged(self, case_id: str, plan: Dict, rounds_completed: int) -> bool:
+        """True once the bootstrap confidence interval of every function's median is narrow enough."""
+        settings = self.adaptive_settings
+        if rounds_completed < int(settings['min_rounds']):
+            return False
+
+        target = float(settings['target_relative_width'])
+        widths = {}
+        for function in plan['functions']:
+            samples = self._convergence_samples.get((case_id, function['name']), [])
+            if len(samples) < 2:
+                return False
+            interval = PerformanceStatistics.bootstrap_median_ci(
+                samples, float(settings['confidence']), int(settings['bootstrap_resamples']))
+            widths[function['name']] = PerformanceStatistics.relative_width(*interval)
+            if widths[function['name']] > target:
+                logging.info(f"User {self.user_id}: {function['name']} median CI width {widths[function['name']]:.1%} "
+                             f"is above the {target:.1%} target after {rounds_completed} rounds")
+                return False
+
+        logging.info(f"User {self.user_id}: Case {case_id} converged after {rounds_completed} rounds, "
+                     f"median CI widths: " + ", ".join(f"{name} {width:.1%}" for name, width in widths.items()))
+        return True
+
+    def _log_round_percentiles(self, case_id: str, plan: Dict):
+        if not logging.getLogger().isEnabledFor(logging.INFO):
+            return
+        for function in plan['functions']:
+            p50, p95 = self.metrics.percentiles(case_id, function['name'], (0.5, 0.95)).values()
+            if p50 is not None:
+                logging.info(f"User {self.user_id}: {function['name']} running P50 {p50:.2f}s, P95 {p95:.2f}s")
+
+    def _think(self):
+        think_time = float(self.virtual_user_settings['think_time_seconds'])
+        if think_time > 0:
+            # Randomised around the configured value so users don't act in lockstep
+            time.sleep(random.uniform(0.5, 1.5) * think_time)
+
+    def _compile_case(self, case_id: str) -> Dict:
+        """
+        Build the execution plan of a case: its setup steps and, per function in execution order,
+        the compiled precondition, operation and postcondition steps.
+        """
+        case_functions = self.test_functions[self.test_functions['Case ID'] == case_id].sort_values('Execution Order')
+        functions = []
+        for function_name in case_functions['Function Name']:
+            function_steps = self.test_functions[self.test_functions['Function Name'] == function_name].iloc[0]
+            functions.append({
+                'name': function_name,
+                'precondition': self._compile_sub_function(function_steps['Precondition subFunction']),
+                'operation': self._compile_sub_function(function_steps['Operation subFunction']),
+                'postcondition': self._compile_sub_function(function_steps['Postcondition subFunction']),
             })
-
-            # Execute postcondition steps
-            postcondition_steps = self.sub_functions[
-                self.sub_functions['Sub Function Name'] == function_steps['Postcondition subFunction']
-                ].sort_values('Step Order')
-
-            for _, step in postcondition_steps.iterrows():
-                self._execute_step(step)
-
-        except Exception as e:
-            logging.error(f"Error executing function '{function_name}': {e}")
-            raise  # Re-raise to be caught by execute_single_test
-
-    def _execute_step(self, step: Dict):
+        plan = {'setup': self._compile_sub_function('TestSetup'), 'functions': functions}
+        step_count = len(plan['setup']) + sum(
+            len(f['precondition']) + len(f['operation']) + len(f['postcondition']) for f in functions)
+        logging.info(f"{self.__class__.__name__}: Compiled case {case_id} into {len(functions)} functions and {step_count} steps")
+        return plan
+
+    def _compile_sub_function(self, sub_function_name: str) -> List[Tuple]:
+        steps = self.sub_functions[self.sub_functions['Sub Function Name'] == sub_function_name].sort_values('Step Order')
+        return [self._compile_step(step) for step in steps.to_dict('records')]
+
+    def _compile_step(self, step: Dict) -> Tuple:
+        """
+        Resolve a step into (log message, bound action, args, input template).
+
+        Inputs referencing ${variables} keep their template and are substituted when the step runs,
+        since steps of earlier rounds may save new values for them.
+        """
         action_name = step['Action'].lower()
         page = step['Page']
         element = step['Element']
@@ -221,39 +472,156 @@ class WebPerformanceTester:
                 + (f" element:[{element}]" if element else "")
                 + (f" with input:[{input_value}]" if input_value else "")
         )
-        logging.info(log_message)
 
-        logger = logging.getLogger()
-        original_level = logger.level
+        if not hasattr(self.web_actions, action_name):
+            raise ValueError(f"Unknown action type: {action_name}")
+        action = getattr(self.web_actions, action_name)
+
+        template = None
+        if input_value is not None:  # Check if input_value exists
+            input_value = str(input_value)  # Convert to string
+            if VARIABLE_PATTERN.search(input_value):
+                template = input_value
 
+        return log_message, action, self._step_args(locator, input_value), (template, locator)
+
+    @staticmethod
+    def _step_args(locator, input_value) -> Tuple:
+        args = () if locator is None else (locator,)
+        return args + (input_value,) if input_value else args
+
+    def _substitute_variables(self, input_value: str) -> str:
+        for match in VARIABLE_PATTERN.findall(input_value):
+            if self._variable_values is not None:
+                input_value = input_value.replace(f'${{{match}}}', str(self._variable_values.get(match)))
+                continue
+            replacement_value = builtin_lib.get_variable_value(f'${{{match}}}')
+            input_value = input_value.replace(f'${{{match}}}', str(replacement_value))
+            logging.info(f"{self.__class__.__name__}: Replaced {match} with value: {replacement_value}")
+        return input_value
+
+    def _resolve_variables(self) -> Dict:
+        """Look up every Robot variable the step inputs reference; must run on the main thread."""
+        variable_values = {}
+        for input_value in self.sub_functions['Input Value (if applicable)'].dropna():
+            for match in VARIABLE_PATTERN.findall(str(input_value)):
+                if match not in variable_values:
+                    variable_values[match] = builtin_lib.get_variable_value(f'${{{match}}}')
+                    logging.info(f"{self.__class__.__name__}: Resolved {match} with value: {variable_values[match]}")
+        return variable_values
+
+    def _execute_setup_function(self, setup_steps: List[Tuple]):
         try:
-            if self.main_config['Log Details'] != 'Y':
-                logger.setLevel(logging.WARNING)
+            self._execute_steps(setup_steps)
+        except Exception as e:
+            logging.error(f"Error executing function 'Setup': {e}")
+            raise
 
-            if not hasattr(self.web_actions, action_name):
-                raise ValueError(f"Unknown action type: {action_name}")
+    def _execute_test_function(self, round_num: int, function: Dict, case_id: str, record: bool = True):
+        function_name = function['name']
+        try:
+            # Execute precondition steps
+            self._execute_steps(function['precondition'])
+
+            # Browser-side marks and trace log reads happen outside the wall-clock window so they don't add to it
+            if self.trace_recorder:
+                self.trace_recorder.begin()
+            if self.browser_timing:
+                self.browser_timing.start(function_name)
+            start_time = time.perf_counter()
+            self._execute_steps(function['operation'])
+            end_time = time.perf_counter()
+            browser_metrics = self.browser_timing.end(function_name) if self.browser_timing else None
+
+            # Warm-up rounds are executed but not measured
+            if record:
+                self._record_function_metrics(round_num, case_id, function_name, end_time - start_time, browser_metrics)
+                if self.trace_recorder:
+                    self._save_trace(round_num, case_id, function_name, end_time - start_time)
 
-            action = getattr(self.web_actions, action_name)
+            # Execute postcondition steps
+            self._execute_steps(function['postcondition'])
 
-            if input_value is not None:  # Check if input_value exists
-                input_value = str(input_value)  # Convert to string
-                matches = re.findall(r'\$\{([^}]+)\}', input_value)
-                if matches:
-                    for match in matches:
-                        replacement_value = builtin_lib.get_variable_value(f'${{{match}}}')
-                        input_value = input_value.replace(f'${{{match}}}', str(replacement_value))
-                        logging.info(f"{self.__class__.__name__}: Replaced {match} with value: {replacement_value} for web_action: {action}")
+        except Exception as e:
+            logging.error(f"Error executing function '{function_name}': {e}")
+            raise  # Re-raise to be caught by execute_single_test
 
-            if locator is not None:
-                action(locator, input_value) if input_value else action(locator)
-            else:
-                action(input_value) if input_value else action()
+    def _save_trace(self, round_num: int, case_id: str, function_name: str, elapsed: float):
+        trace_file = self.trace_recorder.end(f"{case_id}_{function_name}_u{self.user_id}_r{round_num + 1}", elapsed)
+        if trace_file:
+            self.traces.append({
+                "round": round_num + 1,
+                "case_id": case_id,
+                "user": self.user_id,
+                "function_name": function_name,
+                "response_time": elapsed,
+                "profile": self.throttling_profile,
+                "file": trace_file
+            })
+
+    def _record_function_metrics(self, round_num: int, case_id: str, function_name: str, elapsed: float,
+                                 browser_metrics: Dict = None):
+        if self.adaptive_settings['enabled']:
+            # Virtual users share the dict, so setdefault keeps one list per function
+            self._convergence_samples.setdefault((case_id, function_name), []).append(elapsed)
+        self.metrics.record('response_time', {
+            "round": round_num + 1,
+            "case_id": case_id,
+            "user": self.user_id,
+            "profile": self.throttling_profile,
+            "function_name": function_name,
+            "response_time": round(elapsed, 2)
+        })
+        if browser_metrics:
+            self.metrics.record('browser_timing', {
+                "round": round_num + 1,
+                "case_id": case_id,
+                "user": self.user_id,
+                "profile": self.throttling_profile,
+                "function_name": function_name,
+                **browser_metrics
+            })
+
+    def _execute_steps(self, steps: List[Tuple]):
+        with self._step_logging() as log_step:
+            for log_message, action, args, (template, locator) in steps:
+                log_step(log_message)
+                if template is not None:
+                    args = self._step_args(locator, self._substitute_variables(template))
+                action(*args)
+                logging.info(SEPARATOR)
+
+    @contextmanager
+    def _step_logging(self):
+        """
+        Only write the logs of the steps themselves when Log Details is Y. The "Executing action" line of
+        every step is always written, through the logger that is yielded.
+        """
+        if self.main_config['Log Details'] == 'Y':
+            yield logging.info
+            return
+
+        cls = WebPerformanceTester
+        logger = logging.getLogger()
+        with cls._quiet_steps_lock:
+            if cls._quiet_steps == 0:
+                cls._level_before_quiet_steps = logger.level
+                logger.setLevel(logging.WARNING)
+            cls._quiet_steps += 1
+            announce_steps = cls._level_before_quiet_steps <= logging.INFO
 
-            logging.info("=" * 100)
+        def log_step(message: str):
+            # Handed to the handlers directly, so the lowered level doesn't drop it
+            if announce_steps:
+                logger.handle(logger.makeRecord(logger.name, logging.INFO, __file__, 0, message, None, None))
 
+        try:
+            yield log_step
         finally:
-            if self.main_config['Log Details'] != 'Y':
-                logger.setLevel(original_level)
+            with cls._quiet_steps_lock:
+                cls._quiet_steps -= 1
+                if cls._quiet_steps == 0:
+                    logger.setLevel(cls._level_before_quiet_steps)
 
     def _load_page_elements(self) -> Dict[str, Dict[str, Tuple[str, str]]]:
         elements = {}
@@ -265,24 +633,107 @@ class WebPerformanceTester:
         if case_id is None:
             case_id = self.current_case_id
 
+        # Usually already rendered in the background while the next case was running
+        future = self._pending_reports.pop(case_id, None)
+        return future.result() if future else self._build_report(case_id)
+
+    def _render_report_in_background(self, case_id: str):
+        if self._report_executor is None:
+            # pyplot is not thread safe, so the matplotlib backend renders one case at a time
+            workers = int(self.report_settings['workers']) if self.report_settings['backend'] == 'svg' else 1
+            self._report_executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='report-renderer')
+        self._pending_reports[case_id] = self._report_executor.submit(self._build_report, case_id)
+
+    def _build_report(self, case_id: str) -> Dict:
         case_name = self.test_cases[self.test_cases['Case ID'] == case_id]['Name'].iloc[0]
-        filtered_response_time_data = [data for data in self.response_time_data if data['case_id'] == case_id]
-        filtered_memory_usage_data = [data for data in self.memory_usage_data if data['case_id'] == case_id]
+        filtered_response_time_data = self.metrics.to_dataframe('response_time', case_id)
+        filtered_memory_usage_data = self.metrics.to_dataframe('memory_usage', case_id)
+        filtered_browser_timing_data = self.metrics.to_dataframe('browser_timing', case_id)
 
-        reporter = WebPerformanceReporter(filtered_response_time_data, filtered_memory_usage_data)
+        reporter = WebPerformanceReporter(filtered_response_time_data, filtered_memory_usage_data, filtered_browser_timing_data,
+                                          self.report_settings['backend'], int(self.report_settings['max_points']))
 
         return {
             'memory_chart': reporter.generate_memory_usage_chart(case_id, case_name),
             'response_time_stats_chart': reporter.generate_response_time_statistics_chart(case_id, case_name),
             'response_time_trend_chart': reporter.generate_response_time_trend_chart(case_id, case_name),
-            'response_time_table': reporter.generate_response_time_statistics_table(case_id, case_name)
+            'response_time_table': reporter.generate_response_time_statistics_table(case_id, case_name),
+            'browser_timing_table': reporter.generate_browser_timing_statistics_table(case_id, case_name) if not filtered_browser_timing_data.empty else None,
+            'user_response_time_table': reporter.generate_user_response_time_table(case_id, case_name) if reporter.has_multiple_users() else None,
+            'trace_table': self._trace_table(reporter, case_id, case_name),
+            **self._analyze_memory_growth(reporter, case_id, case_name),
+            **self._compare_with_baseline(reporter, case_id, case_name)
+        }
+
+    def _trace_table(self, reporter: WebPerformanceReporter, case_id: str, case_name: str):
+        traces = [trace for trace in list(self.traces) if trace['case_id'] == case_id]
+        return reporter.generate_trace_links_table(traces, case_id, case_name) if traces else None
+
+    def _analyze_memory_growth(self, reporter: WebPerformanceReporter, case_id: str, case_name: str) -> Dict:
+        growth = reporter.analyze_memory_growth(float(self.memory_settings['alpha']),
+                                                float(self.memory_settings['min_relative_growth']))
+        leaks = growth.loc[growth['Leak'] == 'YES', ['Function Name', 'Counter']].values.tolist() if not growth.empty else []
+        if leaks:
+            logging.warning(f"{self.__class__.__name__}: Case {case_id} shows significant memory growth in: "
+                            + ", ".join(f"{function_name}/{counter}" for function_name, counter in leaks))
+        return {
+            'memory_growth_table': reporter.generate_memory_growth_table(
+                growth.head(int(self.memory_settings['top_counters'])), case_id, case_name) if not growth.empty else None,
+            'memory_leaks': leaks,
         }
 
+    def _compare_with_baseline(self, reporter: WebPerformanceReporter, case_id: str, case_name: str) -> Dict:
+        result = {'regression_table': None, 'regressions': [], 'baseline': None}
+        if not self.history:
+            return result
+        # Only runs with the same throttling profile are comparable
+        profile = self._resolve_throttling_profile(case_id)
+        baseline_run = self.history.find_baseline_run(case_id, self.test_config['active_environment'],
+                                                      self.history_settings['baseline'], profile)
+        if baseline_run is None:
+            logging.info(f"{self.__class__.__name__}: No baseline run for case {case_id} with profile '{profile}' yet")
+            return result
+
+        baseline_data = self.history.load(baseline_run, case_id, 'response_time', profile)
+        comparison = reporter.compare_with_baseline(baseline_data, float(self.history_settings['alpha']),
+                                                    float(self.history_settings['min_relative_change']))
+        if comparison.empty:
+            return result
+
+        result['baseline'] = self.history.describe_run(baseline_run)
+        result['regressions'] = comparison.loc[comparison['Regression'] == 'YES', 'Function Name'].tolist()
+        result['regression_table'] = reporter.generate_regression_table(comparison, case_id, case_name, result['baseline'])
+        if result['regressions']:
+            logging.warning(f"{self.__class__.__name__}: Case {case_id} regressed against {result['baseline']}: "
+                            f"{', '.join(result['regressions'])}")
+        return result
+
     def save_to_csv(self):
-        reporter = WebPerformanceReporter(self.response_time_data, self.memory_usage_data)
-        reporter.save_to_csv()
+        # Completed rounds are already on disk; rows of an interrupted round are not kept
+        self.metrics.flush()
+        logging.info(f"{self.__class__.__name__}: Metrics saved to {self.metrics.output_dir}")
+
+    def _release_driver(self):
+        if self._driver_pool:
+            if self._driver:
+                self.throttling.reset(self._driver)
+            self._driver_pool.release(self._driver)
+        elif self._driver:
+            self._driver.quit()
+        self._driver = None
+        self._web_actions_instance = None
+        self._browser_timing = None
+        self._memory_collector = None
+        self._trace_recorder = None
 
     def close(self):
-        if self._driver:
-            self._driver.quit()
-            self._driver = None
+        self._release_driver()
+        if self._report_executor:
+            self._report_executor.shutdown(wait=True)
+            self._report_executor = None
+        if self.history:
+            self.history.close()
+            self.history = None
+        if self._driver_pool:
+            self._driver_pool.shutdown()
+            self._driver_pool = None
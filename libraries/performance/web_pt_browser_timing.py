@@ -0,0 +1,136 @@
+import logging
+from typing import Dict, Optional
+
+OBSERVER_SCRIPT = """
+(function () {
+    if (window.__ptObservers) {
+        return;
+    }
+    window.__ptEntries = [];
+    window.__ptObservers = [];
+    window.__ptRecord = function (entries) {
+        entries.forEach(function (entry) {
+            window.__ptEntries.push({
+                type: entry.entryType,
+                name: entry.name,
+                startTime: entry.startTime,
+                duration: entry.duration,
+                renderTime: entry.renderTime || 0,
+                requestStart: entry.requestStart || 0,
+                responseStart: entry.responseStart || 0,
+                domContentLoaded: entry.domContentLoadedEventEnd || 0,
+                loadEventEnd: entry.loadEventEnd || 0,
+                transferSize: entry.transferSize || 0
+            });
+        });
+    };
+    ['navigation', 'paint', 'largest-contentful-paint', 'longtask', 'resource'].forEach(function (type) {
+        try {
+            var observer = new PerformanceObserver(function (list) { window.__ptRecord(list.getEntries()); });
+            observer.observe({type: type, buffered: true});
+            window.__ptObservers.push(observer);
+        } catch (e) {
+            // Entry type not supported by this browser
+        }
+    });
+})();
+"""
+
+START_SCRIPT = OBSERVER_SCRIPT + """
+window.__ptEntries = [];
+performance.clearMarks(arguments[0] + '-start');
+performance.clearMeasures(arguments[0]);
+performance.mark(arguments[0] + '-start');
+"""
+
+END_SCRIPT = OBSERVER_SCRIPT + """
+var name = arguments[0];
+performance.mark(name + '-end');
+// After a navigation the start mark belongs to the previous document; measure from its time origin instead
+var startMark = performance.getEntriesByName(name + '-start', 'mark');
+var startTime = startMark.length ? startMark[0].startTime : 0;
+var measure = performance.measure(name, startMark.length ? name + '-start' : undefined, name + '-end');
+// Entries not yet delivered to the observer callbacks
+window.__ptObservers.forEach(function (observer) {
+    window.__ptRecord(observer.takeRecords());
+});
+var entries = window.__ptEntries.filter(function (entry) {
+    return entry.type === 'navigation' || entry.startTime >= startTime;
+});
+window.__ptEntries = [];
+return {measure: measure ? measure.duration : performance.now() - startTime, navigated: !startMark.length, entries: entries};
+"""
+
+
+class BrowserTimingCollector:
+    """
+    Measures an operation inside the browser with performance.mark/measure and collects the
+    Navigation Timing, paint, LCP, long task and Resource Timing entries recorded meanwhile.
+    """
+    METRIC_COLUMNS = (
+        'browser_time_ms', 'navigated', 'ttfb_ms', 'dom_content_loaded_ms', 'load_event_ms', 'first_paint_ms',
+        'first_contentful_paint_ms', 'lcp_ms', 'long_task_count', 'long_task_ms', 'resource_count',
+        'resource_transfer_kb', 'resource_max_ms',
+    )
+
+    def __init__(self, driver):
+        self.driver = driver
+        # Observe every new document from its start, so navigations inside an operation are covered
+        if hasattr(driver, 'execute_cdp_cmd'):
+            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': OBSERVER_SCRIPT})
+
+    def start(self, name: str):
+        self.driver.execute_script(START_SCRIPT, name)
+
+    def end(self, name: str) -> Optional[Dict]:
+        try:
+            result = self.driver.execute_script(END_SCRIPT, name)
+        except Exception as e:
+            logging.warning(f"{self.__class__.__name__}: Failed to collect browser timing for {name}: {e}")
+            return None
+        return self.summarize(result)
+
+    @staticmethod
+    def summarize(result: Dict) -> Dict:
+        entries = result['entries']
+        by_type = {}
+        for entry in entries:
+            by_type.setdefault(entry['type'], []).append(entry)
+
+        metrics = {
+            'browser_time_ms': round(result['measure'], 1),
+            'navigated': result['navigated'],
+            'ttfb_ms': None,
+            'dom_content_loaded_ms': None,
+            'load_event_ms': None,
+            'first_paint_ms': None,
+            'first_contentful_paint_ms': None,
+            'lcp_ms': None,
+        }
+
+        # Page load metrics only describe this operation if it navigated
+        navigation = by_type.get('navigation')
+        if result['navigated'] and navigation:
+            nav = navigation[-1]
+            metrics['ttfb_ms'] = round(nav['responseStart'] - nav['requestStart'], 1) if nav['responseStart'] else None
+            metrics['dom_content_loaded_ms'] = round(nav['domContentLoaded'], 1) or None
+            metrics['load_event_ms'] = round(nav['loadEventEnd'], 1) or None
+
+        for paint in by_type.get('paint', []):
+            key = 'first_contentful_paint_ms' if paint['name'] == 'first-contentful-paint' else 'first_paint_ms'
+            metrics[key] = round(paint['startTime'], 1)
+
+        lcp = by_type.get('largest-contentful-paint')
+        if lcp:
+            metrics['lcp_ms'] = round(lcp[-1]['renderTime'] or lcp[-1]['startTime'], 1)
+
+        long_tasks = by_type.get('longtask', [])
+        resources = by_type.get('resource', [])
+        metrics.update({
+            'long_task_count': len(long_tasks),
+            'long_task_ms': round(sum(task['duration'] for task in long_tasks), 1),
+            'resource_count': len(resources),
+            'resource_transfer_kb': round(sum(resource['transferSize'] for resource in resources) / 1024, 1),
+            'resource_max_ms': round(max((resource['duration'] for resource in resources), default=0), 1),
+        })
+        return metrics
@@ -0,0 +1,127 @@
+import logging
+import os
+import sqlite3
+import subprocess
+import threading
+from datetime import datetime
+from typing import Optional
+
+import pandas as pd
+
+from libraries.common.utility_helpers import PROJECT_ROOT
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    environment TEXT NOT NULL,
+    git_revision TEXT
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    case_id TEXT NOT NULL,
+    function_name TEXT,
+    round INTEGER NOT NULL,
+    user INTEGER NOT NULL,
+    profile TEXT NOT NULL DEFAULT 'none',
+    metric TEXT NOT NULL,
+    value REAL
+);
+CREATE INDEX IF NOT EXISTS idx_metrics_lookup ON metrics (case_id, function_name, metric, run_id);
+"""
+
+
+class PerformanceHistoryStore:
+    """
+    SQLite history of web performance runs.
+
+    Every run gets a row in runs (start time, environment, git revision) and its per-round samples
+    are kept in metrics in long form, one row per (case, function, round, user, throttling profile, metric).
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path if path and os.path.isabs(path) else os.path.join(PROJECT_ROOT, path or 'history/web_pt_history.db')
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.executescript(SCHEMA)
+        self._migrate()
+        self.run_id = None
+
+    def _migrate(self):
+        # Databases created before throttling profiles were recorded
+        columns = [row[1] for row in self._connection.execute("PRAGMA table_info(metrics)")]
+        if 'profile' not in columns:
+            with self._connection:
+                self._connection.execute("ALTER TABLE metrics ADD COLUMN profile TEXT NOT NULL DEFAULT 'none'")
+
+    def start_run(self, environment: str) -> int:
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO runs (started_at, environment, git_revision) VALUES (?, ?, ?)",
+                (datetime.now().isoformat(timespec='seconds'), environment, self._git_revision()))
+        self.run_id = cursor.lastrowid
+        logging.info(f"{self.__class__.__name__}: Recording run {self.run_id} to {self.path}")
+        return self.run_id
+
+    @staticmethod
+    def _git_revision() -> Optional[str]:
+        try:
+            result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                                    capture_output=True, text=True, timeout=5)
+        except (OSError, subprocess.SubprocessError):
+            return None
+        return result.stdout.strip() or None
+
+    def save(self, df: pd.DataFrame, metrics):
+        """Store the given metric columns of a metrics DataFrame under the current run."""
+        if df.empty:
+            return
+        id_columns = [column for column in ('case_id', 'function_name', 'round', 'user', 'profile') if column in df]
+        long_df = df.melt(id_vars=id_columns, value_vars=[column for column in metrics if column in df],
+                          var_name='metric', value_name='value').dropna(subset=['value'])
+        if 'function_name' not in long_df:
+            long_df['function_name'] = None
+        if 'profile' not in long_df:
+            long_df['profile'] = 'none'
+        rows = long_df[['case_id', 'function_name', 'round', 'user', 'profile', 'metric', 'value']].itertuples(index=False)
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO metrics (run_id, case_id, function_name, round, user, profile, metric, value) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                ((self.run_id, row.case_id, row.function_name, int(row.round), int(row.user), row.profile, row.metric,
+                  float(row.value)) for row in rows))
+
+    def find_baseline_run(self, case_id: str, environment: str, baseline='previous', profile: str = 'none') -> Optional[int]:
+        """
+        The run to compare against: a pinned run id, or the latest earlier run of the case in the
+        environment with the same throttling profile.
+        """
+        if baseline not in (None, '', 'previous'):
+            return int(baseline)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT MAX(r.run_id) FROM runs r JOIN metrics m ON m.run_id = r.run_id "
+                "WHERE m.case_id = ? AND m.profile = ? AND r.environment = ? AND r.run_id != ?",
+                (case_id, profile, environment, self.run_id or -1)).fetchone()
+        return row[0] if row else None
+
+    def load(self, run_id: int, case_id: str, metric: str, profile: str = 'none') -> pd.DataFrame:
+        with self._lock:
+            df = pd.read_sql_query(
+                "SELECT function_name, round, user, value FROM metrics "
+                "WHERE run_id = ? AND case_id = ? AND metric = ? AND profile = ?",
+                self._connection, params=(run_id, case_id, metric, profile))
+        return df.rename(columns={'value': metric})
+
+    def describe_run(self, run_id: int) -> str:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT started_at, git_revision FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        if row is None:
+            return f"run {run_id}"
+        return f"run {run_id} ({row[0]}" + (f", {row[1]})" if row[1] else ")")
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
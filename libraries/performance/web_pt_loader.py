@@ -3,6 +3,7 @@ import logging
 import pandas as pd
 import os
 from typing import Dict, List
+from libraries.performance.web_pt_throttling import ThrottlingProfiles
 
 
 class PerformanceTestLoader:
@@ -38,6 +39,7 @@ class PerformanceTestLoader:
         self._validate_locators()
         self._validate_web_environments()
         self._validate_custom_actions()
+        self._validate_throttling_profiles()
 
     def _validate_test_cases(self):
         test_cases = self.get_data_by_sheet_name('TestCases')
@@ -159,6 +161,17 @@ class PerformanceTestLoader:
 
         logging.info("PerformanceTestLoader: WebEnvironments data validation completed.")
 
+    def _validate_throttling_profiles(self):
+        # Optional columns: ThrottlingProfile in WebEnvironments, Throttling Profile in TestCases
+        known_profiles = set(ThrottlingProfiles(self.test_config.get('throttling_profiles')).profiles)
+        for sheet_name, column in (('WebEnvironments', 'ThrottlingProfile'), ('TestCases', 'Throttling Profile')):
+            sheet = self.get_data_by_sheet_name(sheet_name)
+            if column not in sheet.columns:
+                continue
+            for index, profile in sheet[column].items():
+                if profile != '' and str(profile).strip() not in known_profiles:
+                    logging.error(f"PerformanceTestLoader: Unknown throttling profile '{profile}' in {sheet_name} row {index + 2}")
+
     def _validate_custom_actions(self):
         custom_actions = self.get_data_by_sheet_name('CustomActions')
         required_columns = ['Action Name', 'Description', 'Python Code']
@@ -0,0 +1,41 @@
+import logging
+from typing import Dict, Optional
+
+MEMORY_COUNTERS = ('used_MB', 'documents', 'nodes', 'js_event_listeners', 'gc_heap_MB')
+# function_name of the sample taken at the start of every round
+ROUND_START = 'Round Start'
+
+
+class MemoryCollector:
+    """
+    Samples the JS heap (performance.memory) and, through CDP, the DOM counters of the page:
+    documents, nodes and JS event listeners. A sample can force a garbage collection first and
+    read the collected heap size, which only keeps growing when something is really retained.
+    """
+
+    def __init__(self, driver, dom_counters: bool = True):
+        self.driver = driver
+        self.cdp_available = hasattr(driver, 'execute_cdp_cmd')
+        self.dom_counters = dom_counters and self.cdp_available
+
+    def sample(self, force_gc: bool = False) -> Optional[Dict]:
+        sample = dict.fromkeys(MEMORY_COUNTERS)
+        try:
+            js_memory = self.driver.execute_script("return window.performance.memory;")
+            if js_memory:
+                sample['used_MB'] = round(js_memory.get("usedJSHeapSize", 0) / (1024 * 1024), 2)
+
+            if self.dom_counters:
+                counters = self.driver.execute_cdp_cmd('Memory.getDOMCounters', {})
+                sample['documents'] = counters.get('documents')
+                sample['nodes'] = counters.get('nodes')
+                sample['js_event_listeners'] = counters.get('jsEventListeners')
+
+            if force_gc and self.cdp_available:
+                self.driver.execute_cdp_cmd('HeapProfiler.collectGarbage', {})
+                heap = self.driver.execute_cdp_cmd('Runtime.getHeapUsage', {})
+                sample['gc_heap_MB'] = round(heap['usedSize'] / (1024 * 1024), 2)
+        except Exception as e:
+            logging.error(f"{self.__class__.__name__}: Error sampling memory: {e}")
+
+        return sample if any(value is not None for value in sample.values()) else None
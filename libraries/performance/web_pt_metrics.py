@@ -0,0 +1,212 @@
+import csv
+import logging
+import math
+import os
+import threading
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from libraries.common.utility_helpers import PROJECT_ROOT
+from libraries.performance.web_pt_browser_timing import BrowserTimingCollector
+from libraries.performance.web_pt_memory import MEMORY_COUNTERS
+
+# Column types: 'i' integer, 'd' float (None is stored as NaN), 'c' categorical text
+RESPONSE_TIME_SCHEMA = {'round': 'i', 'case_id': 'c', 'user': 'i', 'profile': 'c', 'function_name': 'c', 'response_time': 'd'}
+MEMORY_USAGE_SCHEMA = {
+    'round': 'i', 'case_id': 'c', 'user': 'i', 'profile': 'c', 'function_name': 'c',
+    **{column: 'd' for column in MEMORY_COUNTERS}
+}
+BROWSER_TIMING_SCHEMA = {
+    'round': 'i', 'case_id': 'c', 'user': 'i', 'profile': 'c', 'function_name': 'c',
+    **{column: 'd' for column in BrowserTimingCollector.METRIC_COLUMNS}
+}
+
+
+class PercentileSketch:
+    """
+    Log-bucketed histogram (HDR style): every value is counted in a bucket whose bounds are within
+    relative_error of each other, so quantiles are answered in constant memory with that precision.
+    """
+
+    def __init__(self, relative_error: float = 0.01):
+        self.gamma = (1 + relative_error) / (1 - relative_error)
+        self._log_gamma = math.log(self.gamma)
+        self._buckets: Dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+
+    def add(self, value: float):
+        if value is None or math.isnan(value):
+            return
+        self.count += 1
+        if value <= 0:
+            self._zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if rank < seen:
+                # Midpoint of the bucket (gamma^(i-1), gamma^i]
+                return 2 * self.gamma ** index / (self.gamma + 1)
+        return 2 * self.gamma ** max(self._buckets) / (self.gamma + 1)
+
+
+class MetricSeries:
+    """Column-oriented rows kept in typed arrays; text columns are stored as codes into a label list."""
+
+    def __init__(self, name: str, schema: Dict[str, str]):
+        self.name = name
+        self.schema = schema
+        self._columns = {column: array('l' if kind in ('i', 'c') else 'd') for column, kind in schema.items()}
+        self._labels: Dict[str, List[str]] = {column: [] for column, kind in schema.items() if kind == 'c'}
+        self._codes: Dict[str, Dict[str, int]] = {column: {} for column in self._labels}
+
+    def __len__(self):
+        return len(self._columns['round'])
+
+    def append(self, row: Dict):
+        for column, kind in self.schema.items():
+            value = row.get(column)
+            if kind == 'c':
+                value = self._encode(column, value)
+            elif kind == 'i':
+                value = int(value)
+            else:
+                value = math.nan if value is None else float(value)
+            self._columns[column].append(value)
+
+    def _encode(self, column: str, label) -> int:
+        codes = self._codes[column]
+        label = str(label)
+        if label not in codes:
+            codes[label] = len(self._labels[column])
+            self._labels[column].append(label)
+        return codes[label]
+
+    def to_dataframe(self, case_id: Optional[str] = None) -> pd.DataFrame:
+        data = {}
+        for column, kind in self.schema.items():
+            values = self._columns[column]
+            if kind == 'c':
+                data[column] = pd.Categorical.from_codes(values, categories=self._labels[column]).astype(str) \
+                    if self._labels[column] else pd.Series(values, dtype=str)
+            else:
+                data[column] = pd.Series(values, dtype='int64' if kind == 'i' else 'float64')
+        df = pd.DataFrame(data)
+        if case_id is not None:
+            df = df[df['case_id'] == str(case_id)].reset_index(drop=True)
+        return df
+
+    def max_round(self, case_id: str, user: int) -> int:
+        df = self.to_dataframe(case_id)
+        rounds = df.loc[df['user'] == user, 'round']
+        return int(rounds.max()) if not rounds.empty else 0
+
+
+class WebPerformanceMetricStore:
+    """
+    Holds the metrics of a performance run and streams them to CSV as each round finishes.
+
+    Rows are buffered per virtual user and appended to reports/<series>_data.csv when that user
+    completes a round, so the files only contain whole rounds. With resume enabled the existing
+    files are loaded back and runs continue after the last completed round.
+    """
+
+    def __init__(self, output_dir: Optional[str] = None, resume: bool = False, relative_error: float = 0.01):
+        self.output_dir = output_dir or os.path.join(PROJECT_ROOT, 'reports')
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.relative_error = relative_error
+        self.series = {
+            'response_time': MetricSeries('response_time', RESPONSE_TIME_SCHEMA),
+            'memory_usage': MetricSeries('memory_usage', MEMORY_USAGE_SCHEMA),
+            'browser_timing': MetricSeries('browser_timing', BROWSER_TIMING_SCHEMA),
+        }
+        self._sketches: Dict[tuple, PercentileSketch] = {}
+        self._pending: Dict[int, Dict[str, List[Dict]]] = {}
+        self._lock = threading.Lock()
+
+        for name, series in self.series.items():
+            path = self.csv_path(name)
+            if resume and os.path.exists(path):
+                self._load(series, path)
+            else:
+                with open(path, 'w', newline='', encoding='utf-8') as f:
+                    csv.writer(f).writerow(series.schema)
+
+    def csv_path(self, name: str) -> str:
+        return os.path.join(self.output_dir, f"{name}_data.csv")
+
+    def _load(self, series: MetricSeries, path: str):
+        df = pd.read_csv(path)
+        for row in df.astype(object).where(df.notna(), None).to_dict('records'):
+            series.append(row)
+            if series.name == 'response_time':
+                self._sketch(row['case_id'], row['function_name']).add(row['response_time'])
+        logging.info(f"{self.__class__.__name__}: Resumed {len(series)} {series.name} rows from {path}")
+
+    def _sketch(self, case_id: str, function_name: str) -> PercentileSketch:
+        key = (str(case_id), function_name)
+        if key not in self._sketches:
+            self._sketches[key] = PercentileSketch(self.relative_error)
+        return self._sketches[key]
+
+    def record(self, name: str, row: Dict):
+        with self._lock:
+            self.series[name].append(row)
+            self._pending.setdefault(row['user'], {}).setdefault(name, []).append(row)
+            if name == 'response_time':
+                self._sketch(row['case_id'], row['function_name']).add(row['response_time'])
+
+    def complete_round(self, user: int):
+        """Append the user's buffered rows to the CSV files."""
+        with self._lock:
+            pending = self._pending.pop(user, {})
+            for name, rows in pending.items():
+                self._append_csv(self.series[name], rows)
+
+    def discard_round(self, user: int):
+        """Drop the user's buffered rows of a round that failed, so they are not written with the next round."""
+        with self._lock:
+            rows_by_series = self._pending.pop(user, {})
+        self._log_dropped(user, rows_by_series)
+
+    def flush(self):
+        """Drop the rows of rounds that did not finish, so a resumed run repeats those rounds."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for user, rows_by_series in pending.items():
+            self._log_dropped(user, rows_by_series)
+
+    def _log_dropped(self, user: int, rows_by_series: Dict[str, List[Dict]]):
+        dropped = sum(len(rows) for rows in rows_by_series.values())
+        if dropped:
+            logging.info(f"{self.__class__.__name__}: Dropped {dropped} rows of an unfinished round of user {user}")
+
+    def _append_csv(self, series: MetricSeries, rows: Iterable[Dict]):
+        with open(self.csv_path(series.name), 'a', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(series.schema), extrasaction='ignore')
+            writer.writerows(rows)
+
+    def completed_rounds(self, case_id: str, user: int) -> int:
+        with self._lock:
+            return max(series.max_round(case_id, user) for series in self.series.values())
+
+    def percentiles(self, case_id: str, function_name: str, quantiles=(0.5, 0.9, 0.95, 0.99)) -> Dict[float, Optional[float]]:
+        with self._lock:
+            sketch = self._sketches.get((str(case_id), function_name))
+            return {q: sketch.quantile(q) if sketch else None for q in quantiles}
+
+    def to_dataframe(self, name: str, case_id: Optional[str] = None) -> pd.DataFrame:
+        with self._lock:
+            return self.series[name].to_dataframe(case_id)
@@ -1,56 +1,57 @@
-import os
+import base64
+from html import escape
+from io import BytesIO
 
 import pandas as pd
-import matplotlib.pyplot as plt
-from io import BytesIO
-import base64
-import logging
-from libraries.common.utility_helpers import PROJECT_ROOT
+
+from libraries.performance.web_pt_statistics import PerformanceStatistics
+from libraries.performance.web_pt_memory import MEMORY_COUNTERS, ROUND_START
+from libraries.performance.web_pt_svg import SvgChartRenderer
 
 
 class WebPerformanceReporter:
-    def __init__(self, response_time_data, memory_usage_data):
+    """
+    Builds the charts and tables of a performance case as HTML fragments for the Robot log.
+
+    The svg backend renders inline SVG charts and HTML tables; the matplotlib backend renders
+    base64 PNG images as before and is only imported when used.
+    """
+
+    def __init__(self, response_time_data, memory_usage_data, browser_timing_data=None,
+                 chart_backend: str = 'svg', max_points: int = 1000):
         self.response_time_data = response_time_data
         self.memory_usage_data = memory_usage_data
+        self.browser_timing_data = browser_timing_data if browser_timing_data is not None else []
+        self.chart_backend = chart_backend
+        self.max_points = max_points
+        self.svg = SvgChartRenderer(max_points=max_points) if chart_backend == 'svg' else None
 
     def generate_memory_usage_chart(self, case_id, case_name):
         df = pd.DataFrame(self.memory_usage_data)
-        plt.figure(figsize=(15, 6))
-        plt.plot(df["round"], df["used_MB"], marker="o", label="Used Memory (MB)", color="blue")
-        plt.title(f"JavaScript Memory Usage Trend - Case ID: {case_id}, Case Name: {case_name}")
-        plt.xlabel("Round")
-        plt.ylabel("Memory (MB)")
-        plt.grid()
-        plt.legend()
-        return self._save_fig_as_base64()
+        if "function_name" in df:
+            df = df[df["function_name"] == ROUND_START]
+        if self._user_count(df) > 1:
+            series = {f"User {user} (MB)": (user_data["round"], user_data["used_MB"]) for user, user_data in df.groupby("user")}
+        else:
+            series = {"Used Memory (MB)": (df["round"], df["used_MB"])} if not df.empty else {}
+        return self._line_chart(f"JavaScript Memory Usage Trend - Case ID: {case_id}, Case Name: {case_name}",
+                                series, "Round", "Memory (MB)")
 
     def generate_response_time_statistics_chart(self, case_id, case_name):
         df = pd.DataFrame(self.response_time_data)
-        stats = df.groupby("function_name").agg({"response_time": ["mean", "max"]})
-        stats.columns = ["Avg", "Max"]
-        stats.reset_index(inplace=True)
-
-        stats.plot(kind="bar", x="function_name", figsize=(15, 6), colormap="coolwarm")
-        plt.title(f"Response Time Statistics - Case ID: {case_id}, Case Name: {case_name}")
-        plt.xlabel("Function Name")
-        plt.ylabel("Time (s)")
-        plt.grid(axis="y")
-        plt.xticks(rotation=45)
-        return self._save_fig_as_base64()
+        stats = df.groupby("function_name")["response_time"].agg(["mean", "max"])
+        return self._bar_chart(f"Response Time Statistics - Case ID: {case_id}, Case Name: {case_name}",
+                               list(stats.index), {"Avg": stats["mean"].values, "Max": stats["max"].values}, "Time (s)")
 
     def generate_response_time_trend_chart(self, case_id, case_name):
         df = pd.DataFrame(self.response_time_data)
-        plt.figure(figsize=(15, 6))
+        series = {}
         for func in df["function_name"].unique():
-            func_data = df[df["function_name"] == func]
-            plt.plot(func_data["round"], func_data["response_time"], marker="o", label=func)
-
-        plt.title(f"Response Time Trend - Case ID: {case_id}, Case Name: {case_name}")
-        plt.xlabel("Round")
-        plt.ylabel("Response Time (s)")
-        plt.legend(title="Function Names")
-        plt.grid()
-        return self._save_fig_as_base64()
+            # With several virtual users each round has one sample per user; plot their median
+            func_data = df[df["function_name"] == func].groupby("round", as_index=False)["response_time"].median()
+            series[func] = (func_data["round"], func_data["response_time"])
+        return self._line_chart(f"Response Time Trend - Case ID: {case_id}, Case Name: {case_name}",
+                                series, "Round", "Response Time (s)")
 
     def generate_response_time_statistics_table(self, case_id, case_name):
         df = pd.DataFrame(self.response_time_data)
@@ -68,33 +69,204 @@ class WebPerformanceReporter:
 
         stats.columns = ["Function Name", "Avg (s)", "Max (s)", "Min (s)",
                          "Median (s)", "P90 (s)", "P95 (s)", "P99 (s)"]
+        return self._table(f"Response Time Statistics Table - Case ID: {case_id}, Case Name: {case_name}", stats)
+
+    def generate_user_response_time_table(self, case_id, case_name):
+        df = pd.DataFrame(self.response_time_data)
+        stats = df.groupby(["user", "function_name"]).agg({
+            "response_time": [
+                "count",
+                lambda x: round(x.mean(), 2),
+                lambda x: round(x.median(), 2),
+                lambda x: round(x.quantile(0.9), 2),
+                lambda x: round(x.quantile(0.95), 2),
+                lambda x: round(x.max(), 2)
+            ]
+        }).reset_index()
+
+        stats.columns = ["User", "Function Name", "Samples", "Avg (s)", "Median (s)", "P90 (s)", "P95 (s)", "Max (s)"]
+        return self._table(f"Response Time per Virtual User - Case ID: {case_id}, Case Name: {case_name}", stats)
+
+    def has_multiple_users(self):
+        return self._user_count(pd.DataFrame(self.response_time_data)) > 1
+
+    @staticmethod
+    def _user_count(df):
+        return df["user"].nunique() if "user" in df else 1
+
+    def analyze_memory_growth(self, alpha=0.05, min_relative_growth=0.1):
+        """
+        Fit a Theil-Sen slope per round to every memory counter of every function and test it with a
+        one-sided Mann-Kendall test. A counter leaks when its upward trend is significant at alpha and
+        it grew by at least min_relative_growth over the run. Rows are sorted by growth, worst first.
+        """
+        df = pd.DataFrame(self.memory_usage_data)
+        columns = ["Function Name", "Counter", "Rounds", "Start", "End", "Slope/Round", "Growth", "p-value", "Leak"]
+        if df.empty or "function_name" not in df:
+            return pd.DataFrame(columns=columns)
+
+        rows = []
+        for function_name, function_data in df.groupby("function_name"):
+            for counter in MEMORY_COUNTERS:
+                # One value per round: the median over virtual users
+                series = function_data.groupby("round")[counter].median().dropna()
+                rounds = len(series)
+                if rounds < 4:
+                    continue
+                if rounds > self.max_points:
+                    # The pairwise tests are quadratic; long runs are reduced to bucket medians first
+                    buckets = pd.Series(range(rounds), index=series.index) * self.max_points // rounds
+                    series = series.groupby(buckets.values).agg("median").set_axis(
+                        series.index.to_series().groupby(buckets.values).median().values)
+                slope = PerformanceStatistics.theil_sen_slope(series.index, series.values)
+                _, p_value = PerformanceStatistics.mann_kendall(series.values)
+                start, end = series.iloc[0], series.iloc[-1]
+                total_growth = slope * (series.index[-1] - series.index[0])
+                growth = total_growth / start if start > 0 else (float("inf") if total_growth > 0 else 0.0)
+                rows.append({
+                    "Function Name": function_name,
+                    "Counter": counter,
+                    "Rounds": rounds,
+                    "Start": round(start, 2),
+                    "End": round(end, 2),
+                    "Slope/Round": round(slope, 3),
+                    "Growth": growth,
+                    "p-value": round(p_value, 4),
+                    "Leak": "YES" if p_value < alpha and slope > 0 and growth >= min_relative_growth else "no"
+                })
+
+        growth_df = pd.DataFrame(rows, columns=columns).sort_values("Growth", ascending=False).reset_index(drop=True)
+        growth_df["Growth"] = growth_df["Growth"].map(lambda value: f"{value:+.1%}")
+        return growth_df
+
+    def generate_memory_growth_table(self, growth, case_id, case_name):
+        return self._table(f"Worst Growing Memory Counters - Case ID: {case_id}, Case Name: {case_name}",
+                           growth, highlight_column="Leak")
+
+    def compare_with_baseline(self, baseline_data, alpha=0.05, min_relative_change=0.05):
+        """
+        Compare each function's response times with a baseline run using a one-sided Mann-Whitney U test.
+        A function regresses when the test is significant at alpha and its median grew by at least
+        min_relative_change, so tiny but consistent differences are not flagged.
+        """
+        current = pd.DataFrame(self.response_time_data)
+        baseline = pd.DataFrame(baseline_data)
+        rows = []
+        for function_name, current_times in current.groupby("function_name")["response_time"]:
+            baseline_times = baseline.loc[baseline["function_name"] == function_name, "response_time"]
+            if baseline_times.empty:
+                continue
+            _, p_value = PerformanceStatistics.mann_whitney_u(current_times, baseline_times)
+            baseline_median, current_median = baseline_times.median(), current_times.median()
+            change = (current_median - baseline_median) / baseline_median if baseline_median > 0 else 0.0
+            rows.append({
+                "Function Name": function_name,
+                "Baseline Median (s)": round(baseline_median, 2),
+                "Current Median (s)": round(current_median, 2),
+                "Change": f"{change:+.1%}",
+                "p-value": round(p_value, 4),
+                "Regression": "YES" if p_value < alpha and change >= min_relative_change else "no"
+            })
+        return pd.DataFrame(rows, columns=["Function Name", "Baseline Median (s)", "Current Median (s)",
+                                           "Change", "p-value", "Regression"])
+
+    def generate_regression_table(self, comparison, case_id, case_name, baseline_description):
+        return self._table(f"Comparison with {baseline_description} - Case ID: {case_id}, Case Name: {case_name}",
+                           comparison, highlight_column="Regression")
+
+    def generate_browser_timing_statistics_table(self, case_id, case_name):
+        df = pd.DataFrame(self.browser_timing_data)
+        columns = {
+            "browser_time_ms": "Browser (ms)",
+            "ttfb_ms": "TTFB (ms)",
+            "dom_content_loaded_ms": "DCL (ms)",
+            "load_event_ms": "Load (ms)",
+            "first_contentful_paint_ms": "FCP (ms)",
+            "lcp_ms": "LCP (ms)",
+            "long_task_ms": "Long Tasks (ms)",
+            "resource_count": "Resources",
+            "resource_transfer_kb": "Transfer (KB)"
+        }
+        stats = df.groupby("function_name")[list(columns)].median().round(1).fillna("-").reset_index()
+        stats = stats.rename(columns={"function_name": "Function Name", **columns})
+        return self._table(f"Browser Timing Medians - Case ID: {case_id}, Case Name: {case_name}", stats)
+
+    @staticmethod
+    def generate_trace_links_table(traces, case_id, case_name):
+        # Always HTML: the links to the trace files are relative to the Robot log in reports/
+        rows = "".join(
+            f'<tr><td>{trace["round"]}</td><td>{trace["user"]}</td><td>{escape(trace["function_name"])}</td>'
+            f'<td>{trace["response_time"]:.2f}</td><td>{escape(trace["profile"])}</td>'
+            f'<td><a href="{escape(trace["file"])}">{escape(trace["file"])}</a></td></tr>'
+            for trace in traces
+        )
+        return (f'<table border="1" style="border-collapse:collapse;font-size:12px">'
+                f'<caption style="font-weight:bold">{escape(f"Captured Traces - Case ID: {case_id}, Case Name: {case_name}")}</caption>'
+                f'<tr><th>Round</th><th>User</th><th>Function Name</th><th>Response Time (s)</th><th>Profile</th><th>Trace File</th></tr>'
+                f'{rows}</table>')
 
-        fig, ax = plt.subplots(figsize=(17, len(stats) * 0.4))
+    def _line_chart(self, title, series, x_label, y_label):
+        if self.svg:
+            return self.svg.line_chart(title, series, x_label, y_label)
+
+        plt = self._pyplot()
+        plt.figure(figsize=(15, 6))
+        for label, (x, y) in series.items():
+            x, y = SvgChartRenderer.downsample(x, y, self.max_points)
+            plt.plot(x, y, marker="o" if len(x) <= 200 else None, label=label)
+        plt.title(title)
+        plt.xlabel(x_label)
+        plt.ylabel(y_label)
+        plt.grid()
+        plt.legend()
+        return self._save_fig_as_img(title)
+
+    def _bar_chart(self, title, categories, groups, y_label):
+        if self.svg:
+            return self.svg.bar_chart(title, categories, groups, y_label)
+
+        plt = self._pyplot()
+        pd.DataFrame(groups, index=categories).plot(kind="bar", figsize=(15, 6), colormap="coolwarm")
+        plt.title(title)
+        plt.xlabel("Function Name")
+        plt.ylabel(y_label)
+        plt.grid(axis="y")
+        plt.xticks(rotation=45)
+        return self._save_fig_as_img(title)
+
+    def _table(self, title, df, highlight_column=None):
+        if self.svg:
+            return self.svg.table(title, df, highlight_column)
+
+        plt = self._pyplot()
+        fig, ax = plt.subplots(figsize=(17, max(len(df), 1) * 0.4))
         ax.axis("tight")
         ax.axis("off")
-        table = plt.table(cellText=stats.values, colLabels=stats.columns, cellLoc="center", loc="center")
+        table = plt.table(cellText=df.values, colLabels=df.columns, cellLoc="center", loc="center")
         table.auto_set_font_size(False)
         table.set_fontsize(8)
         table.scale(1.0, 1.3)
-        plt.title(f"Response Time Statistics Table - Case ID: {case_id}, Case Name: {case_name}", y=1.1)
-        return self._save_fig_as_base64()
-
-    def save_to_csv(self):
-        output_dir = os.path.join(PROJECT_ROOT, 'reports')
-        response_time_data_path = os.path.join(output_dir, 'response_time_data.csv')
-        memory_usage_data_path = os.path.join(output_dir, 'memory_usage_data.csv')
+        if highlight_column:
+            for row_index, flag in enumerate(df[highlight_column], start=1):
+                if flag == "YES":
+                    for col_index in range(len(df.columns)):
+                        table[row_index, col_index].set_facecolor("#f8d7da")
+        plt.title(title, y=1.1)
+        return self._save_fig_as_img(title)
 
-        if self.response_time_data:
-            response_time_df = pd.DataFrame(self.response_time_data)
-            response_time_df.to_csv(response_time_data_path, index=False)
-            logging.info("Response time data saved to 'response_time_data.csv'.")
+    @staticmethod
+    def _pyplot():
+        # Imported on first use: matplotlib is slow to import and only needed by this backend
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        return plt
 
-        if self.memory_usage_data:
-            memory_usage_df = pd.DataFrame(self.memory_usage_data)
-            memory_usage_df.to_csv(memory_usage_data_path, index=False)
-            logging.info("Memory usage data saved to 'memory_usage_data.csv'.")
+    def _save_fig_as_img(self, alt):
+        return f'<img src="data:image/png;base64,{self._save_fig_as_base64()}" alt="{escape(alt)}"/>'
 
     def _save_fig_as_base64(self):
+        plt = self._pyplot()
         buf = BytesIO()
         plt.savefig(buf, format="png", bbox_inches="tight")
         buf.seek(0)
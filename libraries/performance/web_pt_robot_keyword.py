@@ -24,17 +24,27 @@ class RobotFrameworkWebTester:
 
         report_data = self.tester.generate_reports(case_id)
 
-        logger.info('<h2>Memory Usage Trend Chart</h2>', html=True)
-        logger.info(f'<img src="data:image/png;base64,{report_data["memory_chart"]}" alt="Memory Usage Trend"/>', html=True)
-
-        logger.info('<h2>Response Time Statistics Chart</h2>', html=True)
-        logger.info(f'<img src="data:image/png;base64,{report_data["response_time_stats_chart"]}" alt="Response Time Statistics"/>', html=True)
-
-        logger.info('<h2>Response Time Trend Chart</h2>', html=True)
-        logger.info(f'<img src="data:image/png;base64,{report_data["response_time_trend_chart"]}" alt="Response Time Trend"/>', html=True)
-
-        logger.info('<h2>Response Time Statistics Table</h2>', html=True)
-        logger.info(f'<img src="data:image/png;base64,{report_data["response_time_table"]}" alt="Response Time Statistics Table"/>', html=True)
+        sections = [
+            ('memory_chart', 'Memory Usage Trend Chart'),
+            ('response_time_stats_chart', 'Response Time Statistics Chart'),
+            ('response_time_trend_chart', 'Response Time Trend Chart'),
+            ('response_time_table', 'Response Time Statistics Table'),
+            ('user_response_time_table', 'Response Time per Virtual User'),
+            ('browser_timing_table', 'Browser Timing Table'),
+            ('trace_table', 'Captured Traces'),
+            ('memory_growth_table', 'Memory Growth Analysis'),
+            ('regression_table', f'Comparison with {report_data["baseline"]}'),
+        ]
+        for key, heading in sections:
+            if report_data[key]:
+                logger.info(f'<h2>{heading}</h2>', html=True)
+                logger.info(report_data[key], html=True)
+
+        if report_data["memory_leaks"]:
+            logger.warn("Significant memory growth: " + ", ".join(f"{function_name}/{counter}" for function_name, counter in report_data["memory_leaks"]))
+
+        if report_data["regressions"] and self.tester.history_settings['fail_on_regression']:
+            raise AssertionError(f"Performance regression against {report_data['baseline']} in: {', '.join(report_data['regressions'])}")
 
 
     def finalize_and_close_tester(self):
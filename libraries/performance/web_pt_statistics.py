@@ -0,0 +1,96 @@
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class PerformanceStatistics:
+    """Statistics used to size performance runs and to compare them with earlier runs."""
+
+    @staticmethod
+    def bootstrap_median_ci(samples, confidence: float = 0.95, resamples: int = 1000,
+                            seed: Optional[int] = None) -> Tuple[float, float, float]:
+        """
+        Percentile bootstrap confidence interval of the median.
+
+        :return: (lower bound, median, upper bound)
+        """
+        samples = np.asarray(samples, dtype=float)
+        samples = samples[~np.isnan(samples)]
+        if samples.size == 0:
+            return np.nan, np.nan, np.nan
+        rng = np.random.default_rng(seed)
+        medians = np.median(rng.choice(samples, size=(resamples, samples.size), replace=True), axis=1)
+        alpha = (1 - confidence) / 2
+        lower, upper = np.quantile(medians, [alpha, 1 - alpha])
+        return float(lower), float(np.median(samples)), float(upper)
+
+    @staticmethod
+    def relative_width(lower: float, median: float, upper: float) -> float:
+        """Width of an interval relative to its median; zero-width intervals around zero count as converged."""
+        if upper - lower == 0:
+            return 0.0
+        return (upper - lower) / median if median > 0 else np.inf
+
+    @staticmethod
+    def mann_whitney_u(current, baseline) -> Tuple[float, float]:
+        """
+        One-sided Mann-Whitney U test of whether current values tend to be larger than baseline values,
+        using the normal approximation with tie correction.
+
+        :return: (U statistic of current, p-value)
+        """
+        current = np.asarray(current, dtype=float)
+        baseline = np.asarray(baseline, dtype=float)
+        current = current[~np.isnan(current)]
+        baseline = baseline[~np.isnan(baseline)]
+        n1, n2 = current.size, baseline.size
+        if n1 == 0 or n2 == 0:
+            return np.nan, np.nan
+
+        ranks = pd.Series(np.concatenate([current, baseline])).rank(method='average').to_numpy()
+        u = ranks[:n1].sum() - n1 * (n1 + 1) / 2
+
+        n = n1 + n2
+        _, tie_counts = np.unique(ranks, return_counts=True)
+        tie_term = (tie_counts ** 3 - tie_counts).sum() / (n * (n - 1))
+        sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term))
+        if sigma == 0:
+            return float(u), 1.0
+        # Continuity correction towards the mean
+        z = (u - n1 * n2 / 2 - 0.5) / sigma
+        return float(u), float(0.5 * math.erfc(z / math.sqrt(2)))
+
+    @staticmethod
+    def theil_sen_slope(x, y) -> float:
+        """Median of the slopes between all pairs of points; robust to outlier rounds."""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        i, j = np.triu_indices(x.size, k=1)
+        dx = x[j] - x[i]
+        valid = dx != 0
+        if not valid.any():
+            return np.nan
+        return float(np.median((y[j] - y[i])[valid] / dx[valid]))
+
+    @staticmethod
+    def mann_kendall(values) -> Tuple[float, float]:
+        """
+        One-sided Mann-Kendall test for an increasing trend in a series ordered by time,
+        using the normal approximation with tie correction.
+
+        :return: (S statistic, p-value)
+        """
+        values = np.asarray(values, dtype=float)
+        n = values.size
+        if n < 3:
+            return np.nan, np.nan
+        i, j = np.triu_indices(n, k=1)
+        s = float(np.sign(values[j] - values[i]).sum())
+        _, tie_counts = np.unique(values, return_counts=True)
+        variance = (n * (n - 1) * (2 * n + 5) - (tie_counts * (tie_counts - 1) * (2 * tie_counts + 5)).sum()) / 18
+        if variance <= 0:
+            return s, 1.0
+        z = (s - 1) / math.sqrt(variance) if s > 0 else (s + 1) / math.sqrt(variance) if s < 0 else 0.0
+        return s, float(0.5 * math.erfc(z / math.sqrt(2)))
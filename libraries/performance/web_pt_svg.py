@@ -0,0 +1,176 @@
+import math
+from html import escape
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+PALETTE = ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf')
+HIGHLIGHT_COLOR = '#f8d7da'
+
+
+class SvgChartRenderer:
+    """
+    Renders the performance report charts as inline SVG and the tables as HTML.
+
+    The markup is built directly from the metric arrays, without a plotting library, and line series
+    longer than max_points are downsampled with Largest-Triangle-Three-Buckets so long soak runs keep
+    their shape at a fixed size.
+    """
+
+    def __init__(self, width: int = 960, height: int = 360, max_points: int = 1000):
+        self.width = width
+        self.height = height
+        self.max_points = max_points
+        self.margin = {'left': 70, 'right': 20, 'top': 40, 'bottom': 70}
+
+    def line_chart(self, title: str, series: Dict[str, Tuple[Sequence, Sequence]], x_label: str, y_label: str) -> str:
+        series = {label: self.downsample(x, y, self.max_points) for label, (x, y) in series.items() if len(x)}
+        if not series:
+            return self._empty(title)
+        x_min, x_max = self._bounds(np.concatenate([x for x, _ in series.values()]))
+        y_min, y_max = self._bounds(np.concatenate([y for _, y in series.values()]), include_zero=True)
+
+        parts = self._axes(title, x_label, y_label, (x_min, x_max), (y_min, y_max))
+        for index, (label, (x, y)) in enumerate(series.items()):
+            points = " ".join(f"{self._sx(value, x_min, x_max):.1f},{self._sy(level, y_min, y_max):.1f}"
+                              for value, level in zip(x, y) if not math.isnan(level))
+            parts.append(f'<polyline fill="none" stroke="{PALETTE[index % len(PALETTE)]}" stroke-width="1.5" '
+                         f'points="{points}"><title>{escape(str(label))}</title></polyline>')
+        parts.extend(self._legend(list(series)))
+        return self._svg(parts)
+
+    def bar_chart(self, title: str, categories: List[str], groups: Dict[str, Sequence], y_label: str) -> str:
+        if not categories:
+            return self._empty(title)
+        values = np.concatenate([np.asarray(v, dtype=float) for v in groups.values()])
+        y_min, y_max = self._bounds(values, include_zero=True)
+
+        parts = self._axes(title, None, y_label, None, (y_min, y_max))
+        plot_width = self.width - self.margin['left'] - self.margin['right']
+        slot = plot_width / len(categories)
+        bar_width = slot * 0.8 / len(groups)
+        baseline = self._sy(0, y_min, y_max)
+        for category_index, category in enumerate(categories):
+            slot_x = self.margin['left'] + category_index * slot
+            for group_index, (label, group_values) in enumerate(groups.items()):
+                value = float(group_values[category_index])
+                top = self._sy(value, y_min, y_max)
+                x = slot_x + slot * 0.1 + group_index * bar_width
+                parts.append(f'<rect x="{x:.1f}" y="{min(top, baseline):.1f}" width="{bar_width:.1f}" '
+                             f'height="{abs(baseline - top):.1f}" fill="{PALETTE[group_index % len(PALETTE)]}">'
+                             f'<title>{escape(str(category))} {escape(str(label))}: {value:.2f}</title></rect>')
+            label_x = slot_x + slot / 2
+            label_y = self.height - self.margin['bottom'] + 14
+            parts.append(f'<text x="{label_x:.1f}" y="{label_y}" font-size="11" text-anchor="end" '
+                         f'transform="rotate(-30 {label_x:.1f} {label_y})">{escape(self._truncate(category))}</text>')
+        parts.extend(self._legend(list(groups)))
+        return self._svg(parts)
+
+    @staticmethod
+    def table(title: str, df: pd.DataFrame, highlight_column: Optional[str] = None, highlight_value: str = 'YES') -> str:
+        header = "".join(f'<th style="border:1px solid #ccc;padding:2px 6px">{escape(str(column))}</th>' for column in df.columns)
+        rows = []
+        for values in df.itertuples(index=False):
+            row = dict(zip(df.columns, values))
+            style = f' style="background:{HIGHLIGHT_COLOR}"' if highlight_column and row.get(highlight_column) == highlight_value else ''
+            cells = "".join(f'<td style="border:1px solid #ccc;padding:2px 6px;text-align:center">{escape(str(value))}</td>'
+                            for value in values)
+            rows.append(f'<tr{style}>{cells}</tr>')
+        return (f'<table style="border-collapse:collapse;font-size:12px"><caption style="font-weight:bold">{escape(title)}</caption>'
+                f'<tr>{header}</tr>{"".join(rows)}</table>')
+
+    @staticmethod
+    def downsample(x, y, max_points: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Largest-Triangle-Three-Buckets: keeps the points that preserve the visual shape of the line."""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        size = x.size
+        if max_points < 3 or size <= max_points:
+            return x, y
+
+        bucket_edges = np.linspace(1, size - 1, max_points - 1).astype(int)
+        sampled = [0]
+        for bucket in range(max_points - 2):
+            start, end = bucket_edges[bucket], bucket_edges[bucket + 1]
+            next_end = bucket_edges[bucket + 2] if bucket + 2 < len(bucket_edges) else size
+            next_x = x[end:next_end].mean() if next_end > end else x[-1]
+            next_y = y[end:next_end].mean() if next_end > end else y[-1]
+            previous = sampled[-1]
+            areas = np.abs((x[previous] - next_x) * (y[start:end] - y[previous])
+                           - (x[previous] - x[start:end]) * (next_y - y[previous]))
+            sampled.append(start + int(np.argmax(areas)) if areas.size else start)
+        sampled.append(size - 1)
+        return x[sampled], y[sampled]
+
+    def _axes(self, title: str, x_label: Optional[str], y_label: str,
+              x_bounds: Optional[Tuple[float, float]], y_bounds: Tuple[float, float]) -> List[str]:
+        left, top = self.margin['left'], self.margin['top']
+        right, bottom = self.width - self.margin['right'], self.height - self.margin['bottom']
+        parts = [
+            f'<text x="{self.width / 2:.0f}" y="20" font-size="14" font-weight="bold" text-anchor="middle">{escape(title)}</text>',
+            f'<text x="16" y="{(top + bottom) / 2:.0f}" font-size="12" text-anchor="middle" '
+            f'transform="rotate(-90 16 {(top + bottom) / 2:.0f})">{escape(y_label)}</text>',
+            f'<line x1="{left}" y1="{bottom}" x2="{right}" y2="{bottom}" stroke="#333"/>',
+            f'<line x1="{left}" y1="{top}" x2="{left}" y2="{bottom}" stroke="#333"/>',
+        ]
+        for tick in self._ticks(*y_bounds):
+            y = self._sy(tick, *y_bounds)
+            parts.append(f'<line x1="{left}" y1="{y:.1f}" x2="{right}" y2="{y:.1f}" stroke="#e5e5e5"/>')
+            parts.append(f'<text x="{left - 6}" y="{y + 4:.1f}" font-size="11" text-anchor="end">{tick:g}</text>')
+        if x_bounds:
+            for tick in self._ticks(*x_bounds):
+                x = self._sx(tick, *x_bounds)
+                parts.append(f'<text x="{x:.1f}" y="{bottom + 16}" font-size="11" text-anchor="middle">{tick:g}</text>')
+        if x_label:
+            parts.append(f'<text x="{(left + right) / 2:.0f}" y="{bottom + 36}" font-size="12" text-anchor="middle">{escape(x_label)}</text>')
+        return parts
+
+    def _legend(self, labels: List[str]) -> List[str]:
+        parts = []
+        x = self.margin['left']
+        y = self.height - 12
+        for index, label in enumerate(labels):
+            text = self._truncate(str(label))
+            parts.append(f'<rect x="{x}" y="{y - 9}" width="10" height="10" fill="{PALETTE[index % len(PALETTE)]}"/>')
+            parts.append(f'<text x="{x + 14}" y="{y}" font-size="11">{escape(text)}</text>')
+            x += 24 + 7 * len(text)
+        return parts
+
+    def _sx(self, value: float, low: float, high: float) -> float:
+        span = self.width - self.margin['left'] - self.margin['right']
+        return self.margin['left'] + (value - low) / (high - low) * span
+
+    def _sy(self, value: float, low: float, high: float) -> float:
+        span = self.height - self.margin['top'] - self.margin['bottom']
+        return self.height - self.margin['bottom'] - (value - low) / (high - low) * span
+
+    @staticmethod
+    def _bounds(values: np.ndarray, include_zero: bool = False) -> Tuple[float, float]:
+        values = values[~np.isnan(values)]
+        low, high = (float(values.min()), float(values.max())) if values.size else (0.0, 1.0)
+        if include_zero:
+            low, high = min(low, 0.0), max(high, 0.0)
+        if high == low:
+            high = low + 1
+        return low, high
+
+    @staticmethod
+    def _ticks(low: float, high: float, count: int = 5) -> List[float]:
+        raw_step = (high - low) / count
+        magnitude = 10 ** math.floor(math.log10(raw_step))
+        step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw_step)
+        first = math.ceil(low / step) * step
+        return [round(first + i * step, 10) for i in range(int((high - first) / step) + 1)]
+
+    @staticmethod
+    def _truncate(text: str, length: int = 24) -> str:
+        return text if len(text) <= length else text[:length - 1] + '…'
+
+    def _svg(self, parts: List[str]) -> str:
+        return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" height="{self.height}" '
+                f'viewBox="0 0 {self.width} {self.height}" font-family="sans-serif">{"".join(parts)}</svg>')
+
+    def _empty(self, title: str) -> str:
+        return self._svg([f'<text x="{self.width / 2:.0f}" y="{self.height / 2:.0f}" font-size="13" '
+                          f'text-anchor="middle">{escape(title)}: no data</text>'])
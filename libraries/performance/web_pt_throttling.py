@@ -0,0 +1,57 @@
+import logging
+from typing import Dict, Optional
+
+NO_THROTTLING = 'none'
+
+
+class ThrottlingProfiles:
+    """
+    Named network and CPU throttling profiles, applied to a Chromium browser through CDP.
+
+    A profile may set latency_ms, download_kbps, upload_kbps, offline and cpu_slowdown; anything
+    left out is not throttled. Profiles from the throttling_profiles config section are added to,
+    or override, the built-in ones.
+    """
+    BUILTIN_PROFILES = {
+        NO_THROTTLING: {},
+        '3G': {'latency_ms': 300, 'download_kbps': 750, 'upload_kbps': 250},
+        'slow-4G': {'latency_ms': 150, 'download_kbps': 1600, 'upload_kbps': 750},
+        'office-wifi': {'latency_ms': 20, 'download_kbps': 30000, 'upload_kbps': 15000},
+        '4x CPU slowdown': {'cpu_slowdown': 4},
+    }
+
+    def __init__(self, custom_profiles: Optional[Dict] = None):
+        self.profiles = {**self.BUILTIN_PROFILES, **(custom_profiles or {})}
+
+    def resolve(self, name) -> str:
+        name = str(name).strip() if name is not None else ''
+        if not name:
+            return NO_THROTTLING
+        if name not in self.profiles:
+            raise ValueError(f"Unknown throttling profile '{name}', available: {', '.join(self.profiles)}")
+        return name
+
+    def apply(self, driver, name: str):
+        profile = self.profiles[name]
+        if not hasattr(driver, 'execute_cdp_cmd'):
+            if profile:
+                logging.warning(f"{self.__class__.__name__}: Browser does not support CDP, profile '{name}' not applied")
+            return
+
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.emulateNetworkConditions', {
+            'offline': bool(profile.get('offline', False)),
+            'latency': float(profile.get('latency_ms', 0)),
+            # CDP expects bytes per second; -1 disables throttling
+            'downloadThroughput': self._bytes_per_second(profile.get('download_kbps')),
+            'uploadThroughput': self._bytes_per_second(profile.get('upload_kbps')),
+        })
+        driver.execute_cdp_cmd('Emulation.setCPUThrottlingRate', {'rate': float(profile.get('cpu_slowdown', 1))})
+        logging.info(f"{self.__class__.__name__}: Applied throttling profile '{name}': {profile or 'no throttling'}")
+
+    def reset(self, driver):
+        self.apply(driver, NO_THROTTLING)
+
+    @staticmethod
+    def _bytes_per_second(kbps) -> float:
+        return float(kbps) * 1000 / 8 if kbps else -1
@@ -0,0 +1,87 @@
+import gzip
+import json
+import logging
+import os
+import re
+from typing import Optional
+
+from libraries.common.utility_helpers import PROJECT_ROOT
+
+DEFAULT_TRACE_CATEGORIES = [
+    'devtools.timeline',
+    'disabled-by-default-devtools.timeline',
+    'disabled-by-default-devtools.timeline.frame',
+    'disabled-by-default-devtools.timeline.stack',
+    'v8.execute',
+    'blink.user_timing',
+    'loading',
+    'latencyInfo',
+    'toplevel',
+]
+
+
+class TraceRecorder:
+    """
+    Saves Chrome traces of measured operations as gzipped trace files under reports/traces.
+
+    ChromeDriver records the trace categories configured in perfLoggingPrefs and hands the events
+    out through the performance log, since Selenium cannot receive the Tracing.dataCollected events
+    of a Tracing.start/end session itself. The log is drained before an operation, and what was
+    recorded during it is written out always, or only when the operation exceeded the threshold.
+    The files open in chrome://tracing, Perfetto or the DevTools Performance panel.
+    """
+
+    def __init__(self, driver, mode: str = 'threshold', threshold_seconds: float = 3.0, max_files: int = 100):
+        self.driver = driver
+        self.mode = mode
+        self.threshold_seconds = threshold_seconds
+        self.max_files = max_files
+        self.reports_dir = os.path.join(PROJECT_ROOT, 'reports')
+        self.output_dir = os.path.join(self.reports_dir, 'traces')
+        self.enabled = True
+        self.saved_files = 0
+        os.makedirs(self.output_dir, exist_ok=True)
+
+    def begin(self):
+        """Discard everything recorded before the operation."""
+        self._read_log()
+
+    def end(self, name: str, response_time: float) -> Optional[str]:
+        """
+        Collect the operation's trace events and save them if the mode asks for it.
+
+        :return: Path of the trace file relative to the reports directory, or None
+        """
+        entries = self._read_log()
+        if not entries:
+            return None
+        if self.mode != 'always' and response_time < self.threshold_seconds:
+            return None
+        if self.max_files and self.saved_files >= self.max_files:
+            logging.warning(f"{self.__class__.__name__}: Trace limit of {self.max_files} files reached, {name} not saved")
+            return None
+
+        events = []
+        for entry in entries:
+            message = json.loads(entry['message'])['message']
+            if message.get('method') == 'Tracing.dataCollected':
+                events.append(message['params'])
+        if not events:
+            return None
+
+        file_name = re.sub(r'[^\w.-]+', '_', name) + '.json.gz'
+        with gzip.open(os.path.join(self.output_dir, file_name), 'wt', encoding='utf-8') as f:
+            json.dump({'traceEvents': events}, f)
+        self.saved_files += 1
+        logging.info(f"{self.__class__.__name__}: Saved {len(events)} trace events of {name} ({response_time:.2f}s) to traces/{file_name}")
+        return f"traces/{file_name}"
+
+    def _read_log(self):
+        if not self.enabled:
+            return []
+        try:
+            return self.driver.get_log('performance')
+        except Exception as e:
+            self.enabled = False
+            logging.warning(f"{self.__class__.__name__}: Performance log not available, tracing disabled: {e}")
+            return []
@@ -1,4 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import List
+
+ISOLATION_SCOPES = ('off', 'test', 'suite')
+
 
 class RobotCaseGenerator(ABC):
     @abstractmethod
@@ -19,4 +23,19 @@ class RobotCaseGenerator(ABC):
 
     @abstractmethod
     def create_test_steps(self, robot_test, test_steps, data_set):
-        pass
\ No newline at end of file
+        pass
+
+    def _database_isolation_scope(self) -> str:
+        scope = str(self.test_config.get('database_isolation') or 'off').lower()
+        if scope not in ISOLATION_SCOPES:
+            raise ValueError(f"Invalid database_isolation '{scope}', expected one of: {', '.join(ISOLATION_SCOPES)}")
+        return scope
+
+    @staticmethod
+    def _configure_fixture(fixture, keywords: List[str]):
+        # A setup or teardown takes a single keyword; several are chained with Run Keywords
+        if len(keywords) == 1:
+            fixture.config(name=keywords[0], args=[])
+        elif keywords:
+            args = [arg for keyword in keywords for arg in ('AND', keyword)][1:]
+            fixture.config(name='Run Keywords', args=args)
\ No newline at end of file
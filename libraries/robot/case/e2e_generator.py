@@ -84,6 +84,9 @@ class E2ERobotCaseGenerator(RobotCaseGenerator):
                 if suite_name not in [suite.name for suite in self.robot_suite.suites]:
                     self.main_suite = self.robot_suite.suites.create(name=suite_name)
                     self._import_required_libraries(self.main_suite)
+                    if self._database_isolation_scope() == 'suite':
+                        self.main_suite.setup.config(name='begin_database_isolation', args=[])
+                        self.main_suite.teardown.config(name='rollback_database_isolation', args=[])
                 else:
                     self.main_suite = next(suite for suite in self.robot_suite.suites if suite.name == suite_name)
 
@@ -97,7 +100,7 @@ class E2ERobotCaseGenerator(RobotCaseGenerator):
 
                 self.create_test_case(self.case_suite, test_case)
 
-            self.robot_suite.teardown.config(name='close_browser', args=[])
+            self._configure_fixture(self.robot_suite.teardown, ['close_browser', 'log_database_statistics'])
             return self.robot_suite
         except Exception as e:
             logging.error(f"{self.__class__.__name__}: Error creating test suite: {str(e)}")
@@ -118,6 +121,13 @@ class E2ERobotCaseGenerator(RobotCaseGenerator):
                 test_name = f"{case_id}.{data_set_index}"
                 robot_test = suite.tests.create(name=test_name, doc=test_case['Descriptions'])
                 robot_test.body.create_keyword(name='sanity_check', args=[])
+                teardown = []
+                if self._database_isolation_scope() == 'test':
+                    robot_test.setup.config(name='begin_database_isolation', args=[])
+                    teardown.append('rollback_database_isolation')
+                if (self.test_config.get('webdriver_pool') or {}).get('enabled', False):
+                    teardown.append('release_browser')
+                self._configure_fixture(robot_test.teardown, teardown)
 
                 if 'Tags' in test_case and pd.notna(test_case['Tags']):
                     tags = [tag.strip() for tag in test_case['Tags'].split(',')]
@@ -142,7 +152,7 @@ class E2ERobotCaseGenerator(RobotCaseGenerator):
                     if module_name == 'API':
                         self._generate_api_step(step, robot_test)
                     else:
-                        self._generate_ui_step(robot_test, page_name, module_name, data_set)
+                        self._generate_ui_step(robot_test, page_name, module_name, data_set, step.get('Checkpoint', ''))
 
         except Exception as e:
             logging.error(f"{self.__class__.__name__}: Error creating test steps: {str(e)}")
@@ -168,10 +178,11 @@ class E2ERobotCaseGenerator(RobotCaseGenerator):
             logging.error(f"{self.__class__.__name__}: Error generating API step: {str(e)}")
             raise
 
-    def _generate_ui_step(self, robot_test, page_name: str, module_name: str, params: Dict):
+    def _generate_ui_step(self, robot_test, page_name: str, module_name: str, params: Dict, checkpoint: str = ''):
         """Generate UI test steps"""
         try:
-            robot_test.body.create_keyword(name='execute_module', args=[page_name, module_name, params])
+            args = [page_name, module_name, params, checkpoint] if checkpoint else [page_name, module_name, params]
+            robot_test.body.create_keyword(name='execute_module', args=args)
         except Exception as e:
             logging.error(f"{self.__class__.__name__}: Error generating UI step for {page_name}.{module_name}: {str(e)}")
             raise
\ No newline at end of file
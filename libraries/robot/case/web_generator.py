@@ -70,9 +70,12 @@ class WebRobotCaseGenerator(RobotCaseGenerator):
                 if suite_name not in [suite.name for suite in self.robot_suite.suites]:
                     sub_suite = self.robot_suite.suites.create(name=suite_name)
                     self._import_required_libraries(sub_suite)
+                    if self._database_isolation_scope() == 'suite':
+                        sub_suite.setup.config(name='begin_database_isolation', args=[])
+                        sub_suite.teardown.config(name='rollback_database_isolation', args=[])
                 self.create_test_case(sub_suite, test_case)
 
-            self.robot_suite.teardown.config(name='close_browser', args=[])
+            self._configure_fixture(self.robot_suite.teardown, ['close_browser', 'log_database_statistics'])
             return self.robot_suite
         except Exception as e:
             logging.error(f"{self.__class__.__name__}: Error creating test suite: {str(e)}")
@@ -92,6 +95,13 @@ class WebRobotCaseGenerator(RobotCaseGenerator):
                 test_name = f"UI.{case_id}.{data_set_index}"
                 robot_test = suite.tests.create(name=test_name, doc=test_case['Descriptions'])
                 robot_test.body.create_keyword(name='sanity_check', args=[])
+                teardown = []
+                if self._database_isolation_scope() == 'test':
+                    robot_test.setup.config(name='begin_database_isolation', args=[])
+                    teardown.append('rollback_database_isolation')
+                if (self.test_config.get('webdriver_pool') or {}).get('enabled', False):
+                    teardown.append('release_browser')
+                self._configure_fixture(robot_test.teardown, teardown)
 
                 if 'Tags' in test_case and pd.notna(test_case['Tags']):
                     tags = [tag.strip() for tag in test_case['Tags'].split(',')]
@@ -111,7 +121,7 @@ class WebRobotCaseGenerator(RobotCaseGenerator):
                 if step['Run'] == 'Y':
                     page_name = step['Page Name']
                     module_name = step['Module Name']
-                    self._generate_ui_step(robot_test, page_name, module_name, data_set)
+                    self._generate_ui_step(robot_test, page_name, module_name, data_set, step.get('Checkpoint', ''))
 
         except Exception as e:
             logging.error(f"{self.__class__.__name__}: Error creating test steps: {str(e)}")
@@ -124,9 +134,10 @@ class WebRobotCaseGenerator(RobotCaseGenerator):
             logging.error(f"{self.__class__.__name__}: Error importing required libraries: {str(e)}")
             raise
 
-    def _generate_ui_step(self, robot_test, page_name: str, module_name: str, params: Dict):
+    def _generate_ui_step(self, robot_test, page_name: str, module_name: str, params: Dict, checkpoint: str = ''):
         try:
-            robot_test.body.create_keyword(name='execute_module', args=[page_name, module_name, params])
+            args = [page_name, module_name, params, checkpoint] if checkpoint else [page_name, module_name, params]
+            robot_test.body.create_keyword(name='execute_module', args=args)
         except Exception as e:
             logging.error(f"{self.__class__.__name__}: Error generating UI step for {page_name}.{module_name}: {str(e)}")
             raise
\ No newline at end of file
@@ -13,6 +13,10 @@ from libraries.common.utility_helpers import PROJECT_ROOT
 from libraries.common.config_manager import ConfigManager
 from libraries.web.web_test_loader import WebTestLoader
 from libraries.web.webdriver_factory import WebDriverFactory
+from libraries.web.webdriver_pool import WebDriverPool
+from libraries.web.session_checkpoint import SessionCheckpointStore
+from libraries.web.web_action.screenshot_store import ScreenshotStore
+from libraries.web.web_action.utils_actions import UtilsActions
 from libraries.robot.custom_action_executor import CustomActionExecutor
 from robot.libraries.BuiltIn import BuiltIn
 from libraries.db.db_operator import DBOperator
@@ -22,33 +26,56 @@ builtin_lib = BuiltIn()
 
 class WebDriverSingleton:
     _instance = None
+    _pool = None
 
     @classmethod
-    def get_instance(cls, driver_config=None):
+    def get_instance(cls, driver_config=None, pool_settings=None):
         logging.info("WebDriverSingleton: Getting WebDriver instance")
         if cls._instance is None:
             if driver_config is None:
                 raise ValueError("WebDriverSingleton: Config path must be provided when creating the first instance")
-            cls._instance = WebDriverFactory.create_driver(driver_config)
-            logging.info("WebDriverSingleton: WebDriver instance created")
+            if WebDriverPool.is_enabled(pool_settings):
+                cls._pool = WebDriverPool.get_instance(driver_config, pool_settings)
+                cls._instance = cls._pool.acquire()
+                logging.info("WebDriverSingleton: WebDriver instance leased from pool")
+            else:
+                cls._instance = WebDriverFactory.create_driver(driver_config)
+                logging.info("WebDriverSingleton: WebDriver instance created")
         return cls._instance
 
+    @classmethod
+    def release(cls):
+        """Return a pooled driver so the next test leases a clean browser."""
+        if cls._instance and cls._pool:
+            cls._pool.release(cls._instance)
+            cls._instance = None
+            logging.info("WebDriverSingleton: WebDriver instance returned to pool")
+
     @classmethod
     def quit(cls):
-        if cls._instance:
+        if cls._pool:
+            cls.release()
+            cls._pool.shutdown()
+            cls._pool = None
+        elif cls._instance:
             cls._instance.close()
             cls._instance = None
             logging.info("WebDriverSingleton: WebDriver instance closed")
 
 
 class RobotTestExecutor:
+    ROBOT_LISTENER_API_VERSION = 3
+
     def __init__(self, test_config_path: str = None, test_cases_path: str = None):
+        # Registered as its own listener to scope restored checkpoints to a test
+        self.ROBOT_LIBRARY_LISTENER = self
         self.project_root = PROJECT_ROOT
         self.test_config_path = test_config_path or os.path.join(self.project_root, 'configs', 'web_test_config.yaml')
         self.test_cases_path = test_cases_path or os.path.join(self.project_root, 'test_cases', 'web_test_cases.xlsx')
 
         self._web_actions_instance = None
         self._driver = None
+        self._restored_checkpoints = []
         self._load_configuration()
         self._initialize_components()
         self.database_operator = DBOperator(self.active_db_configs)
@@ -123,6 +150,10 @@ class RobotTestExecutor:
                 self.web_test_loader.get_custom_actions()
             )
             self.saved_fields_manager = SavedFieldsManager()
+            # Configure background screenshot encoding
+            ScreenshotStore.get_instance(self.test_config.get('screenshot'))
+            SessionCheckpointStore.configure(self.test_config.get('session_checkpoint'))
+            UtilsActions.configure_highlight(self.test_config.get('highlight', True))
             # Load saved fields and set variables
             self.saved_fields_manager.load_saved_fields_and_set_robot_global_variables()
         except Exception as e:
@@ -140,7 +171,7 @@ class RobotTestExecutor:
         if self._web_actions_instance is None:
             if self._driver is None:
                 active_env_config = self.env_config['environments'][self.test_config['active_environment']]
-                self._driver = WebDriverSingleton.get_instance(active_env_config)
+                self._driver = WebDriverSingleton.get_instance(active_env_config, self.test_config.get('webdriver_pool'))
                 logging.info(f"{self.__class__.__name__}: Driver initialized lazily for web_actions.")
             self._web_actions_instance = WebActions(self._driver)
             logging.info(f"{self.__class__.__name__}: WebElementActions initialized.")
@@ -172,9 +203,46 @@ class RobotTestExecutor:
         """设置环境变量为Robot Framework全局变量"""
         self.web_test_loader.set_global_variables()
 
+    @keyword
+    def release_browser(self):
+        ScreenshotStore.get_instance().flush()
+        WebDriverSingleton.release()
+        self._forget_browser()
+
     @keyword
     def close_browser(self):
+        ScreenshotStore.get_instance().flush()
         WebDriverSingleton.quit()
+        self._forget_browser()
+
+    def _forget_browser(self):
+        # The next web_actions access leases a browser again
+        self._driver = None
+        self._web_actions_instance = None
+
+    @keyword
+    def begin_database_isolation(self):
+        self.database_operator.begin_isolation()
+
+    @keyword
+    def rollback_database_isolation(self):
+        self.database_operator.rollback_isolation()
+
+    @keyword
+    def log_database_statistics(self):
+        self.database_operator.log_pool_statistics()
+        self.database_operator.log_consistency_statistics()
+
+    def _start_test(self, data, result):
+        self._restored_checkpoints = []
+
+    def _end_test(self, data, result):
+        if result.status != 'FAIL':
+            return
+        # A restored session may be the reason for the failure, whichever step failed, so don't hand it out again
+        for checkpoint_key in self._restored_checkpoints:
+            SessionCheckpointStore.invalidate(checkpoint_key, f"test {result.name} failed")
+        self._restored_checkpoints = []
 
     @keyword
     def sanity_check(self) -> None:
@@ -185,8 +253,28 @@ class RobotTestExecutor:
             logging.info(f"{self.__class__.__name__}: Sanity check succeeded, continuing with the test.")
 
     @keyword
-    def execute_module(self, page_name: str, module_name: str, data_set: Dict = None):
+    def execute_module(self, page_name: str, module_name: str, data_set: Dict = None, checkpoint: str = None):
+        if not checkpoint:
+            self._execute_module_actions(page_name, module_name, data_set)
+            return
+
+        module_params = [self._extract_parameters(data_set, action_info['parameter_names']) for action_info in self.page_modules[page_name][module_name]]
+        checkpoint_key = SessionCheckpointStore.make_key(checkpoint, page_name, module_name, module_params)
+        driver = self.web_actions.driver
+        if not SessionCheckpointStore.is_supported(driver):
+            logging.info(f"{self.__class__.__name__}: Browser does not support CDP, replaying module {page_name}.{module_name} for checkpoint {checkpoint}")
+            self._execute_module_actions(page_name, module_name, data_set)
+            return
 
+        if SessionCheckpointStore.restore(driver, checkpoint_key):
+            self._restored_checkpoints.append(checkpoint_key)
+            logging.info(f"{self.__class__.__name__}: Skipped module {page_name}.{module_name}, restored checkpoint {checkpoint}")
+            return
+
+        self._execute_module_actions(page_name, module_name, data_set)
+        SessionCheckpointStore.capture(driver, checkpoint_key)
+
+    def _execute_module_actions(self, page_name: str, module_name: str, data_set: Dict = None):
         module_actions = self.page_modules[page_name][module_name]
 
         for action_info in module_actions:
@@ -215,29 +303,49 @@ class RobotTestExecutor:
             self.execute_action(action, locator, element_desc, *new_args, )
 
             if wait:
-                try:
-                    wait_time = float(wait)
-                    if wait_time > 0:
-                        self.execute_action('wait', locator, element_desc, wait_time)
-                except ValueError:
-                    logging.warning(f"Invalid wait value: {wait}. Skipping wait.")
-
-            if screen_capture:
+                self._execute_wait(wait, locator, element_desc)
+
+            if screen_capture == 'E' and locator:
+                self.execute_action('capture_element_screenshot', locator, element_desc, description)
+            elif screen_capture:
                 self.execute_action('capture_screenshot', locator, element_desc,description)
 
             logging.info("=" * 80)
 
+    def _execute_wait(self, wait, locator, element_desc):
+        """
+        Wait column: a number of seconds, or network_idle / dom_settled with optional
+        timeout and quiet window, e.g. network_idle:30:0.5
+        """
+        wait_name, *wait_args = [part.strip() for part in str(wait).split(':')]
+        if wait_name.lower() in ('network_idle', 'dom_settled'):
+            try:
+                wait_args = [float(arg) for arg in wait_args if arg]
+            except ValueError:
+                logging.warning(f"Invalid wait value: {wait}. Skipping wait.")
+                return
+            self.execute_action(f'wait_for_{wait_name.lower()}', locator, element_desc, *wait_args)
+            return
+        try:
+            wait_time = float(wait)
+            if wait_time > 0:
+                self.execute_action('wait', locator, element_desc, wait_time)
+        except ValueError:
+            logging.warning(f"Invalid wait value: {wait}. Skipping wait.")
+
     def execute_action(self, action_name, element, element_desc, *args, **kwargs):
         logging.debug(f"WebActionExecutor: Executing action '{action_name}' with element: {element}, args: {args}, kwargs: {kwargs}")
 
         db_actions = {
             "insert_data": self.database_operator.insert_data,
+            "bulk_insert_data": self.database_operator.bulk_insert_data,
             "update_data": self.database_operator.update_data,
             "delete_data": self.database_operator.delete_data,
         }
 
         if hasattr(self.web_actions, action_name):
             action = getattr(self.web_actions, action_name)
+            commands_before = self.web_actions.command_counter.count
 
             if 'locator' in action.__code__.co_varnames:
                 kwargs['element_desc'] = element_desc
@@ -249,7 +357,8 @@ class RobotTestExecutor:
             else:
                 raise ValueError(f"Action '{action_name}' requires a WebElement, but none was provided.")
 
-            logging.debug(f"WebActionExecutor: Action '{action_name}' executed successfully")
+            commands = self.web_actions.command_counter.count - commands_before
+            logging.debug(f"WebActionExecutor: Action '{action_name}' executed successfully with {commands} WebDriver commands")
             return result
         elif action_name in db_actions:
             db_actions[action_name](*args)
@@ -0,0 +1,127 @@
+import json
+import logging
+import time
+from typing import Dict, List, Optional
+
+CAPTURE_STORAGE_JS = """
+var dump = function (storage) {
+    var items = {};
+    for (var i = 0; i < storage.length; i++) {
+        var key = storage.key(i);
+        items[key] = storage.getItem(key);
+    }
+    return items;
+};
+return {
+    url: window.location.href,
+    origin: window.location.origin,
+    localStorage: dump(window.localStorage),
+    sessionStorage: dump(window.sessionStorage)
+};
+"""
+
+RESTORE_STORAGE_JS = """
+(function () {
+    var checkpoint = %s;
+    if (window.location.origin !== checkpoint.origin) {
+        return;
+    }
+    Object.keys(checkpoint.localStorage).forEach(function (key) {
+        window.localStorage.setItem(key, checkpoint.localStorage[key]);
+    });
+    Object.keys(checkpoint.sessionStorage).forEach(function (key) {
+        window.sessionStorage.setItem(key, checkpoint.sessionStorage[key]);
+    });
+})();
+"""
+
+
+class SessionCheckpointStore:
+    """
+    Process wide store of browser session checkpoints (cookies, localStorage, sessionStorage).
+
+    A checkpoint is captured after the module that declares it has run, and later steps declaring
+    the same checkpoint restore it through CDP instead of replaying the module. Checkpoints expire
+    after ttl_seconds or when one of their cookies expires, and are dropped when a restore fails.
+    """
+    _checkpoints: Dict[str, Dict] = {}
+    ttl_seconds = 900
+
+    @classmethod
+    def configure(cls, settings: Optional[Dict] = None):
+        if settings and settings.get('ttl_seconds') is not None:
+            cls.ttl_seconds = float(settings['ttl_seconds'])
+
+    @classmethod
+    def reset(cls):
+        cls._checkpoints.clear()
+
+    @staticmethod
+    def make_key(checkpoint: str, page_name: str, module_name: str, parameters: List) -> str:
+        # The module's own parameters are part of the key, so each user/credential gets its own session
+        return json.dumps([checkpoint, page_name, module_name, parameters], sort_keys=True, default=str)
+
+    @staticmethod
+    def is_supported(driver) -> bool:
+        return hasattr(driver, 'execute_cdp_cmd')
+
+    @classmethod
+    def capture(cls, driver, key: str):
+        state = driver.execute_script(CAPTURE_STORAGE_JS)
+        state['cookies'] = driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']
+        state['created'] = time.time()
+        cls._checkpoints[key] = state
+        logging.info(f"{cls.__name__}: Captured checkpoint {key} with {len(state['cookies'])} cookies, "
+                     f"{len(state['localStorage'])} localStorage and {len(state['sessionStorage'])} sessionStorage items")
+
+    @classmethod
+    def get_valid(cls, key: str) -> Optional[Dict]:
+        state = cls._checkpoints.get(key)
+        if state is None:
+            return None
+
+        now = time.time()
+        expired = now - state['created'] > cls.ttl_seconds
+        # Session cookies report expires -1
+        cookie_expiry = [cookie['expires'] for cookie in state['cookies'] if cookie.get('expires', -1) > 0]
+        if not expired and cookie_expiry and min(cookie_expiry) <= now:
+            expired = True
+        if expired:
+            cls.invalidate(key, "expired")
+            return None
+        return state
+
+    @classmethod
+    def restore(cls, driver, key: str) -> bool:
+        """Restore a checkpoint into the driver; returns False if it has to be replayed instead."""
+        state = cls.get_valid(key)
+        if state is None:
+            return False
+
+        try:
+            cookies = [cls._to_cookie_param(cookie) for cookie in state['cookies']]
+            driver.execute_cdp_cmd('Network.setCookies', {'cookies': cookies})
+            storage = {'origin': state['origin'], 'localStorage': state['localStorage'], 'sessionStorage': state['sessionStorage']}
+            script = driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': RESTORE_STORAGE_JS % json.dumps(storage)})
+            try:
+                driver.get(state['url'])
+            finally:
+                driver.execute_cdp_cmd('Page.removeScriptToEvaluateOnNewDocument', {'identifier': script['identifier']})
+        except Exception as e:
+            cls.invalidate(key, f"restore failed: {str(e)}")
+            return False
+
+        logging.info(f"{cls.__name__}: Restored checkpoint {key} at {state['url']}")
+        return True
+
+    @staticmethod
+    def _to_cookie_param(cookie: Dict) -> Dict:
+        param = {k: cookie[k] for k in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite') if k in cookie}
+        if not cookie.get('session') and cookie.get('expires', -1) > 0:
+            param['expires'] = cookie['expires']
+        return param
+
+    @classmethod
+    def invalidate(cls, key: str, reason: str):
+        if cls._checkpoints.pop(key, None) is not None:
+            logging.info(f"{cls.__name__}: Invalidated checkpoint {key}, {reason}")
@@ -5,6 +5,52 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from libraries.web.web_action.table_verifier import TableVerifier
+from libraries.web.web_action.command_counter import WebDriverCommandCounter
+from libraries.web.web_action.js import element_description_script, wait_instrumentation_script
+
+
+class ElementDescription:
+    """
+    Describes a WebElement for log messages, e.g. <input id='user' class='form-control'> text='...'.
+
+    The description is only built when a log record is actually formatted, with a single
+    execute_script call, so pass it as a logging argument rather than into an f-string.
+    """
+
+    def __init__(self, driver: WebDriver, element: WebElement):
+        self.driver = driver
+        self.element = element
+        self._description = None
+
+    def __str__(self):
+        if self._description is None:
+            try:
+                info = self.driver.execute_script(element_description_script, self.element)
+                self._description = self._format(info)
+            except Exception:
+                self._description = f"<element {self.element.id}>"
+        return self._description
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+    @staticmethod
+    def _format(info):
+        description = f"<{info['tag']}"
+        if info['id']:
+            description += f" id='{info['id']}'"
+        if info['className']:
+            classes = info['className'].split()
+            if len(classes) > 2:
+                description += f" class='{' '.join(classes[:2])}...'"
+            else:
+                description += f" class='{info['className']}'"
+        if info['name']:
+            description += f" name='{info['name']}'"
+        description += ">"
+        if info['text']:
+            description += f" text='{info['text']}...'"
+        return description
 
 
 class Base:
@@ -12,31 +58,26 @@ class Base:
         self.driver = driver
         self.default_timeout = default_timeout
         self.table_verifier = TableVerifier(self.driver)
+        self.command_counter = WebDriverCommandCounter.attach(self.driver)
+
+    def _install_wait_instrumentation(self):
+        # Only drivers that use the smart waits pay for the instrumentation; from the first wait on,
+        # every new document is instrumented before its own scripts run
+        if getattr(self.driver, '_wait_instrumentation', None) is None:
+            if hasattr(self.driver, 'execute_cdp_cmd'):
+                self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': wait_instrumentation_script})
+                self.driver._wait_instrumentation = 'cdp'
+            else:
+                self.driver._wait_instrumentation = 'script'
+
+    def _instrument_current_document(self):
+        # Without CDP the document has to be instrumented after it is loaded
+        if getattr(self.driver, '_wait_instrumentation', None) == 'script':
+            self.driver.execute_script(wait_instrumentation_script)
 
     def _get_element_description(self, element):
         if isinstance(element, WebElement):
-            tag_name = element.tag_name
-            element_id = element.get_attribute('id')
-            element_class = element.get_attribute('class')
-            element_name = element.get_attribute('name')
-            element_text = element.text[:30] if element.text else ''
-
-            description = f"<{tag_name}"
-            if element_id:
-                description += f" id='{element_id}'"
-            if element_class:
-                classes = element_class.split()
-                if len(classes) > 2:
-                    description += f" class='{' '.join(classes[:2])}...'"
-                else:
-                    description += f" class='{element_class}'"
-            if element_name:
-                description += f" name='{element_name}'"
-            description += ">"
-            if element_text:
-                description += f" text='{element_text}...'"
-
-            return description
+            return ElementDescription(self.driver, element)
         elif isinstance(element, tuple):
             return f"locator: {element}"
         else:
@@ -67,7 +108,8 @@ class Base:
             else:
                 raise ValueError(f"{self.__class__.__name__}: Unsupported condition: {condition}")
 
-            element_desc = element_desc or self._get_element_description(result)
+            # Describe the locator rather than the found element, which would cost WebDriver calls on every lookup
+            element_desc = element_desc or self._get_element_description(locator)
             logging.info(f"{self.__class__.__name__}: Element found {element_desc} with locator {locator}, condition: {condition}.")
             return result
         except TimeoutException:
@@ -0,0 +1,29 @@
+import threading
+
+
+class WebDriverCommandCounter:
+    """
+    Counts the WebDriver commands a driver sends by wrapping its execute method.
+
+    WebElement calls go through their parent driver's execute, so element lookups,
+    .text reads and execute_script calls are all included.
+    """
+
+    def __init__(self, driver):
+        self.count = 0
+        self._lock = threading.Lock()
+        self._execute = driver.execute
+        driver.execute = self._counting_execute
+
+    @classmethod
+    def attach(cls, driver) -> 'WebDriverCommandCounter':
+        counter = getattr(driver, '_command_counter', None)
+        if counter is None:
+            counter = cls(driver)
+            driver._command_counter = counter
+        return counter
+
+    def _counting_execute(self, driver_command, params=None):
+        with self._lock:
+            self.count += 1
+        return self._execute(driver_command, params)
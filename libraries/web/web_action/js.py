@@ -37,3 +37,197 @@ click_by_js_script = '''
     }
     clickByJsFireEvent(arguments[0]);
 '''
+
+extract_table_script = '''
+    // Returns the trimmed text of every cell, row by row, in a single round trip.
+    // Tables without <tr> rows (e.g. virtual grids) are read through their ARIA roles.
+    // arguments[1]: false to only read, 'top' to scroll the grid back to its start, 'next' to read and scroll one page down.
+    var table = arguments[0];
+    var scroll = arguments[1];
+
+    var container = null;
+    if (scroll) {
+        var isScrollable = function (element) {
+            var overflowY = window.getComputedStyle(element).overflowY;
+            return element.scrollHeight > element.clientHeight && (overflowY === 'auto' || overflowY === 'scroll');
+        };
+        container = isScrollable(table) ? table : null;
+        var descendants = table.querySelectorAll('*');
+        for (var k = 0; !container && k < descendants.length; k++) {
+            if (isScrollable(descendants[k])) {
+                container = descendants[k];
+            }
+        }
+        for (var parent = table.parentElement; !container && parent && parent !== document.body; parent = parent.parentElement) {
+            if (isScrollable(parent)) {
+                container = parent;
+            }
+        }
+        container = container || document.scrollingElement;
+        if (scroll === 'top') {
+            container.scrollTop = 0;
+            return {rows: [], keys: [], tops: [], atEnd: false};
+        }
+    }
+
+    var rowElements = table.querySelectorAll('tr');
+    var cellSelector = 'th, td';
+    if (rowElements.length === 0) {
+        rowElements = table.querySelectorAll('[role="row"]');
+        cellSelector = '[role="columnheader"], [role="rowheader"], [role="gridcell"], [role="cell"]';
+    }
+
+    var rows = [];
+    var keys = [];
+    var tops = [];
+    var containerTop = container ? container.getBoundingClientRect().top : 0;
+    var scrollOffset = container && container !== document.scrollingElement ? container.scrollTop : 0;
+    for (var i = 0; i < rowElements.length; i++) {
+        var row = rowElements[i];
+        var cells = row.querySelectorAll(cellSelector);
+        var texts = [];
+        for (var j = 0; j < cells.length; j++) {
+            texts.push((cells[j].innerText || cells[j].textContent || '').trim());
+        }
+        rows.push(texts);
+        keys.push(row.getAttribute('aria-rowindex') || row.getAttribute('row-index') || row.getAttribute('data-row-index'));
+        // Position within the scrolled content, which stays the same while the grid scrolls
+        tops.push(container ? Math.round(row.getBoundingClientRect().top - containerTop + scrollOffset) : i);
+    }
+
+    var atEnd = true;
+    if (scroll) {
+        var before = container.scrollTop;
+        container.scrollTop = before + container.clientHeight;
+        atEnd = container.scrollTop === before;
+    }
+    return {rows: rows, keys: keys, tops: tops, atEnd: atEnd};
+'''
+
+click_page_control_script = '''
+    // Clicks a pagination control (e.g. "first" or "next"); returns false when it is missing or disabled.
+    var control = document.querySelector(arguments[0]);
+    if (!control || control.disabled || control.getAttribute('aria-disabled') === 'true' || /\\bdisabled\\b/.test(control.className)) {
+        return false;
+    }
+    control.click();
+    return true;
+'''
+
+table_cell_input_script = '''
+    // Rows and cells are looked up the same way as in extract_table_script, so indexes match the extracted data.
+    var rows = arguments[0].querySelectorAll('tr');
+    var cellSelector = 'th, td';
+    if (rows.length === 0) {
+        rows = arguments[0].querySelectorAll('[role="row"]');
+        cellSelector = '[role="columnheader"], [role="rowheader"], [role="gridcell"], [role="cell"]';
+    }
+    var cells = rows[arguments[1]].querySelectorAll(cellSelector);
+    return cells[arguments[2]].querySelector('input');
+'''
+
+element_description_script = '''
+    var element = arguments[0];
+    return {
+        tag: element.tagName.toLowerCase(),
+        id: element.id,
+        className: element.getAttribute('class'),
+        name: element.getAttribute('name'),
+        text: (element.innerText || '').substring(0, 30)
+    };
+'''
+
+highlight_script = '''
+    // Blinks the element with in-page timers and restores its style afterwards; returns immediately.
+    var element = arguments[0], blinks = arguments[1], highlightStyle = arguments[2];
+    if (element.__highlightTimer) {
+        clearInterval(element.__highlightTimer);
+        element.setAttribute('style', element.__originalStyle);
+    }
+    var originalStyle = element.getAttribute('style') || '';
+    var steps = blinks * 2, step = 0;
+    element.__originalStyle = originalStyle;
+    element.setAttribute('style', originalStyle + ';' + highlightStyle);
+    element.__highlightTimer = setInterval(function () {
+        step++;
+        if (step >= steps) {
+            clearInterval(element.__highlightTimer);
+            element.__highlightTimer = null;
+            element.setAttribute('style', originalStyle);
+            return;
+        }
+        element.setAttribute('style', step % 2 ? originalStyle : originalStyle + ';' + highlightStyle);
+    }, 250);
+'''
+
+wait_instrumentation_script = '''
+    // Tracks in-flight fetch/XHR requests and the time of the last DOM mutation for the smart waits.
+    (function () {
+        if (window.__waitState) {
+            return;
+        }
+        var state = window.__waitState = {inflight: 0, lastNetwork: Date.now(), lastMutation: Date.now()};
+        var begin = function () { state.inflight++; state.lastNetwork = Date.now(); };
+        var end = function () { state.inflight = Math.max(0, state.inflight - 1); state.lastNetwork = Date.now(); };
+
+        if (window.fetch) {
+            var originalFetch = window.fetch;
+            window.fetch = function () {
+                begin();
+                var request;
+                try {
+                    request = originalFetch.apply(this, arguments);
+                } catch (error) {
+                    end();
+                    throw error;
+                }
+                return request.then(
+                    function (response) { end(); return response; },
+                    function (error) { end(); throw error; });
+            };
+        }
+        var originalSend = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.send = function () {
+            begin();
+            var finished = false;
+            var finish = function () {
+                if (!finished) {
+                    finished = true;
+                    end();
+                }
+            };
+            this.addEventListener('loadend', finish);
+            try {
+                return originalSend.apply(this, arguments);
+            } catch (error) {
+                // e.g. send() on an unopened request throws without firing loadend
+                finish();
+                throw error;
+            }
+        };
+
+        var observe = function () {
+            new MutationObserver(function () { state.lastMutation = Date.now(); })
+                .observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+        };
+        if (document.documentElement) {
+            observe();
+        } else {
+            document.addEventListener('DOMContentLoaded', observe);
+        }
+    })();
+'''
+
+wait_state_script = '''
+    var state = window.__waitState;
+    if (!state) {
+        return null;
+    }
+    var now = Date.now();
+    return {
+        inflight: state.inflight,
+        networkQuiet: (now - state.lastNetwork) / 1000,
+        domQuiet: (now - state.lastMutation) / 1000,
+        readyState: document.readyState
+    };
+'''
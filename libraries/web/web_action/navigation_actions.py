@@ -6,21 +6,25 @@ class NavigationActions(Base):
         logging.info(f"{self.__class__.__name__}: Opening URL: {url}")
         # self.driver.maximize_window()
         self.driver.get(url)
+        self._instrument_current_document()
         logging.info(f"{self.__class__.__name__}: URL opened successfully: {url}")
 
     def refresh_page(self):
         logging.info(f"{self.__class__.__name__}: Refreshing the current page")
         self.driver.refresh()
+        self._instrument_current_document()
         logging.info(f"{self.__class__.__name__}: Page refreshed successfully")
 
     def go_back(self):
         logging.info(f"{self.__class__.__name__}: Navigating back in browser history")
         self.driver.back()
+        self._instrument_current_document()
         logging.info(f"{self.__class__.__name__}: Navigated back successfully")
 
     def go_forward(self):
         logging.info(f"{self.__class__.__name__}: Navigating forward in browser history")
         self.driver.forward()
+        self._instrument_current_document()
         logging.info(f"{self.__class__.__name__}: Navigated forward successfully")
 
     def get_current_url(self):
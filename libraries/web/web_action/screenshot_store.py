@@ -0,0 +1,176 @@
+import hashlib
+import io
+import logging
+import os
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+from PIL import Image
+from libraries.common.utility_helpers import PROJECT_ROOT
+
+
+class ScreenshotStore:
+    """
+    Stores screenshots as content-addressed WebP files under reports/screenshots.
+
+    Decoding, near-duplicate detection and encoding run on a background thread pool so the test
+    thread only pays for the capture itself; the Robot log receives a link to the file instead of
+    inline base64. A capture nearly identical to the previous one of the same scope is linked to
+    that file instead of being encoded again.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    DEFAULT_SETTINGS = {
+        'max_width': 1440,
+        'quality': 30,
+        'min_quality': 10,
+        'max_bytes': 0,
+        'workers': 2,
+        'duplicate_threshold': 2,
+    }
+
+    def __init__(self, settings: Optional[Dict] = None):
+        self.settings = {**self.DEFAULT_SETTINGS, **(settings or {})}
+        self.reports_dir = os.path.join(PROJECT_ROOT, 'reports')
+        self.output_dir = os.path.join(self.reports_dir, 'screenshots')
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=int(self.settings['workers']), thread_name_prefix='screenshot-encoder')
+        self._pending = {}
+        self._last_capture = None
+        self._copy_fallback_logged = False
+
+    @classmethod
+    def get_instance(cls, settings: Optional[Dict] = None) -> 'ScreenshotStore':
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls(settings)
+                logging.info(f"{cls.__name__}: Screenshot store initialized with settings: {cls._instance.settings}")
+        return cls._instance
+
+    @classmethod
+    def reset(cls):
+        """Write the queued screenshots and drop the instance, so the next get_instance starts a new store."""
+        with cls._lock:
+            instance, cls._instance = cls._instance, None
+        if instance is not None:
+            instance.flush()
+
+    def store(self, png_bytes: bytes, scope: Optional[str] = None) -> str:
+        """
+        Queue a PNG capture for encoding.
+
+        :param png_bytes: Raw PNG screenshot
+        :param scope: Captures are only compared with the previous capture of the same scope (e.g. the test name)
+        :return: Path relative to the reports directory
+        """
+        digest = hashlib.sha1(png_bytes).hexdigest()
+        file_name = f"{digest}.webp"
+        file_path = os.path.join(self.output_dir, file_name)
+        future = self._pending.get(digest)
+        if future is None:
+            previous = self._last_capture['future'] if self._last_capture and self._last_capture['scope'] == scope else None
+            future = self._executor.submit(self._process, png_bytes, file_path, previous)
+            self._pending[digest] = future
+        self._last_capture = {'scope': scope, 'future': future}
+        return f"screenshots/{file_name}"
+
+    def _process(self, png_bytes: bytes, file_path: str, previous: Optional[Future]) -> Tuple[Tuple, str]:
+        """
+        Decode, fingerprint and encode a capture; returns the fingerprint and file of the last stored capture,
+        for the next capture to compare with.
+        """
+        image = Image.open(io.BytesIO(png_bytes))
+        fingerprint = (image.size, self._difference_hash(image))
+        if os.path.exists(file_path):
+            return fingerprint, file_path
+
+        # Submitted earlier, so it is already running or done and waiting on it cannot deadlock the pool
+        previous_capture = self._previous_result(previous)
+        if previous_capture and self._is_near_duplicate(previous_capture[0], fingerprint):
+            self._link(previous_capture[1], file_path)
+            logging.debug(f"{self.__class__.__name__}: Screenshot {os.path.basename(file_path)} unchanged since previous capture, "
+                          f"reusing {os.path.basename(previous_capture[1])}")
+            # Later captures keep comparing with the stored one, so small changes cannot add up unnoticed
+            return previous_capture
+
+        self._encode(image, file_path)
+        return fingerprint, file_path
+
+    @staticmethod
+    def _previous_result(previous: Optional[Future]) -> Optional[Tuple[Tuple, str]]:
+        if previous is None:
+            return None
+        try:
+            return previous.result()
+        except Exception:
+            return None
+
+    def _is_near_duplicate(self, last_fingerprint: Tuple, fingerprint: Tuple) -> bool:
+        threshold = self.settings['duplicate_threshold']
+        if threshold is None or int(threshold) < 0:
+            return False
+        last_size, last_hash = last_fingerprint
+        size, image_hash = fingerprint
+        return last_size == size and bin(last_hash ^ image_hash).count('1') <= int(threshold)
+
+    def _link(self, source_path: str, file_path: str):
+        # A hard link costs no disk space; copy where the file system does not support them
+        temp_path = f"{file_path}.{threading.get_ident()}.tmp"
+        try:
+            os.link(source_path, temp_path)
+        except OSError as e:
+            if not self._copy_fallback_logged:
+                self._copy_fallback_logged = True
+                logging.warning(f"{self.__class__.__name__}: Hard links are not supported in {self.output_dir} ({e}), "
+                                f"unchanged screenshots are copied instead")
+            shutil.copyfile(source_path, temp_path)
+        os.replace(temp_path, file_path)
+
+    @staticmethod
+    def _difference_hash(image: Image.Image, hash_size: int = 16) -> int:
+        """256-bit dHash: compares neighbouring pixels of a small grayscale thumbnail."""
+        thumbnail = image.convert('L').resize((hash_size + 1, hash_size), Image.BILINEAR, reducing_gap=2.0)
+        pixels = list(thumbnail.getdata())
+        value = 0
+        for row in range(hash_size):
+            offset = row * (hash_size + 1)
+            for col in range(hash_size):
+                value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+        return value
+
+    def _encode(self, image: Image.Image, file_path: str):
+        max_width = int(self.settings['max_width'])
+        if max_width and image.size[0] > max_width:
+            h_size = int(image.size[1] * (max_width / float(image.size[0])))
+            image = image.resize((max_width, h_size), Image.LANCZOS)
+
+        quality = int(self.settings['quality'])
+        min_quality = int(self.settings['min_quality'])
+        max_bytes = int(self.settings['max_bytes'])
+        data = self._to_webp(image, quality)
+        while max_bytes and len(data) > max_bytes and quality > min_quality:
+            quality = max(min_quality, quality - 10)
+            data = self._to_webp(image, quality)
+
+        temp_path = f"{file_path}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, file_path)
+        logging.debug(f"{self.__class__.__name__}: Encoded screenshot {os.path.basename(file_path)} ({len(data)} bytes, quality {quality})")
+
+    @staticmethod
+    def _to_webp(image: Image.Image, quality: int) -> bytes:
+        buffer = io.BytesIO()
+        image.save(buffer, format="WebP", quality=quality)
+        return buffer.getvalue()
+
+    def flush(self):
+        """Block until all queued screenshots have been written."""
+        for digest, future in list(self._pending.items()):
+            try:
+                future.result()
+            except Exception as e:
+                logging.error(f"{self.__class__.__name__}: Failed to encode screenshot {digest}: {str(e)}")
+        self._pending.clear()
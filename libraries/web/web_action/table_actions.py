@@ -9,63 +9,63 @@ class TableActions(Base):
         table_element = self.wait_for_element(locator, element_desc=element_desc) if isinstance(locator, tuple) else locator
         table_desc = element_desc or self._get_element_description(table_element)
         self.table_verifier.verify_table(table_element, expected_data, match_type='exact')
-        logging.debug(f"{self.__class__.__name__}: Table verification (exact match) completed for table: {table_desc}")
+        logging.debug("%s: Table verification (exact match) completed for table: %s", self.__class__.__name__, table_desc)
 
     def verify_table_row_exact(self, locator: Union[tuple, WebElement], row_index: int, expected_data: Dict[str, str], element_desc=None):
         logging.debug(f"{self.__class__.__name__}: Verifying table row at index {row_index} with exact match")
         table_element = self.wait_for_element(locator, element_desc=element_desc) if isinstance(locator, tuple) else locator
         table_desc = element_desc or self._get_element_description(table_element)
         self.table_verifier.verify_table_row(table_element, row_index, expected_data, match_type='exact')
-        logging.debug(f"{self.__class__.__name__}: Table row verification (exact match) completed for table: {table_desc}, row: {row_index}")
+        logging.debug("%s: Table row verification (exact match) completed for table: %s, row: %s", self.__class__.__name__, table_desc, row_index)
 
     def verify_specific_cell_exact(self, locator: Union[tuple, WebElement], row_index: int, column: Union[str, int], expected_value: str, element_desc=None):
         logging.debug(f"{self.__class__.__name__}: Verifying specific cell at row {row_index}, column {column} with exact match")
         table_element = self.wait_for_element(locator, element_desc=element_desc) if isinstance(locator, tuple) else locator
         table_desc = element_desc or self._get_element_description(table_element)
         self.table_verifier.verify_specific_cell(table_element, row_index, column, expected_value, match_type='exact')
-        logging.debug(f"{self.__class__.__name__}: Specific cell verification (exact match) completed for table: {table_desc}, row: {row_index}, column: {column}")
+        logging.debug("%s: Specific cell verification (exact match) completed for table: %s, row: %s, column: %s", self.__class__.__name__, table_desc, row_index, column)
 
     def verify_table_partial(self, locator: Union[tuple, WebElement], expected_data: List[Dict[str, str]], element_desc=None):
         logging.debug(f"{self.__class__.__name__}: Verifying entire table with partial match")
         table_element = self.wait_for_element(locator, element_desc=element_desc) if isinstance(locator, tuple) else locator
         table_desc = element_desc or self._get_element_description(table_element)
         self.table_verifier.verify_table(table_element, expected_data, match_type='partial')
-        logging.debug(f"{self.__class__.__name__}: Table verification (partial match) completed for table: {table_desc}")
+        logging.debug("%s: Table verification (partial match) completed for table: %s", self.__class__.__name__, table_desc)
 
     def verify_table_row_partial(self, locator: Union[tuple, WebElement], row_index: int, expected_data: Dict[str, str], element_desc=None):
         logging.debug(f"{self.__class__.__name__}: Verifying table row at index {row_index} with partial match")
         table_element = self.wait_for_element(locator, element_desc=element_desc) if isinstance(locator, tuple) else locator
         table_desc = element_desc or self._get_element_description(table_element)
         self.table_verifier.verify_table_row(table_element, row_index, expected_data, match_type='partial')
-        logging.debug(f"{self.__class__.__name__}: Table row verification (partial match) completed for table: {table_desc}, row: {row_index}")
+        logging.debug("%s: Table row verification (partial match) completed for table: %s, row: %s", self.__class__.__name__, table_desc, row_index)
 
     def verify_specific_cell_partial(self, locator: Union[tuple, WebElement], row_index: int, column: Union[str, int], expected_value: str, element_desc=None):
         logging.debug(f"{self.__class__.__name__}: Verifying specific cell at row {row_index}, column {column} with partial match")
         table_element = self.wait_for_element(locator, element_desc=element_desc) if isinstance(locator, tuple) else locator
         table_desc = element_desc or self._get_element_description(table_element)
         self.table_verifier.verify_specific_cell(table_element, row_index, column, expected_value, match_type='partial')
-        logging.debug(f"{self.__class__.__name__}: Specific cell verification (partial match) completed for table: {table_desc}, row: {row_index}, column: {column}")
+        logging.debug("%s: Specific cell verification (partial match) completed for table: %s, row: %s, column: %s", self.__class__.__name__, table_desc, row_index, column)
 
     def verify_table_regex(self, locator: Union[tuple, WebElement], expected_data: List[Dict[str, str]], element_desc=None):
         logging.debug(f"{self.__class__.__name__}: Verifying entire table with regex match")
         table_element = self.wait_for_element(locator, element_desc=element_desc) if isinstance(locator, tuple) else locator
         table_desc = element_desc or self._get_element_description(table_element)
         self.table_verifier.verify_table(table_element, expected_data, match_type='regex')
-        logging.debug(f"{self.__class__.__name__}: Table verification (regex match) completed for table: {table_desc}")
+        logging.debug("%s: Table verification (regex match) completed for table: %s", self.__class__.__name__, table_desc)
 
     def verify_table_row_regex(self, locator: Union[tuple, WebElement], row_index: int, expected_data: Dict[str, str], element_desc=None):
         logging.debug(f"{self.__class__.__name__}: Verifying table row at index {row_index} with regex match")
         table_element = self.wait_for_element(locator, element_desc=element_desc) if isinstance(locator, tuple) else locator
         table_desc = element_desc or self._get_element_description(table_element)
         self.table_verifier.verify_table_row(table_element, row_index, expected_data, match_type='regex')
-        logging.debug(f"{self.__class__.__name__}: Table row verification (regex match) completed for table: {table_desc}, row: {row_index}")
+        logging.debug("%s: Table row verification (regex match) completed for table: %s, row: %s", self.__class__.__name__, table_desc, row_index)
 
     def verify_specific_cell_regex(self, locator: Union[tuple, WebElement], row_index: int, column: Union[str, int], expected_value: str, element_desc=None):
         logging.debug(f"{self.__class__.__name__}: Verifying specific cell at row {row_index}, column {column} with regex match")
         table_element = self.wait_for_element(locator, element_desc=element_desc) if isinstance(locator, tuple) else locator
         table_desc = element_desc or self._get_element_description(table_element)
         self.table_verifier.verify_specific_cell(table_element, row_index, column, expected_value, match_type='regex')
-        logging.debug(f"{self.__class__.__name__}: Specific cell verification (regex match) completed for table: {table_desc}, row: {row_index}, column: {column}")
+        logging.debug("%s: Specific cell verification (regex match) completed for table: %s, row: %s, column: %s", self.__class__.__name__, table_desc, row_index, column)
 
     def verify_table_is_empty(self, locator: Union[tuple, WebElement], element_desc=None):
         logging.debug(f"{self.__class__.__name__}: Verifying table is empty")
@@ -73,7 +73,7 @@ class TableActions(Base):
             table_element = self.wait_for_element(locator, element_desc=element_desc) if isinstance(locator, tuple) else locator
             table_desc = element_desc or self._get_element_description(table_element)
             self.table_verifier.verify_table_is_empty(table_element)
-            logging.debug(f"{self.__class__.__name__}: Table empty verification completed successfully for table: {table_desc}")
+            logging.debug("%s: Table empty verification completed successfully for table: %s", self.__class__.__name__, table_desc)
         except Exception as e:
             logging.error(f"{self.__class__.__name__}: Error verifying table is empty: {str(e)}")
             raise
@@ -84,7 +84,7 @@ class TableActions(Base):
             table_element = self.wait_for_element(locator, element_desc=element_desc) if isinstance(locator, tuple) else locator
             table_desc = element_desc or self._get_element_description(table_element)
             self.table_verifier.verify_unique_column_values(table_element, column)
-            logging.debug(f"{self.__class__.__name__}: Unique column values verification completed successfully for table: {table_desc}, column: {column}")
+            logging.debug("%s: Unique column values verification completed successfully for table: %s, column: %s", self.__class__.__name__, table_desc, column)
         except Exception as e:
             logging.error(f"{self.__class__.__name__}: Error verifying unique column values: {str(e)}")
             raise
@@ -96,7 +96,7 @@ class TableActions(Base):
             table_desc = element_desc or self._get_element_description(table_element)
             result = self.table_verifier.verify_value_in_table(table_element, search_value)
             assert result,f"Value '{search_value}' not found in table"
-            logging.debug(f"{self.__class__.__name__}: Value verification in table completed successfully for table: {table_desc}")
+            logging.debug("%s: Value verification in table completed successfully for table: %s", self.__class__.__name__, table_desc)
             return result
         except Exception as e:
             logging.error(f"{self.__class__.__name__}: Error verifying value in table: {str(e)}")
@@ -109,7 +109,7 @@ class TableActions(Base):
             table_desc = element_desc or self._get_element_description(table_element)
             result = self.table_verifier.verify_value_not_in_table(table_element, search_value)
             assert result,f"Value '{search_value}' found in table when it should not be present"
-            logging.debug(f"{self.__class__.__name__}: Value absence verification in table completed successfully for table: {table_desc}")
+            logging.debug("%s: Value absence verification in table completed successfully for table: %s", self.__class__.__name__, table_desc)
             return result
         except Exception as e:
             logging.error(f"{self.__class__.__name__}: Error verifying value not in table: {str(e)}")
@@ -121,7 +121,7 @@ class TableActions(Base):
             table_element = self.wait_for_element(locator, element_desc=element_desc) if isinstance(locator, tuple) else locator
             table_desc = element_desc or self._get_element_description(table_element)
             self.table_verifier.click_table_header_column(table_element, column)
-            logging.debug(f"{self.__class__.__name__}: Clicked header column '{column}' successfully in table: {table_desc}")
+            logging.debug("%s: Clicked header column '%s' successfully in table: %s", self.__class__.__name__, column, table_desc)
         except Exception as e:
             logging.error(f"{self.__class__.__name__}: Error clicking table header column: {str(e)}")
             raise
@@ -131,7 +131,7 @@ class TableActions(Base):
             table_element = self.wait_for_element(locator, element_desc=element_desc) if isinstance(locator, tuple) else locator
             table_desc = element_desc or self._get_element_description(table_element)
             self.table_verifier.verify_row_count(table_element, expected_row_count)
-            logging.debug(f"{self.__class__.__name__}: Row count verification completed successfully for table: {table_desc}")
+            logging.debug("%s: Row count verification completed successfully for table: %s", self.__class__.__name__, table_desc)
         except Exception as e:
             logging.error(f"{self.__class__.__name__}: Error verifying row count: {str(e)}")
             raise
@@ -142,7 +142,7 @@ class TableActions(Base):
             table_element = self.wait_for_element(locator, element_desc=element_desc) if isinstance(locator, tuple) else locator
             table_desc = element_desc or self._get_element_description(table_element)
             self.table_verifier.verify_column_sorted(table_element, column, expected_order, strip_spaces)
-            logging.debug(f"{self.__class__.__name__}: Column sorting verification completed successfully for table: {table_desc}, column: {column}")
+            logging.debug("%s: Column sorting verification completed successfully for table: %s, column: %s", self.__class__.__name__, table_desc, column)
         except Exception as e:
             logging.error(f"{self.__class__.__name__}: Error verifying column sorting: {str(e)}")
             raise
@@ -153,7 +153,7 @@ class TableActions(Base):
             table_element = self.wait_for_element(locator, element_desc=element_desc) if isinstance(locator, tuple) else locator
             table_desc = element_desc or self._get_element_description(table_element)
             self.table_verifier.verify_numeric_column_sorted(table_element, column, expected_order, strip_spaces)
-            logging.debug(f"{self.__class__.__name__}: Numeric column sorting verification completed successfully for table: {table_desc}, column: {column}")
+            logging.debug("%s: Numeric column sorting verification completed successfully for table: %s, column: %s", self.__class__.__name__, table_desc, column)
         except Exception as e:
             logging.error(f"{self.__class__.__name__}: Error verifying numeric column sorting: {str(e)}")
             raise
@@ -164,7 +164,7 @@ class TableActions(Base):
             table_element = self.wait_for_element(locator, element_desc=element_desc) if isinstance(locator, tuple) else locator
             table_desc = element_desc or self._get_element_description(table_element)
             self.table_verifier.select_table_row_checkbox(table_element, identifier_column, identifier_value, checkbox_column)
-            logging.debug(f"{self.__class__.__name__}: Checkbox selected successfully for row with {identifier_column}: {identifier_value} in table: {table_desc}")
+            logging.debug("%s: Checkbox selected successfully for row with %s: %s in table: %s", self.__class__.__name__, identifier_column, identifier_value, table_desc)
         except Exception as e:
             logging.error(f"{self.__class__.__name__}: Error selecting checkbox: {str(e)}")
             raise
@@ -175,7 +175,17 @@ class TableActions(Base):
             table_element = self.wait_for_element(locator, element_desc=element_desc) if isinstance(locator, tuple) else locator
             table_desc = element_desc or self._get_element_description(table_element)
             self.table_verifier.select_multiple_table_row_checkboxes(table_element, identifier_column, identifier_values, checkbox_column)
-            logging.debug(f"{self.__class__.__name__}: Checkboxes selected successfully for rows with {identifier_column}: {identifier_values} in table: {table_desc}")
+            logging.debug("%s: Checkboxes selected successfully for rows with %s: %s in table: %s", self.__class__.__name__, identifier_column, identifier_values, table_desc)
         except Exception as e:
             logging.error(f"{self.__class__.__name__}: Error selecting multiple checkboxes: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    def set_table_collect_mode(self, mode: str = 'snapshot', next_page_selector: str = None, max_pages: int = 100,
+                               first_page_selector: str = None):
+        logging.debug(f"{self.__class__.__name__}: Setting table collect mode to '{mode}'")
+        try:
+            self.table_verifier.set_collect_mode(mode, next_page_selector, max_pages, first_page_selector)
+            logging.debug(f"{self.__class__.__name__}: Table collect mode set to '{mode}' successfully")
+        except Exception as e:
+            logging.error(f"{self.__class__.__name__}: Error setting table collect mode: {str(e)}")
+            raise
@@ -1,16 +1,128 @@
 import logging
+import time
 from selenium.webdriver.common.by import By
 import re
 from robot.api import logger
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from libraries.common.log_manager import ColorLogger
+from libraries.web.web_action.js import extract_table_script, click_page_control_script, table_cell_input_script
 
 
 class TableVerifier:
+    COLLECT_MODES = ('snapshot', 'scroll', 'paginate')
+
     def __init__(self, driver):
         self.driver = driver
         self.logger = logging.getLogger(__name__)
+        self.collect_mode = 'snapshot'
+        self.next_page_selector = None
+        self.first_page_selector = None
+        self.max_pages = 100
+        self.max_scrolls = 500
+        self.render_timeout = 10
+        self.poll_interval = 0.2
+
+    def set_collect_mode(self, mode='snapshot', next_page_selector=None, max_pages=100, first_page_selector=None):
+        """
+        Choose how table data is collected for the following verifications.
+
+        :param mode: 'snapshot' reads the rendered rows once, 'scroll' scrolls a virtual grid from the top and
+                     collects rows as they render, 'paginate' starts at the first page and clicks
+                     next_page_selector until every page is collected
+        :param next_page_selector: CSS selector of the "next page" control (paginate mode)
+        :param max_pages: Upper bound of pages visited in paginate mode
+        :param first_page_selector: CSS selector of the "first page" control (paginate mode)
+        """
+        if mode not in self.COLLECT_MODES:
+            raise ValueError(f"Invalid collect mode: {mode}. Expected one of {self.COLLECT_MODES}")
+        if mode == 'paginate' and not (next_page_selector and first_page_selector):
+            raise ValueError("next_page_selector and first_page_selector are required for paginate mode")
+        self.collect_mode = mode
+        self.next_page_selector = next_page_selector
+        self.first_page_selector = first_page_selector
+        self.max_pages = int(max_pages)
+        self.logger.info(f"Table collect mode set to '{mode}'")
+
+    def get_table_data(self, table_element):
+        """
+        Read the whole table locally: the first row holds the headers, the rest the data rows.
+        Every cell text is trimmed; all matching afterwards happens in Python.
+        """
+        if self.collect_mode == 'scroll':
+            rows = self._collect_by_scrolling(table_element)
+        elif self.collect_mode == 'paginate':
+            rows = self._collect_by_paging(table_element)
+        else:
+            rows = self._snapshot(table_element)['rows']
+        if not rows:
+            raise ValueError("No rows found in table.")
+        self.logger.debug(f"Collected {len(rows)} table rows in '{self.collect_mode}' mode")
+        return rows
+
+    def _get_headers_and_rows(self, table_element):
+        rows = self.get_table_data(table_element)
+        headers = [header.lower() for header in rows[0]]
+        return headers, rows
+
+    def _snapshot(self, table_element, scroll=False):
+        return self.driver.execute_script(extract_table_script, table_element, scroll)
+
+    def _collect_by_scrolling(self, table_element):
+        # Start at the top, so rows above the current scroll position are not missed
+        self._snapshot(table_element, scroll='top')
+        time.sleep(self.poll_interval)
+
+        header = None
+        collected = {}
+        for _ in range(self.max_scrolls):
+            snapshot = self._snapshot(table_element, scroll='next')
+            if snapshot['rows']:
+                header = header or snapshot['rows'][0]
+            for row, key, top in list(zip(snapshot['rows'], snapshot['keys'], snapshot['tops']))[1:]:
+                # Rows without an index attribute are told apart by their position in the scrolled content,
+                # so identical rows are still counted separately
+                collected.setdefault(('index', key) if key is not None else ('top', top), row)
+            if snapshot['atEnd']:
+                break
+            time.sleep(self.poll_interval)
+        else:
+            self.logger.warning(f"Stopped scrolling table after {self.max_scrolls} scrolls")
+
+        keys = list(collected)
+        if all(kind == 'index' and str(key).isdigit() for kind, key in keys):
+            keys.sort(key=lambda item: int(item[1]))
+        elif all(kind == 'top' for kind, _ in keys):
+            keys.sort(key=lambda item: item[1])
+        return ([header] if header is not None else []) + [collected[key] for key in keys]
+
+    def _collect_by_paging(self, table_element):
+        rows = self._snapshot(table_element)['rows']
+        # Start at the first page, e.g. after an earlier verification left the table on its last one
+        if self.driver.execute_script(click_page_control_script, self.first_page_selector):
+            rows = self._wait_for_page_change(table_element, rows, required=False)
+        page_rows = rows
+        for page in range(1, self.max_pages):
+            if not self.driver.execute_script(click_page_control_script, self.next_page_selector):
+                break
+            page_rows = self._wait_for_page_change(table_element, page_rows)
+            rows.extend(page_rows[1:])
+        else:
+            self.logger.warning(f"Stopped paging table after {self.max_pages} pages")
+        return rows
+
+    def _wait_for_page_change(self, table_element, previous_rows, required=True):
+        """Wait until the table shows other rows; when not required, a table that stays the same is returned as is."""
+        deadline = time.time() + self.render_timeout
+        while True:
+            rows = self._snapshot(table_element)['rows']
+            if rows != previous_rows:
+                return rows
+            if time.time() > deadline:
+                if not required:
+                    return rows
+                raise TimeoutError(f"Table content did not change within {self.render_timeout} seconds after moving to the next page")
+            time.sleep(self.poll_interval)
 
     def verify_table(self, table_element, expected_data, match_type='exact'):
         """
@@ -21,22 +133,20 @@ class TableVerifier:
         :param match_type: Type of matching to perform ('exact', 'partial', 'regex')
         """
         try:
-            rows = table_element.find_elements(By.TAG_NAME, "tr")
-            headers = [header.text.strip().lower() for header in rows[0].find_elements(By.XPATH, ".//th | .//td")]
+            headers, rows = self._get_headers_and_rows(table_element)
 
             for row_index, expected_row in enumerate(expected_data, start=1):
                 if row_index >= len(rows):
                     raise ValueError(f"Not enough rows in table. Expected at least {row_index}, but found {len(rows) - 1}")
 
-                row = rows[row_index]
-                cells = row.find_elements(By.XPATH, ".//td|.//th")
+                cells = rows[row_index]
 
                 for column, expected_value in expected_row.items():
                     cell_index = self._get_cell_index(headers, column)
                     if cell_index >= len(cells):
                         raise ValueError(f"Column '{column}' is out of range. Row has {len(cells)} cells.")
 
-                    actual_value = cells[cell_index].text.strip()
+                    actual_value = cells[cell_index]
                     self._verify_cell_value(column, actual_value, expected_value, match_type)
 
             self.logger.info("All table data verified successfully.")
@@ -54,21 +164,19 @@ class TableVerifier:
         :param match_type: Type of matching to perform ('exact', 'partial', 'regex')
         """
         try:
-            rows = table_element.find_elements(By.TAG_NAME, "tr")
-            headers = [header.text.strip().lower() for header in rows[0].find_elements(By.XPATH, ".//th | .//td")]
+            headers, rows = self._get_headers_and_rows(table_element)
 
             if row_index < 1 or row_index >= len(rows):
                 raise ValueError(f"Invalid row index: {row_index}. Table has {len(rows) - 1} data rows.")
 
-            row = rows[row_index]
-            cells = row.find_elements(By.XPATH, ".//td|.//th")
+            cells = rows[row_index]
 
             for column, expected_value in expected_data.items():
                 cell_index = self._get_cell_index(headers, column)
                 if cell_index >= len(cells):
                     raise ValueError(f"Column '{column}' is out of range. Row has {len(cells)} cells.")
 
-                actual_value = cells[cell_index].text.strip()
+                actual_value = cells[cell_index]
                 self._verify_cell_value(column, actual_value, expected_value, match_type)
 
             self.logger.info(f"All expected data in row {row_index} verified successfully.")
@@ -87,20 +195,18 @@ class TableVerifier:
         :param match_type: Type of matching to perform ('exact', 'partial', 'regex')
         """
         try:
-            rows = table_element.find_elements(By.TAG_NAME, "tr")
-            headers = [header.text.strip().lower() for header in rows[0].find_elements(By.XPATH, ".//th | .//td")]
+            headers, rows = self._get_headers_and_rows(table_element)
 
             if row_index < 1 or row_index >= len(rows):
                 raise ValueError(f"Invalid row index: {row_index}. Table has {len(rows) - 1} data rows.")
 
-            row = rows[row_index]
-            cells = row.find_elements(By.XPATH, ".//td|.//th")
+            cells = rows[row_index]
 
             cell_index = self._get_cell_index(headers, column)
             if cell_index >= len(cells):
                 raise ValueError(f"Column '{column}' is out of range. Row has {len(cells)} cells.")
 
-            actual_value = cells[cell_index].text.strip()
+            actual_value = cells[cell_index]
             self._verify_cell_value(column, actual_value, expected_value, match_type)
 
             self.logger.info(f"Cell at row {row_index}, column '{column}' verified successfully.")
@@ -153,7 +259,7 @@ class TableVerifier:
         :param table_element: WebElement of the table
         """
         try:
-            rows = table_element.find_elements(By.TAG_NAME, "tr")
+            rows = self.get_table_data(table_element)
             assert len(rows) == 1, f"Table is not empty. Found {len(rows) - 1} data rows."
 
             self.logger.info("Table is empty as expected.")
@@ -169,16 +275,14 @@ class TableVerifier:
         :param column: Column name or index to verify uniqueness
         """
         try:
-            rows = table_element.find_elements(By.TAG_NAME, "tr")
-            headers = [header.text.strip().lower() for header in rows[0].find_elements(By.XPATH, ".//th | .//td")]
+            headers, rows = self._get_headers_and_rows(table_element)
 
             column_index = self._get_cell_index(headers, column)
             values = set()
 
-            for row in rows[1:]:  # Skip header row
-                cells = row.find_elements(By.XPATH, ".//td|.//th")
+            for cells in rows[1:]:  # Skip header row
                 if column_index < len(cells):
-                    value = cells[column_index].text.strip()
+                    value = cells[column_index]
                     assert value not in values, f"Duplicate value found in column '{column}': {value}"
                     values.add(value)
 
@@ -196,12 +300,11 @@ class TableVerifier:
         :return: True if the value is found, False if not
         """
         try:
-            rows = table_element.find_elements(By.TAG_NAME, "tr")
+            rows = self.get_table_data(table_element)
 
-            for row in rows[1:]:  # Skip header row
-                cells = row.find_elements(By.XPATH, ".//td|.//th")
+            for cells in rows[1:]:  # Skip header row
                 for cell in cells:
-                    if search_value in cell.text.strip():
+                    if search_value in cell:
                         self.logger.info(f"Value '{search_value}' found in table.")
                         return True
 
@@ -220,12 +323,11 @@ class TableVerifier:
         :return: True if the value is not found, False if it is found
         """
         try:
-            rows = table_element.find_elements(By.TAG_NAME, "tr")
+            rows = self.get_table_data(table_element)
 
-            for row in rows[1:]:  # Skip header row
-                cells = row.find_elements(By.XPATH, ".//td|.//th")
+            for cells in rows[1:]:  # Skip header row
                 for cell in cells:
-                    if search_value in cell.text.strip():
+                    if search_value in cell:
                         self.logger.info(f"Value '{search_value}' found in table when it should not be present.")
                         return False
 
@@ -243,7 +345,7 @@ class TableVerifier:
         :param expected_row_count: The expected number of data rows
         """
         try:
-            rows = table_element.find_elements(By.TAG_NAME, "tr")
+            rows = self.get_table_data(table_element)
             actual_row_count = len(rows) - 1  # Exclude header row
 
             assert actual_row_count == expected_row_count, \
@@ -265,18 +367,16 @@ class TableVerifier:
         """
         try:
             # Retrieve all rows and headers of the table
-            rows = table_element.find_elements(By.TAG_NAME, "tr")
-            headers = [header.text.strip().lower() for header in rows[0].find_elements(By.XPATH, ".//th | .//td")]
+            headers, rows = self._get_headers_and_rows(table_element)
 
             # Get the index of the target column
             column_index = self._get_cell_index(headers, column)
 
             # Collect all values from the target column (skipping the header row)
             column_data = []
-            for row in rows[1:]:
-                cells = row.find_elements(By.XPATH, ".//td|.//th")
+            for cells in rows[1:]:
                 if column_index < len(cells):
-                    cell_text = cells[column_index].text.strip()
+                    cell_text = cells[column_index]
                     if strip_spaces:
                         cell_text = cell_text.strip()  # Optionally strip spaces
                     column_data.append(cell_text)
@@ -300,18 +400,16 @@ class TableVerifier:
 
         try:
             # Retrieve all rows and headers of the table
-            rows = table_element.find_elements(By.TAG_NAME, "tr")
-            headers = [header.text.strip().lower() for header in rows[0].find_elements(By.XPATH, ".//th | .//td")]
+            headers, rows = self._get_headers_and_rows(table_element)
 
             # Get the index of the target column using the existing helper method
             column_index = self._get_cell_index(headers, column)
 
             # Collect numeric values from the target column (skipping the header row)
             numeric_data = []
-            for row in rows[1:]:
-                cells = row.find_elements(By.XPATH, ".//td|.//th")
+            for cells in rows[1:]:
                 if column_index < len(cells):
-                    cell_text = cells[column_index].text
+                    cell_text = cells[column_index]
                     if strip_spaces:
                         cell_text = cell_text.strip()
                     # Remove commas if present
@@ -348,17 +446,19 @@ class TableVerifier:
         :param checkbox_column: Column index (1-based) of the checkbox (default is 1, assuming checkbox is in the first column)
         """
         try:
-            rows = table_element.find_elements(By.TAG_NAME, "tr")
-            headers = [header.text.strip().lower() for header in rows[0].find_elements(By.XPATH, ".//th | .//td")]
+            # The checkbox has to be clicked in the live DOM, so rows are always read from what is rendered
+            rows = self._snapshot(table_element)['rows']
+            headers = [header.lower() for header in rows[0]] if rows else []
 
             identifier_index = self._get_cell_index(headers, identifier_column)
             checkbox_index = checkbox_column - 1  # Convert to 0-based index
 
-            for row in rows[1:]:  # Skip header row
-                cells = row.find_elements(By.XPATH, ".//td|.//th")
-                if identifier_index < len(cells) and cells[identifier_index].text.strip() == identifier_value:
+            for row_index, cells in enumerate(rows[1:], start=1):  # Skip header row
+                if identifier_index < len(cells) and cells[identifier_index] == identifier_value:
                     if checkbox_index < len(cells):
-                        checkbox = cells[checkbox_index].find_element(By.TAG_NAME, "input")
+                        checkbox = self.driver.execute_script(table_cell_input_script, table_element, row_index, checkbox_index)
+                        if checkbox is None:
+                            raise ValueError(f"No input found in column {checkbox_column} of row with {identifier_column}: {identifier_value}")
                         if checkbox.get_attribute("type") == "checkbox":
                             if not checkbox.is_selected():
                                 checkbox.click()
@@ -401,15 +501,13 @@ class TableVerifier:
         :return: None
         """
         try:
-            # Get the first row (header row)
-            header_row = table_element.find_element(By.TAG_NAME, "tr")
-            headers = [header.text.strip().lower() for header in header_row.find_elements(By.XPATH, ".//th | .//td")]
+            headers = [header.lower() for header in self._snapshot(table_element)['rows'][0]]
 
             # Use existing _get_cell_index method to find the column index
             column_index = self._get_cell_index(headers, column)
 
             # Get all header elements and click the one at the determined index
-            header_elements = header_row.find_elements(By.XPATH, ".//th | .//td")
+            header_elements = table_element.find_elements(By.XPATH, "(.//tr)[1]/*[self::th or self::td]")
             if column_index >= len(header_elements):
                 raise ValueError(f"Column index {column_index} is out of range. Found {len(header_elements)} header columns.")
 
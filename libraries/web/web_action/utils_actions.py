@@ -1,44 +1,57 @@
-import base64
 import datetime
-import io
 import logging
-import time
-from PIL import Image
+import os
 from robot.libraries.BuiltIn import BuiltIn
 from .base import Base
+from .screenshot_store import ScreenshotStore
+from .js import highlight_script
 
 class UtilsActions(Base):
-    def capture_screenshot(self,description=None):
+    highlight_enabled = True
+
+    def capture_screenshot(self, description=None):
         try:
             if self.driver:
                 screenshot_binary = self.driver.get_screenshot_as_png()
-                image = Image.open(io.BytesIO(screenshot_binary))
-                base_width = 1440
-                w_percent = (base_width / float(image.size[0]))
-                h_size = int((float(image.size[1]) * float(w_percent)))
-                image = image.resize((base_width, h_size), Image.LANCZOS)
-                buffer = io.BytesIO()
-                image.save(buffer, format="WebP", quality=30)
-                encoded_string = base64.b64encode(buffer.getvalue()).decode('utf-8')
-                logging.info(
-                    f"{self.__class__.__name__}: Screenshot captured successfully at: " + str(datetime.datetime.now())+ " with description: " + str(description))
-                BuiltIn().log(f'<img src="data:image/webp;base64,{encoded_string}" width="1440px">', html=True)
+                self._log_screenshot(screenshot_binary, description)
             else:
                 logging.error(f"{self.__class__.__name__}: WebDriver is not initialized.")
         except Exception as e:
             logging.error(f"{self.__class__.__name__}: Failed to capture screenshot: {str(e)}")
             BuiltIn().log(f"{self.__class__.__name__}: Failed to capture screenshot: {str(e)}", level="ERROR")
 
+    def capture_element_screenshot(self, locator, description=None, element_desc=None, condition="visibility"):
+        try:
+            element = self._resolve_element(locator, element_desc, condition)
+            element_desc = element_desc or self._get_element_description(locator)
+            self._log_screenshot(element.screenshot_as_png, description or element_desc)
+        except Exception as e:
+            logging.error(f"{self.__class__.__name__}: Failed to capture element screenshot: {str(e)}")
+            BuiltIn().log(f"{self.__class__.__name__}: Failed to capture element screenshot: {str(e)}", level="ERROR")
+
+    def _log_screenshot(self, screenshot_binary, description=None):
+        test_name = BuiltIn().get_variable_value('${TEST NAME}')
+        screenshot_path = ScreenshotStore.get_instance().store(screenshot_binary, scope=test_name)
+        logging.info(
+            f"{self.__class__.__name__}: Screenshot captured successfully at: " + str(datetime.datetime.now()) + " with description: " + str(description))
+        BuiltIn().log(f'<a href="{screenshot_path}"><img src="{screenshot_path}" style="max-width: 1440px"></a>', html=True)
+
     def highlight_element(self, locator, duration=2, color="lightgreen", border="3px solid red", element_desc=None, condition="visibility"):
+        if not self.highlight_enabled:
+            logging.debug(f"{self.__class__.__name__}: Highlighting is disabled, skipping element [ {element_desc}:{locator} ].")
+            return
         element = self._resolve_element(locator, element_desc, condition)
         element_desc = element_desc or self._get_element_description(locator)
         logging.debug(f"{self.__class__.__name__}: Highlighting element [ {element_desc}:{locator} ] using JavaScript.")
-        def apply_style(s):
-            self.driver.execute_script("arguments[0].setAttribute('style', arguments[1]);", element, s)
-        original_style = element.get_attribute('style')
-        for _ in range(int(duration)):
-            apply_style(f"background: {color}; border: {border};")
-            time.sleep(0.25)
-            apply_style(original_style)
-            time.sleep(0.25)
-        logging.info(f"{self.__class__.__name__}: Highlighted element [ {element_desc}:{locator} ] using JavaScript successfully.")
\ No newline at end of file
+        # 高亮在页面内由定时器完成，测试无需等待
+        self.driver.execute_script(highlight_script, element, int(duration), f"background: {color}; border: {border};")
+        logging.info(f"{self.__class__.__name__}: Highlighted element [ {element_desc}:{locator} ] using JavaScript successfully.")
+
+    @classmethod
+    def configure_highlight(cls, enabled):
+        """Set the global highlight switch; the HIGHLIGHT_ELEMENTS environment variable (e.g. in CI) takes precedence."""
+        env_value = os.getenv('HIGHLIGHT_ELEMENTS')
+        if env_value is not None:
+            enabled = env_value.strip().lower() not in ('false', 'n', 'no', 'off', '0')
+        cls.highlight_enabled = bool(enabled)
+        logging.info(f"{cls.__name__}: Element highlighting {'enabled' if cls.highlight_enabled else 'disabled'}")
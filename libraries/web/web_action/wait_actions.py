@@ -1,4 +1,5 @@
 from .base import Base
+from .js import wait_instrumentation_script, wait_state_script
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
@@ -65,7 +66,6 @@ class WaitActions(Base):
         try:
             result = wait.until(EC.text_to_be_present_in_element(locator, text))
             element = self.driver.find_element(*locator)
-            element_desc = self._get_element_description(element)
             logging.info(f"{self.__class__.__name__}: Text '{text}' is present in element: [ {element_desc}:{locator} ].")
             return element
         except TimeoutException:
@@ -77,16 +77,16 @@ class WaitActions(Base):
         Waits until the element is no longer attached to the DOM.
         """
         element_desc = self._get_element_description(element)
-        logging.info(f"{self.__class__.__name__}: Waiting for staleness of element: [ {element_desc} ].")
+        logging.info("%s: Waiting for staleness of element: [ %s ].", self.__class__.__name__, element_desc)
         if timeout is None:
             timeout = self.default_timeout
         wait = WebDriverWait(self.driver, timeout)
         try:
             wait.until(EC.staleness_of(element))
-            logging.info(f"{self.__class__.__name__}: Element is stale: [ {element_desc} ].")
+            logging.info("%s: Element is stale: [ %s ].", self.__class__.__name__, element_desc)
             return True
         except TimeoutException:
-            logging.error(f"{self.__class__.__name__}: Timeout waiting for element to become stale: [ {element_desc} ].")
+            logging.error("%s: Timeout waiting for element to become stale: [ %s ].", self.__class__.__name__, element_desc)
             return False
 
     def wait(self, seconds):
@@ -95,3 +95,49 @@ class WaitActions(Base):
         """
         logging.info(f"{self.__class__.__name__}: Waiting for {seconds} seconds.")
         time.sleep(float(seconds))
+
+    def wait_for_network_idle(self, timeout=None, idle_time=0.5):
+        """
+        Waits until the page has loaded, no fetch/XHR request is in flight and the network
+        has been quiet for idle_time seconds.
+        """
+        logging.info(f"{self.__class__.__name__}: Waiting for network idle ({idle_time}s without requests).")
+        self._wait_for_page_state(
+            'network_idle', timeout,
+            lambda state: state['readyState'] == 'complete' and state['inflight'] == 0 and state['networkQuiet'] >= float(idle_time))
+
+    def wait_for_dom_settled(self, timeout=None, quiet_time=0.5):
+        """
+        Waits until no DOM mutation has happened for quiet_time seconds.
+        """
+        logging.info(f"{self.__class__.__name__}: Waiting for DOM to settle ({quiet_time}s without mutations).")
+        self._wait_for_page_state('dom_settled', timeout, lambda state: state['domQuiet'] >= float(quiet_time))
+
+    def _wait_for_page_state(self, wait_name, timeout, is_settled, poll_interval=0.1):
+        timeout = float(timeout) if timeout is not None else self.default_timeout
+        self._install_wait_instrumentation()
+        start_time = time.perf_counter()
+        state = None
+        while True:
+            state = self.driver.execute_script(wait_state_script)
+            if state is None:
+                # A new document was loaded that has not been instrumented yet
+                self.driver.execute_script(wait_instrumentation_script)
+            elif is_settled(state):
+                break
+            if time.perf_counter() - start_time > timeout:
+                logging.error(f"{self.__class__.__name__}: Timeout after {timeout}s waiting for {wait_name}, last state: {state}")
+                raise TimeoutException(f"Timeout after {timeout}s waiting for {wait_name}")
+            time.sleep(poll_interval)
+
+        elapsed = round(time.perf_counter() - start_time, 3)
+        self.wait_timings.append({'wait': wait_name, 'seconds': elapsed})
+        logging.info(f"{self.__class__.__name__}: {wait_name} reached after {elapsed} seconds.")
+        return elapsed
+
+    @property
+    def wait_timings(self):
+        """How long each network idle / DOM settled wait actually took, in seconds."""
+        if not hasattr(self, '_wait_timings'):
+            self._wait_timings = []
+        return self._wait_timings
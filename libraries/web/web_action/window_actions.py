@@ -4,13 +4,13 @@ import logging
 class WindowActions(Base):
     def switch_to_frame(self, element, condition="presence"):
         element_desc = self._get_element_description(element)
-        logging.info(f"{self.__class__.__name__}: Switching to frame: {element_desc}")
+        logging.info("%s: Switching to frame: %s", self.__class__.__name__, element_desc)
 
         if isinstance(element, tuple):
             element = self.wait_for_element(element, condition=condition)
 
         self.driver.switch_to.frame(element)
-        logging.info(f"{self.__class__.__name__}: Switched to frame successfully: {element_desc}")
+        logging.info("%s: Switched to frame successfully: %s", self.__class__.__name__, element_desc)
 
     def switch_to_default_content(self):
         logging.info(f"{self.__class__.__name__}: Switching to default content")
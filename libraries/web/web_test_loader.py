@@ -4,6 +4,7 @@ import pandas as pd
 import os
 from typing import Dict, List
 from robot.libraries.BuiltIn import BuiltIn
+from libraries.db.db import SQLAlchemyDatabase
 
 class WebTestLoader:
     _instances = {}
@@ -79,11 +80,8 @@ class WebTestLoader:
                     'schema': row['Schema'],
                 })
             elif row['Type'].lower() == 'oracle':
-                config.update({
-                    'service_name': row['ServiceName'],
-                    'min_connections': int(row['MinConnections']) if pd.notna(row['MinConnections']) else None,
-                    'max_connections': int(row['MaxConnections']) if pd.notna(row['MaxConnections']) else None,
-                })
+                config.update({'service_name': row['ServiceName']})
+            config.update(SQLAlchemyDatabase.connection_options(row))
 
             configs[row['DatabaseName']] = config
 
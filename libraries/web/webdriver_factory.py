@@ -48,6 +48,18 @@ class WebDriverFactory:
                 options.add_argument(f'--{option}={value}')
                 logging.info(f"WebDriverFactory: Added browser option: --{option}={value}")
 
+        # Trace events recorded by ChromeDriver and read back through the performance log
+        trace_categories = driver_config.get('trace_categories')
+        if trace_categories:
+            vendor_prefix = options.KEY.split(':')[0]
+            options.set_capability(f'{vendor_prefix}:loggingPrefs', {'performance': 'ALL'})
+            options.add_experimental_option('perfLoggingPrefs', {
+                'enableNetwork': False,
+                'enablePage': False,
+                'traceCategories': ','.join(trace_categories),
+            })
+            logging.info(f"WebDriverFactory: Enabled trace categories: {', '.join(trace_categories)}")
+
         if is_remote:
             if not remote_url:
                 logging.error(f"WebDriverFactory: Remote URL is required for remote execution")
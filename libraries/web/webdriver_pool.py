@@ -0,0 +1,169 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from libraries.web.webdriver_factory import WebDriverFactory
+
+
+class WebDriverPool:
+    """
+    Keeps warm browsers ready to be leased to tests.
+
+    Drivers are launched up front, reset (cookies, storage, extra tabs) when they are released
+    and quit once they reach max_uses or their JS heap grows beyond max_memory_mb. A replacement
+    is launched in the background so the next lease does not wait for a browser start.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    DEFAULT_SETTINGS = {
+        'size': 1,
+        'max_uses': 50,
+        'max_memory_mb': 0,
+    }
+
+    def __init__(self, driver_config: Dict, settings: Optional[Dict] = None):
+        self.driver_config = driver_config
+        self.settings = {**self.DEFAULT_SETTINGS, **(settings or {})}
+        self.size = max(1, int(self.settings['size']))
+        self._idle: List = []
+        self._launching: List = []
+        self._uses: Dict[int, int] = {}
+        self._launch_error: Optional[Exception] = None
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix='webdriver-launcher')
+        for _ in range(self.size):
+            self._launch_in_background()
+
+    @classmethod
+    def get_instance(cls, driver_config: Dict = None, settings: Optional[Dict] = None) -> 'WebDriverPool':
+        with cls._lock:
+            if cls._instance is None:
+                if driver_config is None:
+                    raise ValueError("WebDriverPool: Driver config must be provided when creating the pool")
+                cls._instance = cls(driver_config, settings)
+                logging.info(f"{cls.__name__}: Pool created with settings: {cls._instance.settings}")
+        return cls._instance
+
+    @staticmethod
+    def is_enabled(settings: Optional[Dict]) -> bool:
+        return bool(settings) and bool(settings.get('enabled', False))
+
+    def _launch_in_background(self):
+        with self._condition:
+            future = self._executor.submit(WebDriverFactory.create_driver, self.driver_config)
+            self._launching.append(future)
+        future.add_done_callback(self._on_launched)
+
+    def _on_launched(self, future):
+        with self._condition:
+            self._launching.remove(future)
+            try:
+                driver = future.result()
+            except Exception as e:
+                logging.error(f"{self.__class__.__name__}: Failed to launch browser: {str(e)}")
+                self._launch_error = e
+            else:
+                self._launch_error = None
+                self._uses[id(driver)] = 0
+                self._idle.append(driver)
+            self._condition.notify_all()
+
+    def acquire(self):
+        """Lease a browser, waiting for a background launch or a release if none is idle."""
+        with self._condition:
+            while not self._idle:
+                # Fail like create_driver would instead of relaunching a broken browser forever
+                if self._launch_error is not None and not self._launching:
+                    error, self._launch_error = self._launch_error, None
+                    raise error
+                # Leased and idle browsers are tracked in _uses; never run more than size browsers
+                if len(self._uses) + len(self._launching) < self.size:
+                    self._launch_in_background()
+                self._condition.wait()
+            driver = self._idle.pop(0)
+            self._uses[id(driver)] += 1
+            logging.info(f"{self.__class__.__name__}: Leased browser (use {self._uses[id(driver)]}/{self.settings['max_uses']})")
+            return driver
+
+    def release(self, driver):
+        """Return a browser to the pool, resetting its state or recycling it."""
+        if driver is None:
+            return
+        reason = self._recycle_reason(driver)
+        if reason is None:
+            try:
+                self._reset(driver)
+            except Exception as e:
+                reason = f"reset failed: {str(e)}"
+
+        with self._condition:
+            if reason is None:
+                self._idle.append(driver)
+                logging.info(f"{self.__class__.__name__}: Browser returned to pool")
+            else:
+                logging.info(f"{self.__class__.__name__}: Recycling browser, {reason}")
+                self._uses.pop(id(driver), None)
+                self._launch_in_background()
+            self._condition.notify_all()
+
+        if reason is not None:
+            self._quit(driver)
+
+    def _recycle_reason(self, driver) -> Optional[str]:
+        max_uses = int(self.settings['max_uses'])
+        if max_uses and self._uses.get(id(driver), 0) >= max_uses:
+            return f"reached {max_uses} uses"
+
+        max_memory_mb = float(self.settings['max_memory_mb'])
+        if max_memory_mb:
+            try:
+                used_bytes = driver.execute_script(
+                    "return window.performance.memory ? window.performance.memory.usedJSHeapSize : null;")
+            except Exception as e:
+                return f"memory check failed: {str(e)}"
+            if used_bytes and used_bytes / (1024 * 1024) > max_memory_mb:
+                return f"JS heap {used_bytes / (1024 * 1024):.1f} MB exceeds {max_memory_mb} MB"
+        return None
+
+    @staticmethod
+    def _reset(driver):
+        # 关闭多余的标签页，只保留第一个
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        # Storage is per origin, so clear it before leaving the current page
+        driver.execute_script("try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}")
+        driver.delete_all_cookies()
+        if hasattr(driver, 'execute_cdp_cmd'):
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        driver.get('about:blank')
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.warning(f"{self.__class__.__name__}: Error quitting browser: {str(e)}")
+
+    def shutdown(self):
+        """Quit every pooled browser, including the ones still launching."""
+        with self._condition:
+            launching = list(self._launching)
+        for future in launching:
+            try:
+                future.result()
+            except Exception:
+                pass
+        self._executor.shutdown(wait=True)
+        with self._condition:
+            drivers, self._idle = self._idle, []
+            self._uses.clear()
+        for driver in drivers:
+            self._quit(driver)
+        with WebDriverPool._lock:
+            if WebDriverPool._instance is self:
+                WebDriverPool._instance = None
+        logging.info(f"{self.__class__.__name__}: Pool shut down, {len(drivers)} browser(s) closed")
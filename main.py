@@ -1,12 +1,22 @@
+import logging
 import os
+import sys
 import argparse
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from robot.api import ExecutionResult
 from robot.libraries.BuiltIn import BuiltIn
 from robot.reporting import ResultWriter
 from libraries.common.utility_helpers import PROJECT_ROOT
 from libraries.robot.report.summary_report_generator import SummaryReportGenerator
 from libraries.robot.report.robot_dashboard_generator import DashboardGenerator
 from libraries.robot.case.unified_generator import UnifiedRobotCaseGenerator
+from libraries.api.saved_fields_manager import SavedFieldsManager
 from libraries.common.log_manager import logger_instance
+from libraries.db.db_operator import DBOperator
+from libraries.robot.robot_test_executor import WebDriverSingleton
+from libraries.web.session_checkpoint import SessionCheckpointStore
+from libraries.web.web_action.screenshot_store import ScreenshotStore
 
 
 class ExitOnFailureListener:
@@ -14,9 +24,17 @@ class ExitOnFailureListener:
 
     def __init__(self):
         self.exit_on_failure = False
+        self.failed_suite_path = None
 
     def end_test(self, data, result):
         if 'sanity check' in [tag.lower() for tag in result.tags] and result.status == 'FAIL':
+            if not self.exit_on_failure:
+                # Suite names below the top level suite, e.g. to find the shard unit of the failed test
+                suite, names = data.parent, []
+                while suite.parent is not None:
+                    names.insert(0, suite.name)
+                    suite = suite.parent
+                self.failed_suite_path = tuple(names)
             self.exit_on_failure = True
             BuiltIn().set_global_variable('${skip_on_sanity_check_failure}', True)
 
@@ -25,11 +43,18 @@ def run_test_suite(suite):
     listener = ExitOnFailureListener()
     output_dir = os.path.join(PROJECT_ROOT, 'reports')
     output_xml = os.path.join(output_dir, 'output.xml')
+
+    result = suite.run(output=output_xml, listener=listener)
+
+    write_reports(output_xml)
+    return result.return_code
+
+
+def write_reports(output_xml):
+    output_dir = os.path.dirname(output_xml)
     report_file = os.path.join(output_dir, 'report.html')
     log_file = os.path.join(output_dir, 'log.html')
 
-    suite.run(output=output_xml, listener=listener)
-
     ResultWriter(output_xml).write_results(report=report_file, log=log_file)
 
     dashboard_generator = DashboardGenerator()
@@ -39,12 +64,199 @@ def run_test_suite(suite):
     report_generator.generate_html_report()
 
 
+def get_shard_units(suite, test_type):
+    """Split a generated suite into independent units: Case suites for E2E, Suites otherwise."""
+    if test_type == 'e2e':
+        return [(main_suite.name, case_suite.name) for main_suite in suite.suites for case_suite in main_suite.suites]
+    return [(sub_suite.name,) for sub_suite in suite.suites]
+
+
+def prune_suite(suite, units):
+    """Keep only the given shard units in a generated suite."""
+    units = set(units)
+    for sub_suite in list(suite.suites):
+        if (sub_suite.name,) in units:
+            continue
+        case_suites = [case_suite for case_suite in sub_suite.suites if (sub_suite.name, case_suite.name) in units]
+        if case_suites:
+            sub_suite.suites = case_suites
+        else:
+            suite.suites.remove(sub_suite)
+    return suite
+
+
+def find_unit(suite, unit):
+    for name in unit:
+        suite = next(sub_suite for sub_suite in suite.suites if sub_suite.name == name)
+    return suite
+
+
+def is_sanity_check_unit(unit_suite):
+    return any('sanity check' in [tag.lower() for tag in test.tags] for test in unit_suite.all_tests)
+
+
+def split_into_shards(unit_sizes, workers):
+    """Greedy balancing by test count; each shard keeps the original unit order."""
+    shards = [[] for _ in range(workers)]
+    loads = [0] * workers
+    for index, size in sorted(enumerate(unit_sizes), key=lambda item: item[1], reverse=True):
+        target = loads.index(min(loads))
+        shards[target].append(index)
+        loads[target] += size
+    return [sorted(shard) for shard in shards if shard]
+
+
+def reset_process_state():
+    """Worker processes are reused between shards, so drop what the previous shard left in process wide singletons."""
+    WebDriverSingleton.quit()
+    ScreenshotStore.reset()
+    SessionCheckpointStore.reset()
+    DBOperator.reset()
+
+
+def run_shard(test_type, units, worker_index, skip_on_sanity_check_failure=False):
+    """Run a subset of the generated suite in a worker process with its own outputs and saved fields."""
+    reset_process_state()
+    worker_id = f"worker_{worker_index}"
+    os.environ['TEST_WORKER_ID'] = worker_id
+    logger_instance.log_file_name = f"robot_testing_{worker_id}"
+    logger_instance.load_config()
+
+    shared_saved_fields = os.path.join(PROJECT_ROOT, 'configs', 'saved_fields.yaml')
+    worker_saved_fields = SavedFieldsManager().file_path
+    if os.path.exists(shared_saved_fields):
+        shutil.copyfile(shared_saved_fields, worker_saved_fields)
+
+    suite = UnifiedRobotCaseGenerator(test_type).generate_test_cases()
+    prune_suite(suite, units)
+
+    output_dir = os.path.join(PROJECT_ROOT, 'reports', 'workers', worker_id)
+    os.makedirs(output_dir, exist_ok=True)
+    output_xml = os.path.join(output_dir, 'output.xml')
+    variables = ['skip_on_sanity_check_failure:True'] if skip_on_sanity_check_failure else []
+
+    listener = ExitOnFailureListener()
+    suite.run(output=output_xml, listener=listener, variable=variables)
+    return output_xml, listener.failed_suite_path
+
+
+def merge_saved_fields(worker_indexes):
+    """Copy the fields each worker saved back into the shared saved fields file."""
+    shared_manager = SavedFieldsManager(os.path.join(PROJECT_ROOT, 'configs', 'saved_fields.yaml'))
+    initial_fields = shared_manager.load_saved_fields()
+    for worker_index in worker_indexes:
+        worker_file = os.path.join(PROJECT_ROOT, 'configs', f'saved_fields_worker_{worker_index}.yaml')
+        if not os.path.exists(worker_file):
+            continue
+        # Workers start from a copy of the shared file; only take over what they changed
+        worker_fields = SavedFieldsManager(worker_file).load_saved_fields()
+        changed_fields = {key: value for key, value in worker_fields.items()
+                          if key not in initial_fields or initial_fields[key] != value}
+        if changed_fields:
+            shared_manager.save_fields(changed_fields)
+        os.remove(worker_file)
+
+
+def merge_outputs(output_files, output_xml, units):
+    """Combine worker outputs into one output.xml, joining suites with the same name, in the original unit order."""
+    result = ExecutionResult(output_files[0])
+    for output_file in output_files[1:]:
+        _merge_suite(result.suite, ExecutionResult(output_file).suite)
+    _sort_suites(result.suite, units)
+    result.save(output_xml)
+    return result.return_code
+
+
+def _merge_suite(target, source):
+    for source_suite in source.suites:
+        target_suite = next((suite for suite in target.suites if suite.name == source_suite.name), None)
+        if target_suite is None:
+            target.suites.append(source_suite)
+        else:
+            _merge_suite(target_suite, source_suite)
+    target.tests.extend(source.tests)
+    if source.start_time and (target.start_time is None or source.start_time < target.start_time):
+        target.start_time = source.start_time
+    if source.end_time and (target.end_time is None or source.end_time > target.end_time):
+        target.end_time = source.end_time
+
+
+def _sort_suites(suite, units, path=()):
+    positions = {}
+    for index, unit in enumerate(units):
+        if len(unit) > len(path) and unit[:len(path)] == path:
+            positions.setdefault(unit[len(path)], index)
+    suite.suites.sort(key=lambda sub_suite: positions.get(sub_suite.name, len(units)))
+    for sub_suite in suite.suites:
+        _sort_suites(sub_suite, units, path + (sub_suite.name,))
+
+
+def run_test_suite_in_workers(test_type, suite, workers):
+    units = get_shard_units(suite, test_type)
+    if not units:
+        return run_test_suite(suite)
+    unit_suites = [find_unit(suite, unit) for unit in units]
+
+    # Sanity check units run first. As in a serial run, a failed check skips only the units that come after
+    # the failed one in the suite; the units before it run in the other shards as usual.
+    sanity_indexes = [index for index, unit_suite in enumerate(unit_suites) if is_sanity_check_unit(unit_suite)]
+    sanity_units = [units[index] for index in sanity_indexes]
+    other_indexes = [index for index in range(len(units)) if index not in sanity_indexes]
+
+    output_files = []
+    failed_shards = []
+    first_skipped_index = len(units)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if sanity_units:
+            try:
+                output_file, failed_suite_path = executor.submit(run_shard, test_type, sanity_units, 0).result()
+                output_files.append(output_file)
+                if failed_suite_path is not None:
+                    first_skipped_index = next((index for index in sanity_indexes
+                                                if failed_suite_path[:len(units[index])] == units[index]), sanity_indexes[0])
+            except Exception as e:
+                # Without a sanity check result the units after the first check are skipped like after a failed one
+                first_skipped_index = sanity_indexes[0]
+                failed_shards.append((0, sanity_units, e))
+
+        run_indexes = [index for index in other_indexes if index < first_skipped_index]
+        skip_indexes = [index for index in other_indexes if index > first_skipped_index]
+        shards = [([units[run_indexes[i]] for i in shard], False)
+                  for shard in split_into_shards([unit_suites[index].test_count for index in run_indexes], workers)]
+        shards += [([units[skip_indexes[i]] for i in shard], True)
+                   for shard in split_into_shards([unit_suites[index].test_count for index in skip_indexes], workers)]
+
+        futures = {
+            worker_index: executor.submit(run_shard, test_type, shard_units, worker_index, skip)
+            for worker_index, (shard_units, skip) in enumerate(shards, 1)
+        }
+        for worker_index, future in futures.items():
+            try:
+                output_files.append(future.result()[0])
+            except Exception as e:
+                failed_shards.append((worker_index, shards[worker_index - 1][0], e))
+
+    merge_saved_fields([0] + list(futures))
+
+    for worker_index, shard_units, error in failed_shards:
+        shard_names = ', '.join('.'.join(unit) for unit in shard_units)
+        logging.error(f"Worker {worker_index} failed, its results are missing from the report: {shard_names}: {error}")
+
+    return_code = 1 if failed_shards else 0
+    if output_files:
+        output_xml = os.path.join(PROJECT_ROOT, 'reports', 'output.xml')
+        return_code = max(return_code, merge_outputs(output_files, output_xml, units))
+        write_reports(output_xml)
+    return return_code
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Run API, Web UI, or E2E tests.')
     parser.add_argument('--api', action='store_true', help='Run API tests')
     parser.add_argument('--web', action='store_true', help='Run Web UI tests')
     parser.add_argument('--e2e', action='store_true', help='Run E2E tests')
     parser.add_argument('--performance', action='store_true', help='Run performance tests')
+    parser.add_argument('--workers', type=int, default=1, help='Number of worker processes for API, Web UI and E2E tests')
     args = parser.parse_args()
 
     test_type_map = {
@@ -53,12 +265,18 @@ if __name__ == "__main__":
         'e2e': args.e2e,
         'performance': args.performance
     }
-    
+
     # 获取第一个为True的测试类型，如果都为False则使用默认值
     default_test_type = 'e2e'
     test_type = next((t for t, enabled in test_type_map.items() if enabled), default_test_type)
-    
+
     robot_case_generator = UnifiedRobotCaseGenerator(test_type)
     suite_to_run = robot_case_generator.generate_test_cases()
-    run_test_suite(suite_to_run)
-
+    if args.workers > 1 and test_type != 'performance':
+        # Failed tests and failed workers are surfaced to CI through the exit code
+        sys.exit(min(run_test_suite_in_workers(test_type, suite_to_run, args.workers), 250))
+    else:
+        return_code = run_test_suite(suite_to_run)
+        # Performance regressions fail their tests; surface them to CI through the exit code
+        if test_type == 'performance':
+            sys.exit(min(return_code, 250))